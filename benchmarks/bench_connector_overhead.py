@@ -0,0 +1,46 @@
+"""Connector overhead benchmark
+
+Measures the time per call spent inside `HoppieConnector` on top of the bare
+HTTP round-trip, using a local stand-in server. Run from the repository root:
+
+    python benchmarks/bench_connector_overhead.py [--calls N] [--rounds N] [--items N]
+"""
+from hoppie_connector import HoppieConnector
+from standin import StandInServer
+import argparse
+import requests
+import time
+
+def _per_call(func, calls: int, rounds: int) -> float:
+    func()
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--calls', type=int, default=500, help='Number of calls per round')
+    arg_parser.add_argument('--rounds', type=int, default=5, help='Number of rounds (best is reported)')
+    arg_parser.add_argument('--items', type=int, default=3, help='Number of messages per poll response')
+    args = arg_parser.parse_args()
+
+    with StandInServer(backlog=args.items, refill=True, online=['DLH001']) as server:
+        url = server.get_url()
+        session = requests.Session()
+        cnx = HoppieConnector('STATION', 'logon', url)
+        params = {'logon': 'logon', 'from': 'STATION', 'to': 'SERVER', 'type': 'poll'}
+
+        transport = _per_call(lambda: session.get(url, params=params).content, args.calls, args.rounds)
+        poll = _per_call(cnx.poll, args.calls, args.rounds)
+        ping = _per_call(lambda: cnx.ping('DLH001'), args.calls, args.rounds)
+
+    print(f"HTTP round-trip only      {transport * 1e6:9.1f} us/call")
+    print(f"HoppieConnector.poll()    {poll * 1e6:9.1f} us/call  (overhead {(poll - transport) * 1e6:8.1f} us)")
+    print(f"HoppieConnector.ping()    {ping * 1e6:9.1f} us/call  (overhead {(ping - transport) * 1e6:8.1f} us)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Inbox deduplication benchmark
+
+Measures message comparison cost and the time to deduplicate an inbox that
+was merged from overlapping peek backlogs, by list membership and, for
+hashable messages, by a dict. Run from the repository root:
+
+    python benchmarks/bench_dedup.py [--messages N] [--list-messages N]
+"""
+from hoppie_connector.Messages import HoppieMessageParser
+import argparse
+import time
+import timeit
+
+_TEMPLATES: list[tuple[str, str]] = [
+    ('ads-c', 'REPORT DLH{i:04d} 011820 50.{i:05d} -8.{i:05d} 35000 270 450 280/45 -54 LVL'),
+    ('telex', 'request predep clearance {i}'),
+    ('cpdlc', '/data2/{i}/3/WU/CLIMB TO @FL350@'),
+    ('progress', 'EDDF/KJFK OUT/1200 OFF/1215 ETA/2005'),
+]
+
+def _make_inbox(parser: HoppieMessageParser, count: int) -> list:
+    # Every message was received twice, e.g. by two overlapping peeks
+    unique = count // 2
+    items = [{'from': f"DLH{i % 10000:04d}", 'type': _TEMPLATES[i % len(_TEMPLATES)][0], 'packet': _TEMPLATES[i % len(_TEMPLATES)][1].format(i=i)} for i in range(unique)]
+    return [parser.parse(d) for d in items] + [parser.parse(d) for d in items]
+
+def _dedup_list(inbox: list) -> list:
+    result = []
+    for m in inbox:
+        if m not in result:
+            result.append(m)
+    return result
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--messages', type=int, default=200_000, help='Inbox size for dict deduplication')
+    arg_parser.add_argument('--list-messages', type=int, default=2_000, help='Inbox size for list deduplication (quadratic)')
+    args = arg_parser.parse_args()
+
+    parser = HoppieMessageParser('STATION')
+    for type_name, template in _TEMPLATES:
+        a, b = (parser.parse({'from': 'DLH0001', 'type': type_name, 'packet': template.format(i=1)}) for _ in range(2))
+        best = min(timeit.repeat(lambda a=a, b=b: a == b, number=10000, repeat=5)) / 10000
+        print(f"compare {type_name:<10} {best * 1e6:8.2f} us")
+
+    inbox = _make_inbox(parser, args.list_messages)
+    start = time.perf_counter()
+    unique = _dedup_list(inbox)
+    print(f"list dedup    {len(inbox):>9,} messages  {(time.perf_counter() - start) * 1e3:10.1f} ms  ({len(unique):,} unique)")
+
+    inbox = _make_inbox(parser, args.messages)
+    try:
+        start = time.perf_counter()
+        unique = list(dict.fromkeys(inbox))
+        print(f"dict dedup    {len(inbox):>9,} messages  {(time.perf_counter() - start) * 1e3:10.1f} ms  ({len(unique):,} unique)")
+    except TypeError:
+        print('dict dedup    not supported, messages are unhashable')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""CPDLC dialogue correlation benchmark
+
+Keeps a steady number of open dialogues at an ATC position. Each poll
+cycle opens new dialogues, matches the received responses to open ones and
+expires overdue ones. The `DialogueManager` is compared to a linear scan
+over a list of open requests. Run from the repository root:
+
+    python benchmarks/bench_dialogue.py [--open N] [--batch N] [--cycles N]
+"""
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import DialogueManager
+from hoppie_connector.Messages import CpdlcMessage
+from datetime import timedelta
+import argparse
+import random
+import time
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def _make_cycles(open_count: int, batch: int, cycles: int) -> list[tuple[list[CpdlcMessage], list[CpdlcMessage]]]:
+    # Each cycle answers randomly chosen open requests, so that `open_count`
+    # dialogues stay open and responses arrive in no particular order
+    rng = random.Random(1)
+    pending: list[CpdlcMessage] = []
+    result = []
+    for c in range(cycles):
+        sent = [CpdlcMessage('EDDF', f"DLH{i % 2000:03d}", i, CpdlcResponseRequirement.WILCO_UNABLE, 'CLIMB TO @FL350@')
+                for i in range(c * batch, (c + 1) * batch)]
+        answered = []
+        if len(pending) >= open_count:
+            for _ in range(batch):
+                i = rng.randrange(len(pending))
+                pending[i], pending[-1] = pending[-1], pending[i]
+                answered.append(pending.pop())
+        pending.extend(sent)
+        received = [CpdlcMessage(r.get_to_name(), 'EDDF', 1, CpdlcResponseRequirement.NOT_REQUIRED, 'WILCO', mrn=r.get_min()) for r in answered]
+        result.append((sent, received))
+    return result
+
+def _run_manager(cycles: list, timeout: float) -> float:
+    clock = _Clock()
+    manager = DialogueManager(timeout=timedelta(seconds=timeout), clock=clock)
+    start = time.perf_counter()
+    for sent, received in cycles:
+        clock.now += 1
+        for m in sent:
+            manager.add_outbound(m)
+        for m in received:
+            manager.add_inbound(m)
+        manager.expire()
+    return time.perf_counter() - start
+
+def _run_list(cycles: list, timeout: float) -> float:
+    now = 0.0
+    open_requests: list[tuple[float, CpdlcMessage]] = []
+    start = time.perf_counter()
+    for sent, received in cycles:
+        now += 1
+        for m in sent:
+            open_requests.append((now + timeout, m))
+        for m in received:
+            for i, (_, r) in enumerate(open_requests):
+                if (r.get_to_name() == m.get_from_name()) and (r.get_min() == m.get_mrn()):
+                    del open_requests[i]
+                    break
+        open_requests = [(d, r) for d, r in open_requests if d > now]
+    return time.perf_counter() - start
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--open', type=int, default=500, help='Number of open dialogues')
+    arg_parser.add_argument('--batch', type=int, default=50, help='Number of requests and responses per poll cycle')
+    arg_parser.add_argument('--cycles', type=int, default=2000, help='Number of poll cycles')
+    args = arg_parser.parse_args()
+
+    cycles = _make_cycles(args.open, args.batch, args.cycles)
+    # Unanswered dialogues expire after a long time, so that the number of
+    # open ones is set by the answer rate
+    timeout = float(args.cycles)
+    for name, run in [('DialogueManager', _run_manager), ('list scan', _run_list)]:
+        elapsed = min(run(cycles, timeout) for _ in range(3))
+        print(f"{name:<16} {elapsed / len(cycles) * 1e6:9.1f} us/cycle  ({args.open} open, {args.batch} requests + {args.batch} responses per cycle)")
+
+if __name__ == '__main__':
+    main()
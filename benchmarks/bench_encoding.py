@@ -0,0 +1,67 @@
+"""ADS-C report encoding benchmark
+
+Compares encoding periodic reports of a simulated fleet one message object
+at a time against `encode_report_packets`. Run from the repository root:
+
+    python benchmarks/bench_encoding.py [--aircraft N] [--repeat N]
+"""
+from hoppie_connector.ADSC import AdscData, BasicGroup, EarthRefGroup, FlightIdentGroup, MeteoGroup
+from hoppie_connector.Messages import AdscPeriodicReportMessage
+from hoppie_connector.Tracks import AdscTrackStore, encode_report_packets
+from datetime import datetime, UTC
+import argparse
+import numpy as np
+import timeit
+
+def _bench(name: str, func, items: int, repeat: int) -> None:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"{name:<34} {items / best:>12,.0f} reports/s  ({best * 1e3:8.2f} ms per fleet update)")
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--aircraft', type=int, default=500, help='Number of simulated aircraft')
+    arg_parser.add_argument('--repeat', type=int, default=20, help='Number of timed repetitions (best is reported)')
+    args = arg_parser.parse_args()
+
+    # Simulator state, one array element per aircraft
+    rng = np.random.default_rng(1)
+    n = args.aircraft
+    fleet = {
+        'acft_ident': np.array([f"DLH{i:04d}" for i in range(n)]),
+        'timestamp': np.full(n, datetime(2024, 4, 3, 12, 0, tzinfo=UTC).timestamp()),
+        'latitude': rng.uniform(-90.0, 90.0, n),
+        'longitude': rng.uniform(-180.0, 180.0, n),
+        'altitude': rng.uniform(0.0, 41000.0, n).round(-2),
+        'true_track': rng.uniform(0.0, 360.0, n),
+        'ground_speed': rng.uniform(120.0, 520.0, n),
+        'wind_direction': rng.uniform(0.0, 360.0, n),
+        'wind_speed': rng.uniform(0.0, 150.0, n),
+        'temperature': rng.uniform(-60.0, 30.0, n),
+        'vertical_rate': rng.integers(1, 4, n),
+    }
+    rates = {code: rate for rate, code in AdscTrackStore.VERTICAL_RATE_CODES.items()}
+    rows = [dict(zip(fleet, values)) for values in zip(*(column.tolist() for column in fleet.values()))]
+
+    def _per_object() -> list[str]:
+        return [AdscPeriodicReportMessage(r['acft_ident'], 'OPS', AdscData(
+            BasicGroup(datetime.fromtimestamp(r['timestamp'], UTC), (r['latitude'], r['longitude']), r['altitude']),
+            FlightIdentGroup(r['acft_ident']),
+            EarthRefGroup(r['true_track'], r['ground_speed'], rates[r['vertical_rate']]),
+            MeteoGroup((r['wind_direction'], r['wind_speed']), r['temperature'])
+        )).get_packet_content() for r in rows]
+    def _batch() -> list[str]:
+        return encode_report_packets(**fleet)
+
+    assert _per_object() == _batch()
+    messages = [AdscPeriodicReportMessage.from_packet(r['acft_ident'], 'OPS', p) for r, p in zip(rows, _batch())]
+    def _packet_only() -> list[str]:
+        # Bypass the cached packet content, which would only time a lookup
+        return [m._encode_packet() for m in messages]
+
+    print(f"{n:,} aircraft")
+    _bench('per object (build + encode)', _per_object, n, args.repeat)
+    _bench('per object (encode only)', _packet_only, n, args.repeat)
+    _bench('encode_report_packets', _batch, n, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Response journal benchmark
+
+Journals poll responses fetched from a local stand-in server, then compares
+reprocessing the journal (read, parse responses and messages) against
+fetching and parsing the same responses over HTTP again. Run from the
+repository root:
+
+    python benchmarks/bench_journal.py [--responses N] [--backlog N] [--latency MS]
+"""
+from hoppie_connector.API import HoppieAPI
+from hoppie_connector.Journal import JournalReader, ResponseJournal
+from hoppie_connector.Messages import HoppieMessage, HoppieMessageParser, PollMessage
+from hoppie_connector.Responses import HoppieResponseParserFactory
+from standin import StandInProcess
+import argparse
+import os
+import tempfile
+import time
+
+def _parse(factory: HoppieResponseParserFactory, parser: HoppieMessageParser, request_type: HoppieMessage.MessageType, body: str) -> int:
+    response = factory.create_parser(request_type).parse(body)
+    return sum(1 for d in response.get_data() if parser.parse(d) is not None)
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--responses', type=int, default=500, help='Number of journaled poll responses')
+    arg_parser.add_argument('--backlog', type=int, default=50, help='Number of messages per poll response')
+    arg_parser.add_argument('--latency', type=float, default=0.0, help='Added server processing delay per request in milliseconds')
+    args = arg_parser.parse_args()
+
+    factory = HoppieResponseParserFactory()
+    parser = HoppieMessageParser('STATION')
+    with tempfile.TemporaryDirectory() as tmp, StandInProcess(latency=args.latency / 1e3, backlog=args.backlog, refill=True) as server:
+        # Warm up the server and connection before the timed runs
+        with HoppieAPI('logon', server.get_url()) as api:
+            for _ in range(args.responses // 10):
+                api.fetch(PollMessage('STATION'))
+
+        for name, fsync in [('no journal', None), ('journal', False), ('journal, fsync', True)]:
+            journal = ResponseJournal(os.path.join(tmp, name), fsync=fsync) if fsync is not None else None
+            with HoppieAPI('logon', server.get_url(), journal=journal) as api:
+                start = time.perf_counter()
+                for _ in range(args.responses):
+                    body, _ = api.fetch(PollMessage('STATION'))
+                    _parse(factory, parser, HoppieMessage.MessageType.POLL, body)
+                elapsed = time.perf_counter() - start
+            if journal is not None:
+                journal.close()
+            print(f"fetch + parse, {name:<16} {args.responses / elapsed:>9,.0f} responses/s")
+
+        reader = JournalReader(os.path.join(tmp, 'journal'))
+        size = sum(os.path.getsize(p) for p in reader.get_segments())
+        start = time.perf_counter()
+        count = sum(1 for _ in reader)
+        elapsed = time.perf_counter() - start
+        print(f"journal read                    {count / elapsed:>9,.0f} responses/s  ({size / elapsed / 2**20:,.0f} MiB/s)")
+
+        start = time.perf_counter()
+        messages = sum(_parse(factory, parser, r.get_request_type(), r.get_body()) for r in reader)
+        elapsed = time.perf_counter() - start
+        print(f"journal read + parse            {count / elapsed:>9,.0f} responses/s  ({messages / elapsed:,.0f} messages/s)")
+
+if __name__ == '__main__':
+    main()
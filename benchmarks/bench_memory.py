@@ -0,0 +1,48 @@
+"""Inbox memory benchmark
+
+Parses a large number of received messages and reports the memory held by
+the resulting message objects, per message type and in total. Run from the
+repository root:
+
+    python benchmarks/bench_memory.py [--messages N]
+"""
+from hoppie_connector.Messages import HoppieMessageParser
+import argparse
+import gc
+import time
+import tracemalloc
+
+_TEMPLATES: list[tuple[str, str]] = [
+    ('ads-c', 'REPORT DLH{i:04d} 011820 50.{i:05d} -8.{i:05d} 35000 270 450 280/45 -54 LVL'),
+    ('telex', 'REQUEST PREDEP CLEARANCE {i}'),
+    ('cpdlc', '/data2/{i}/3/WU/CLIMB TO @FL350@'),
+    ('progress', 'EDDF/KJFK OUT/1200 OFF/1215 ETA/2005'),
+]
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--messages', type=int, default=1_000_000, help='Total number of held messages, split evenly between message types')
+    args = arg_parser.parse_args()
+
+    parser = HoppieMessageParser('STATION')
+    count = args.messages // len(_TEMPLATES)
+    inbox = []
+    total = 0
+
+    gc.collect()
+    tracemalloc.start()
+    print(f"{count * len(_TEMPLATES):,} messages")
+    for type_name, template in _TEMPLATES:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        # Packets are formatted per message, as if sliced from a response body
+        inbox.extend(parser.parse({'from': f"DLH{i % 10000:04d}", 'type': type_name, 'packet': template.format(i=i % 100000)}) for i in range(count))
+        elapsed = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0] - before
+        total += held
+        print(f"{type_name:<10} {held / count:8.1f} bytes/message  ({count / elapsed:,.0f} messages/s parsed)")
+    tracemalloc.stop()
+    print(f"{'total':<10} {total / 2**20:8.1f} MiB")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""CPDLC MIN allocation benchmark
+
+Measures `MinAllocator` allocate/release throughput from several threads,
+then sends uplinks concurrently through `HoppieConnector.send_cpdlc()` to a
+local stand-in server with MINs allocated by the connector and checks that
+no open dialogue shares a MIN. Run from the repository root:
+
+    python benchmarks/bench_min.py [--threads N] [--peers N] [--ops N]
+"""
+from hoppie_connector import HoppieConnector
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import DialogueManager, MinAllocator
+from concurrent.futures import ThreadPoolExecutor
+from standin import StandInProcess
+import argparse
+import time
+
+def _bench_allocator(threads: int, peers: list[str], ops: int) -> float:
+    allocator = MinAllocator()
+    def _worker(i: int) -> None:
+        peer = peers[i % len(peers)]
+        for _ in range(ops):
+            allocator.release(peer, allocator.allocate(peer))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(_worker, range(threads)))
+    return threads * ops / (time.perf_counter() - start)
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--threads', type=int, default=16, help='Number of sending threads')
+    arg_parser.add_argument('--peers', type=int, default=8, help='Number of recipient stations')
+    arg_parser.add_argument('--ops', type=int, default=20000, help='Number of allocations per thread')
+    args = arg_parser.parse_args()
+
+    peers = [f"DLH{i:03d}" for i in range(args.peers)]
+    for threads in (1, args.threads):
+        rate = max(_bench_allocator(threads, peers, args.ops) for _ in range(3))
+        print(f"allocate + release, {threads:>2} threads  {rate:>11,.0f} ops/s")
+
+    # One uplink per MIN and peer, all left open awaiting WILCO/UNABLE
+    uplinks = [p for p in peers for _ in range(MinAllocator.LIMIT)]
+    dialogues = DialogueManager()
+    with StandInProcess() as server, HoppieConnector('EDDF', 'logon', server.get_url(), pool_maxsize=args.threads, dialogue_manager=dialogues) as cnx:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            list(executor.map(lambda p: cnx.send_cpdlc(p, None, CpdlcResponseRequirement.WILCO_UNABLE, 'CLIMB TO @FL350@'), uplinks))
+        elapsed = time.perf_counter() - start
+    open_keys = {(d.get_peer(), d.get_min()) for d in dialogues.get_awaiting_response()}
+    print(f"send_cpdlc, {args.threads:>2} threads          {len(uplinks) / elapsed:>11,.0f} msg/s  "
+          f"({len(uplinks)} sent, {len(open_keys)} distinct open dialogues)")
+
+if __name__ == '__main__':
+    main()
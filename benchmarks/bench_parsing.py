@@ -0,0 +1,78 @@
+"""Parse-path throughput benchmark
+
+Measures the throughput of the response and message parsers on synthetic
+poll/peek bodies. Run from the repository root:
+
+    python benchmarks/bench_parsing.py [--items N] [--repeat N] [--compare REF]
+
+With `--compare`, the same measurements are also taken with the package
+sources of git revision REF, e.g. the commit before the parser patterns were
+precompiled (`--compare 3851031~1`).
+"""
+from hoppie_connector.Messages import HoppieMessage, HoppieMessageParser
+from hoppie_connector.Responses import HoppieResponseParserFactory
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+
+_PACKETS: list[tuple[str, str]] = [
+    ('telex', 'REQUEST PREDEP CLEARANCE'),
+    ('cpdlc', '/data2/12/3/WU/CLIMB TO @FL350@'),
+    ('progress', 'EDDF/KJFK OUT/1200 OFF/1215 ETA/2005'),
+    ('ads-c', 'REPORT DLH123 011820 50.12345 -8.12345 35000 270 450 280/45 -54 LVL'),
+    ('ads-c', 'REQUEST PERIODIC 300'),
+]
+
+def _make_body(items: int, with_id: bool) -> str:
+    parts = []
+    for i in range(items):
+        type_name, packet = _PACKETS[i % len(_PACKETS)]
+        prefix = f"{i + 1} " if with_id else ''
+        parts.append(f"{{{prefix}DLH{i % 1000:03d} {type_name} {{{packet}}}}}")
+    return 'ok ' + ' '.join(parts)
+
+def _bench(name: str, func, items: int, repeat: int) -> None:
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print(f"{name:<28} {items / best:>12,.0f} items/s  ({best * 1e3:8.2f} ms per body)")
+
+def _run_revision(ref: str, items: int, repeat: int) -> None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    archive = subprocess.run(['git', 'archive', '--format=tar', ref, 'src'], cwd=root, capture_output=True, check=True).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp, filter='data')
+        env = {**os.environ, 'PYTHONPATH': os.path.join(tmp, 'src')}
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--items', str(items), '--repeat', str(repeat)], env=env, check=True)
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--items', type=int, default=5000, help='Number of data items per response body')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Number of timed repetitions (best is reported)')
+    arg_parser.add_argument('--compare', metavar='REF', help='Git revision whose package sources are benchmarked as baseline')
+    args = arg_parser.parse_args()
+
+    if args.compare is not None:
+        print(f"baseline ({args.compare}):")
+        _run_revision(args.compare, args.items, args.repeat)
+        print('current:')
+
+    factory = HoppieResponseParserFactory()
+    poll_body = _make_body(args.items, with_id=False)
+    peek_body = _make_body(args.items, with_id=True)
+    poll_parser = factory.create_parser(HoppieMessage.MessageType.POLL)
+    peek_parser = factory.create_parser(HoppieMessage.MessageType.PEEK)
+    msg_parser = HoppieMessageParser('STATION')
+    poll_data = poll_parser.parse(poll_body).get_data()
+
+    _bench('poll response parse', lambda: poll_parser.parse(poll_body), args.items, args.repeat)
+    _bench('peek response parse', lambda: peek_parser.parse(peek_body), args.items, args.repeat)
+    _bench('message parse', lambda: [msg_parser.parse(d) for d in poll_data], args.items, args.repeat)
+    _bench('poll end-to-end', lambda: [msg_parser.parse(d) for d in poll_parser.parse(poll_body).get_data()], args.items, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Parser replay benchmark
+
+Replays recorded poll/peek responses through the response and message
+parsers and reports parsing throughput, failure counts and the mean parse
+time per message type. Without `--journal`, a journal of synthetic traffic is
+first recorded from a local stand-in server. Run from the repository root:
+
+    python benchmarks/bench_replay.py [--journal DIR] [--speed X] [--responses N] [--backlog N] [--repeat N]
+"""
+from hoppie_connector.API import HoppieAPI
+from hoppie_connector.Journal import JournalReader, JournalRecord, ResponseJournal
+from hoppie_connector.Messages import PollMessage
+from hoppie_connector.Replay import ReplayEngine, ReplayStats
+from standin import StandInProcess
+import argparse
+import tempfile
+
+def _record(directory: str, responses: int, backlog: int) -> None:
+    with StandInProcess(backlog=backlog, refill=True) as server, ResponseJournal(directory) as journal, HoppieAPI('logon', server.get_url(), journal=journal) as api:
+        for _ in range(responses):
+            api.fetch(PollMessage('STATION'))
+
+def _print(stats: ReplayStats) -> None:
+    print(f"responses {stats.get_responses():,}  messages {stats.get_messages():,}"
+          f"  failures: responses {stats.get_response_failures()}, malformed items {stats.get_malformed_items()}, messages {stats.get_message_failures()}")
+    print(f"parse time {stats.get_parse_time().total_seconds() * 1e3:,.1f} ms (responses {stats.get_response_time().total_seconds() * 1e3:,.1f} ms)"
+          f"  elapsed {stats.get_elapsed().total_seconds() * 1e3:,.1f} ms  {stats.get_messages_per_second():,.0f} messages/s")
+    counts, failures = stats.get_type_counts(), stats.get_type_failures()
+    for type_name, total in sorted(stats.get_type_timings().items()):
+        n = counts.get(type_name, 0) + failures.get(type_name, 0)
+        print(f"    {type_name:<10} {n:>9,} messages  {total.total_seconds() / n * 1e6:8.2f} us/message")
+
+def _replay(records: list[JournalRecord], speed: float | None, repeat: int) -> None:
+    engine = ReplayEngine(speed=speed)
+    engine.run(records)
+    best = max((engine.run(records) for _ in range(repeat)), key=ReplayStats.get_messages_per_second)
+    _print(best)
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--journal', type=str, default=None, help='Journal directory with recorded traffic')
+    arg_parser.add_argument('--speed', type=float, default=None, help='Replay at the original cadence scaled by this factor (default: full speed)')
+    arg_parser.add_argument('--responses', type=int, default=500, help='Number of recorded poll responses without --journal')
+    arg_parser.add_argument('--backlog', type=int, default=50, help='Number of messages per recorded poll response without --journal')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Number of replay runs, the fastest one is reported')
+    args = arg_parser.parse_args()
+
+    if args.journal is not None:
+        records = list(JournalReader(args.journal))
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            _record(tmp, args.responses, args.backlog)
+            records = list(JournalReader(tmp))
+    _replay(records, args.speed, args.repeat)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Message store benchmark
+
+Stores a week of synthetic traffic in a `MessageStore`, one transaction per
+poll cycle, and compares typical ops queries against a linear scan over a
+list of (reception time, message) tuples. Run from the repository root:
+
+    python benchmarks/bench_store.py [--messages N] [--stations N] [--batch N] [--repeat N]
+"""
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Messages import CpdlcMessage, HoppieMessage, TelexMessage
+from hoppie_connector.Store import MessageStore
+from datetime import datetime, timedelta, UTC
+import argparse
+import os
+import tempfile
+import time
+
+_END = datetime(2024, 4, 10, tzinfo=UTC)
+
+def _make_traffic(count: int, stations: int) -> list[tuple[datetime, HoppieMessage]]:
+    start = _END - timedelta(days=7)
+    step = timedelta(days=7) / count
+    traffic = []
+    for i in range(count):
+        sender = f"DLH{i % stations:03d}"
+        if i % 2:
+            message = CpdlcMessage(sender, 'EDDF', i % 64, CpdlcResponseRequirement.YES, 'REQUEST CLIMB TO @FL350@')
+        else:
+            message = TelexMessage(sender, 'OPS', 'REQUEST PREDEP CLEARANCE')
+        traffic.append((start + i * step, message))
+    return traffic
+
+def _best(repeat: int, call) -> tuple[float, int]:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = call()
+        times.append(time.perf_counter() - t0)
+    return min(times), len(result)
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--messages', type=int, default=500_000, help='Number of messages stored')
+    arg_parser.add_argument('--stations', type=int, default=2000, help='Number of sending stations')
+    arg_parser.add_argument('--batch', type=int, default=50, help='Number of messages per poll cycle')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Number of timed runs per query, the fastest one is reported')
+    args = arg_parser.parse_args()
+
+    traffic = _make_traffic(args.messages, args.stations)
+    with tempfile.TemporaryDirectory() as tmp, MessageStore(os.path.join(tmp, 'messages.db')) as store:
+        t0 = time.perf_counter()
+        for i in range(0, len(traffic), args.batch):
+            batch = traffic[i:i + args.batch]
+            store.add_messages([m for _, m in batch], received=batch[-1][0])
+        elapsed = time.perf_counter() - t0
+        print(f"insert, {args.batch} per transaction   {args.messages / elapsed:>11,.0f} messages/s")
+
+        since = _END - timedelta(hours=1)
+        cpdlc = HoppieMessage.MessageType.CPDLC
+        queries = [
+            ('CPDLC from DLH123, last hour',
+             lambda: store.query(from_name='DLH123', msg_type=cpdlc, since=since),
+             lambda: [m for t, m in traffic if (t >= since) and (m.get_from_name() == 'DLH123') and (m.get_msg_type() == cpdlc)]),
+            ('all from DLH123',
+             lambda: store.query(from_name='DLH123'),
+             lambda: [m for _, m in traffic if m.get_from_name() == 'DLH123']),
+            ('MIN 3 from DLH123',
+             lambda: store.query(from_name='DLH123', min=3),
+             lambda: [m for _, m in traffic if (m.get_from_name() == 'DLH123') and (m.get_msg_type() == cpdlc) and (m.get_min() == 3)]),
+            ('MIN 5, any station',
+             lambda: store.query(min=5),
+             lambda: [m for _, m in traffic if (m.get_msg_type() == cpdlc) and (m.get_min() == 5)]),
+        ]
+        for name, indexed, scan in queries:
+            t_store, n_store = _best(args.repeat, indexed)
+            t_scan, n_scan = _best(args.repeat, scan)
+            assert n_store == n_scan
+            print(f"{name:<30} {n_store:>6} msgs  store {t_store * 1e3:9.3f} ms  list scan {t_scan * 1e3:9.3f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""ADS-C track storage benchmark
+
+Compares memory use and query time of keeping parsed
+`AdscPeriodicReportMessage` objects against `AdscTrackStore`, and decoding
+report packets one by one against `decode_report_packets`. Run from the
+repository root:
+
+    python benchmarks/bench_tracks.py [--aircraft N] [--reports N]
+"""
+from hoppie_connector.Messages import AdscPeriodicReportMessage
+from hoppie_connector.Tracks import AdscTrackStore, decode_report_packets
+from datetime import datetime, timedelta, UTC
+import argparse
+import gc
+import time
+import tracemalloc
+
+def _packet(callsign: str, t: datetime, i: int) -> str:
+    return f"REPORT {callsign} {t:%d%H%M} {50 + i * 1e-3:.5f} {8 + i * 1e-3:.5f} 35000 270 450 280/45 -54 LVL"
+
+def _measure(build) -> tuple[object, int, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size, elapsed
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--aircraft', type=int, default=200, help='Number of aircraft')
+    arg_parser.add_argument('--reports', type=int, default=360, help='Number of reports per aircraft (one per minute)')
+    args = arg_parser.parse_args()
+
+    reference = datetime(2024, 4, 3, 12, 0, tzinfo=UTC)
+    times = [reference - timedelta(minutes=args.reports - i) for i in range(args.reports)]
+    callsigns = [f"DLH{a:03d}" for a in range(args.aircraft)]
+    messages = [AdscPeriodicReportMessage.from_packet(c, 'OPS', _packet(c, t, i)) for c in callsigns for i, t in enumerate(times)]
+    total = len(messages)
+
+    packets = [m.get_packet_content() for m in messages]
+    objects, object_size, object_time = _measure(lambda: [AdscPeriodicReportMessage.from_packet(m.get_from_name(), 'OPS', p) for m, p in zip(messages, packets)])
+    _, batch_size, batch_time = _measure(lambda: decode_report_packets(packets, reference))
+
+    def _build_store() -> AdscTrackStore:
+        store = AdscTrackStore()
+        for m in messages:
+            store.add_message(m, reference)
+        return store
+    store, store_size, store_time = _measure(_build_store)
+
+    window = (times[-min(60, args.reports)], times[-1])
+    by_station = {}
+    for m in objects:
+        by_station.setdefault(m.get_from_name(), []).append(m)
+
+    start = time.perf_counter()
+    for c in callsigns:
+        [m for m in by_station[c] if window[0].day == m.get_data().basic.timestamp.day and (window[0].hour, window[0].minute) <= (m.get_data().basic.timestamp.hour, m.get_data().basic.timestamp.minute)]
+    scan_time = (time.perf_counter() - start) / args.aircraft
+
+    start = time.perf_counter()
+    for c in callsigns:
+        store.get_range(c, *window)
+    range_time = (time.perf_counter() - start) / args.aircraft
+
+    print(f"{total:,} reports ({args.aircraft} aircraft x {args.reports})")
+    print(f"message objects     {object_size / total:8.1f} bytes/report")
+    print(f"decode_report_packets {batch_size / total:6.1f} bytes/report  ({total / batch_time:,.0f} reports/s decoded, {total / object_time:,.0f} reports/s with from_packet)")
+    print(f"AdscTrackStore      {store_size / total:8.1f} bytes/report  ({total / store_time:,.0f} reports/s appended)")
+    print(f"last-hour query     {scan_time * 1e6:8.1f} us/aircraft (list scan)  {range_time * 1e6:8.1f} us/aircraft (store)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Connector workflow benchmark suite
+
+Runs typical `HoppieConnector` workflows against a local stand-in server in
+a child process and reports throughput, p50/p99 call latency and the peak
+client-side memory allocated during a workflow. Run from the repository root:
+
+    python benchmarks/bench_workflows.py [--calls N] [--backlog N] [--stations N] [--latency MS] [--workers N] [--only NAME] [--stages]
+
+With `--stages`, the mean time per call spent in each processing stage
+(see `hoppie_connector.Timing`) is printed below each workflow.
+"""
+from hoppie_connector import HoppieConnector
+from hoppie_connector.ADSC import AdscData, BasicGroup, FlightIdentGroup
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Messages import TelexMessage
+from hoppie_connector.Timing import TimingRecorder
+from datetime import datetime, UTC
+from standin import StandInProcess
+from collections.abc import Callable
+import argparse
+import gc
+import time
+import tracemalloc
+
+class _Workflow(object):
+    def __init__(self, name: str, unit: str, call: Callable[[], int]):
+        self.name = name
+        self.unit = unit
+        self.call = call
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def _run(workflow: _Workflow, calls: int, recorder: TimingRecorder | None) -> None:
+    workflow.call()
+    gc.collect()
+    if recorder is not None:
+        recorder.reset()
+
+    latencies = []
+    units = 0
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        units += workflow.call()
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    totals = recorder.get_totals() if recorder is not None else {}
+
+    # Memory is measured in a separate pass, tracing slows down allocation
+    gc.collect()
+    tracemalloc.start()
+    workflow.call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{workflow.name:<28} {units / elapsed:>11,.0f} {workflow.unit + '/s':<10}"
+          f" p50 {_percentile(latencies, 50) * 1e3:8.2f} ms"
+          f"  p99 {_percentile(latencies, 99) * 1e3:8.2f} ms"
+          f"  peak {peak / 1024:9.1f} KiB")
+    if totals:
+        print('    ' + '  '.join(f"{stage} {totals[stage].total_seconds() / calls * 1e3:.3f} ms" for stage in totals))
+
+def _make_workflows(cnx: HoppieConnector, stations: list[str], workers: int) -> list[_Workflow]:
+    report = AdscData(basic=BasicGroup(datetime(1900, 1, 1, 12, 30, tzinfo=UTC), (50.12345, -8.12345), 35000), flight_ident=FlightIdentGroup('STATION'))
+    broadcast = [TelexMessage(cnx.get_station_name(), s, 'NOTAM EDDF RWY 07C CLSD') for s in stations]
+
+    def _poll() -> int:
+        return len(cnx.poll()[0])
+    def _peek() -> int:
+        return len(cnx.peek()[0])
+    def _iter_peek() -> int:
+        return sum(1 for _ in cnx.iter_peek()[0])
+    def _ping() -> int:
+        cnx.ping(stations[:24])
+        return 1
+    def _telex() -> int:
+        cnx.send_telex(stations[0], 'REQUEST PREDEP CLEARANCE')
+        return 1
+    def _cpdlc() -> int:
+        cnx.send_cpdlc(stations[0], 1, CpdlcResponseRequirement.WILCO_UNABLE, 'CLIMB TO @FL350@')
+        return 1
+    def _adsc() -> int:
+        cnx.send_adsc_periodic_report(stations[0], report)
+        return 1
+    def _broadcast() -> int:
+        cnx.send_many(broadcast, max_workers=workers)
+        return len(broadcast)
+
+    return [
+        _Workflow('poll (backlog)', 'msg', _poll),
+        _Workflow('peek (backlog)', 'msg', _peek),
+        _Workflow('iter_peek (backlog)', 'msg', _iter_peek),
+        _Workflow('ping (24 stations)', 'call', _ping),
+        _Workflow('send_telex', 'call', _telex),
+        _Workflow('send_cpdlc', 'call', _cpdlc),
+        _Workflow('send_adsc_periodic_report', 'call', _adsc),
+        _Workflow('send_many (broadcast)', 'msg', _broadcast),
+    ]
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--calls', type=int, default=200, help='Number of timed calls per workflow')
+    arg_parser.add_argument('--backlog', type=int, default=500, help='Number of messages returned by each poll/peek')
+    arg_parser.add_argument('--stations', type=int, default=200, help='Number of recipient stations in the broadcast workflow')
+    arg_parser.add_argument('--latency', type=float, default=0.0, help='Added server processing delay per request in milliseconds')
+    arg_parser.add_argument('--workers', type=int, default=10, help='Number of concurrent requests in the broadcast workflow')
+    arg_parser.add_argument('--only', type=str, default=None, help='Run only workflows whose name contains this string')
+    arg_parser.add_argument('--stages', action='store_true', help='Report mean time per processing stage')
+    args = arg_parser.parse_args()
+
+    stations = [f"DLH{i:03d}" for i in range(args.stations)]
+    with StandInProcess(latency=args.latency / 1e3, backlog=args.backlog, refill=True, online=stations) as server:
+        recorder = TimingRecorder() if args.stages else None
+        with HoppieConnector('STATION', 'logon', server.get_url(), pool_maxsize=args.workers, on_timing=recorder) as cnx:
+            print(f"backlog={args.backlog} stations={args.stations} latency={args.latency} ms calls={args.calls}")
+            for workflow in _make_workflows(cnx, stations, args.workers):
+                if (args.only is None) or (args.only in workflow.name):
+                    _run(workflow, args.calls, recorder)
+
+if __name__ == '__main__':
+    main()
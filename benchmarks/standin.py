@@ -0,0 +1,261 @@
+"""Local stand-in for the Hoppie ACARS `connect.html` endpoint
+
+Implements the request types used by the connector over HTTP/1.1 keep-alive
+connections, so that benchmarks can measure transport and connector cost
+without the public server:
+
+- `poll` returns and relays all pending messages of the sender and marks it
+  online,
+- `peek` returns the message history of the sender with message ids,
+- `ping` returns the requested stations which are currently online, or all
+  of them for `ALL-CALLSIGNS`,
+- `telex`, `progress`, `cpdlc` and `ads-c` store the packet for the recipient
+  station.
+
+The server can be run in-process (`StandInServer`), in a separate process
+(`StandInProcess`) to keep it out of the measured interpreter, or from the
+command line:
+
+    python benchmarks/standin.py [--port N] [--latency MS] [--backlog N] [--refill]
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from urllib.parse import parse_qs, urlparse
+import argparse
+import multiprocessing
+import threading
+import time
+
+_SYNTHETIC_PACKETS: list[tuple[str, str]] = [
+    ('telex', 'REQUEST PREDEP CLEARANCE'),
+    ('cpdlc', '/data2/12//WU/CLIMB TO @FL350@'),
+    ('progress', 'EDDF/KJFK OUT/1200 OFF/1215 ETA/2005'),
+    ('ads-c', 'REPORT DLH123 011820 50.12345 -8.12345 35000 270 450 280/45 -54 LVL'),
+]
+
+class _Station(object):
+    def __init__(self):
+        self.history: list[tuple[int, str, str, str]] = []
+        self.pending: list[tuple[int, str, str, str]] = []
+        self.backlog: list[tuple[int, str, str, str]] = []
+        self.last_seen: float | None = None
+
+class StandInState(object):
+    """StandInState([backlog[, refill[, logon[, online[, online_timeout]]]]])
+
+    Message store and online list of the stand-in server
+    """
+    def __init__(self, backlog: int = 0, refill: bool = False, logon: str | None = None, online: list[str] | None = None, online_timeout: float = 300.0):
+        """Create a new server state
+
+        Args:
+            backlog (int, optional): Number of synthetic messages queued for each station on first contact. Defaults to 0.
+            refill (bool, optional): Re-queue the synthetic backlog once it has been polled. Defaults to False.
+            logon (str | None, optional): Accepted logon code. Defaults to None (accept any).
+            online (list[str] | None, optional): Stations which are permanently online. Defaults to None.
+            online_timeout (float, optional): Seconds a station stays online after its last poll or send. Defaults to 300.
+        """
+        self._backlog = backlog
+        self._refill = refill
+        self._logon = logon
+        self._permanent = set(online or [])
+        self._timeout = online_timeout
+        self._stations: dict[str, _Station] = {}
+        self._next_id = 1
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def _get_station(self, name: str) -> _Station:
+        station = self._stations.get(name)
+        if station is None:
+            station = self._stations[name] = _Station()
+            for i in range(self._backlog):
+                type_name, packet = _SYNTHETIC_PACKETS[i % len(_SYNTHETIC_PACKETS)]
+                self._store(station, f"DLH{i % 1000:03d}", type_name, packet)
+            station.backlog = list(station.history)
+        return station
+
+    def _store(self, station: _Station, sender: str, type_name: str, packet: str) -> None:
+        item = (self._next_id, sender, type_name, packet)
+        self._next_id += 1
+        station.history.append(item)
+        station.pending.append(item)
+
+    def _is_online(self, name: str, now: float) -> bool:
+        if name in self._permanent:
+            return True
+        station = self._stations.get(name)
+        return (station is not None) and (station.last_seen is not None) and (now - station.last_seen < self._timeout)
+
+    def get_request_count(self) -> int:
+        """Return number of handled requests
+        """
+        return self._requests
+
+    def handle(self, params: dict[str, str]) -> str:
+        """Handle a single API request
+
+        Args:
+            params (dict[str, str]): Request parameters (logon, from, to, type, packet)
+
+        Returns:
+            str: Response body
+        """
+        with self._lock:
+            self._requests += 1
+            if (self._logon is not None) and (params.get('logon') != self._logon):
+                return 'error {illegal logon code}'
+            sender, type_name = params.get('from'), params.get('type')
+            if not sender or not type_name:
+                return 'error {missing parameters}'
+            now = time.monotonic()
+            match type_name:
+                case 'poll':
+                    station = self._get_station(sender)
+                    station.last_seen = now
+                    items, station.pending = station.pending, (list(station.backlog) if self._refill else [])
+                    return 'ok ' + ' '.join(f"{{{s} {t} {{{p}}}}}" for _, s, t, p in items)
+                case 'peek':
+                    station = self._get_station(sender)
+                    return 'ok ' + ' '.join(f"{{{i} {s} {t} {{{p}}}}}" for i, s, t, p in station.history)
+                case 'ping':
+                    requested = params.get('packet', '').split()
+                    if requested == ['ALL-CALLSIGNS']:
+                        requested = sorted(self._permanent.union(self._stations))
+                    return 'ok {' + ' '.join(s for s in requested if self._is_online(s, now)) + '}'
+                case 'telex' | 'progress' | 'cpdlc' | 'ads-c':
+                    recipient = params.get('to')
+                    if not recipient:
+                        return 'error {missing recipient}'
+                    self._get_station(sender).last_seen = now
+                    self._store(self._get_station(recipient), sender, type_name, params.get('packet', ''))
+                    return 'ok'
+                case _:
+                    return 'error {unknown type}'
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def _respond(self, params: dict[str, str]) -> None:
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        body = self.server.state.handle(params).encode('ascii')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._respond({k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get('Content-Length', 0))
+        data = self.rfile.read(length).decode('ascii')
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        params.update({k: v[0] for k, v in parse_qs(data).items()})
+        self._respond(params)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+class StandInServer(object):
+    """StandInServer([port[, latency[, **kwargs]]])
+
+    Threaded local HTTP server running in the calling process
+
+    Note:
+        Remaining keyword arguments are passed to `StandInState`.
+    """
+    def __init__(self, port: int = 0, latency: float = 0.0, **kwargs):
+        """Create a new server
+
+        Args:
+            port (int, optional): Listening port. Defaults to 0 (pick a free port).
+            latency (float, optional): Added processing delay per request in seconds. Defaults to 0.
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._server.daemon_threads = True
+        self._server.latency = latency
+        self._server.state = StandInState(**kwargs)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def get_url(self) -> str:
+        """Return endpoint URL
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/acars/system/connect.html"
+
+    def get_state(self) -> StandInState:
+        """Return server state
+        """
+        return self._server.state
+
+    def serve_forever(self) -> None:
+        """Handle requests until interrupted
+        """
+        self._server.serve_forever()
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+def _serve(kwargs: dict, url_queue: multiprocessing.Queue) -> None:
+    with StandInServer(**kwargs) as server:
+        url_queue.put(server.get_url())
+        threading.Event().wait()
+
+class StandInProcess(object):
+    """StandInProcess([**kwargs])
+
+    Stand-in server running in a child process
+
+    Note:
+        Keeps server-side work out of the measured interpreter, so that
+        latency and memory figures only cover the client. Keyword arguments
+        are passed to `StandInServer`.
+    """
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._process = None
+        self._url = None
+
+    def get_url(self) -> str:
+        """Return endpoint URL
+        """
+        return self._url
+
+    def __enter__(self) -> Self:
+        url_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(self._kwargs, url_queue), daemon=True)
+        self._process.start()
+        self._url = url_queue.get(timeout=10)
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._process.terminate()
+        self._process.join()
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--port', type=int, default=8080, help='Listening port')
+    arg_parser.add_argument('--latency', type=float, default=0.0, help='Added processing delay per request in milliseconds')
+    arg_parser.add_argument('--backlog', type=int, default=0, help='Synthetic messages queued per station')
+    arg_parser.add_argument('--refill', action='store_true', help='Re-queue the synthetic backlog after each poll')
+    args = arg_parser.parse_args()
+
+    server = StandInServer(args.port, args.latency / 1e3, backlog=args.backlog, refill=args.refill)
+    print(f"Serving on {server.get_url()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
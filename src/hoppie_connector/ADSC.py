@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from enum import StrEnum
 from datetime import datetime
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BasicGroup:
     """BasicGroup(timestamp, position, altitude)
     
@@ -25,7 +25,10 @@ class BasicGroup:
             (value.timestamp.hour == self.timestamp.hour) and \
             (value.timestamp.minute == self.timestamp.minute)
 
-@dataclass
+    def __hash__(self) -> int:
+        return hash((self.altitude, self.position, self.timestamp.day, self.timestamp.hour, self.timestamp.minute))
+
+@dataclass(frozen=True, slots=True)
 class FlightIdentGroup:
     """FlightIdentGroup(acft_ident)
     
@@ -36,7 +39,7 @@ class FlightIdentGroup:
     """
     acft_ident: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EarthRefGroup:
     """EarthRefGroup(true_track, ground_speed [, vertical_rate])
 
@@ -52,11 +55,14 @@ class EarthRefGroup:
         LEVEL = 'LVL'
         DESCENT = 'DES'
 
+        def __repr__(self) -> str:
+            return f"EarthRefGroup.VerticalRate.{self.name}"
+
     true_track: float
     ground_speed: float
     vertical_rate: VerticalRate | None = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MeteoGroup:
     """MeteoGroup(wind, temperature)
     
@@ -69,7 +75,7 @@ class MeteoGroup:
     wind: tuple[float, float]
     temperature: float
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdscData:
     """AdscData(basic, flight_ident[, earth_ref[, meteo]])
     
@@ -1,24 +1,179 @@
+from .Journal import ResponseJournal
 from .Messages import HoppieMessage
-from .Responses import HoppieResponse, HoppieResponseParserFactory
+from .Responses import ErrorResponse, HoppieResponse, HoppieResponseParserFactory
+from .Resilience import CircuitBreaker, CircuitOpenError, HTTPStatusError, RetryPolicy, is_transient_error
+from .Timing import TimingEvent, TimingHook, TimingStage, timed
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
+from typing import Self
+import asyncio
 import requests
+import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+# Requests which may be repeated without side effects on the server
+_IDEMPOTENT_TYPES: frozenset[HoppieMessage.MessageType] = frozenset([HoppieMessage.MessageType.PEEK, HoppieMessage.MessageType.PING])
+
+def _encode_request(msg: HoppieMessage, on_timing: TimingHook | None) -> tuple[dict, dict | None]:
+    if not isinstance(msg, HoppieMessage):
+        raise ValueError('Invalid input message data type')
+
+    with timed(on_timing, TimingStage.ENCODE, msg):
+        params = msg.get_msg_params()
+        data = None
+        if msg.get_msg_type() == HoppieMessage.MessageType.TELEX:
+            data = {'packet': params.pop('packet')}
+        elif not params['packet']:
+            del params['packet']
+    return params, data
+
+def _decode_response(msg: HoppieMessage, body: bytes, on_timing: TimingHook | None, journal: ResponseJournal | None) -> str:
+    if journal is not None:
+        # Journal the body before decoding, so that invalid responses are kept as well
+        journal.append(msg.get_from_name(), msg.get_msg_type(), body.decode('ascii', errors='backslashreplace'))
+    with timed(on_timing, TimingStage.DECODE, msg):
+        return body.decode('ascii')
+
+def _record_cancelled(breaker: CircuitBreaker | None) -> None:
+    if breaker is not None:
+        breaker.record_cancelled()
+
+def _record_outcome(breaker: CircuitBreaker | None, error: Exception | None) -> None:
+    if breaker is not None:
+        if (error is not None) and is_transient_error(error):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+class SendResult(object):
+    """SendResult(message, response, delay[, error])
+
+    Outcome of a single message dispatched by `send_many()`
+    """
+    def __init__(self, message: HoppieMessage, response: HoppieResponse | None, delay: timedelta | None, error: Exception | None = None):
+        """Create a new result
+
+        Args:
+            message (HoppieMessage): Dispatched message
+            response (HoppieResponse | None): Response data, or None if the request failed
+            delay (timedelta | None): Response delay, or None if the request failed
+            error (Exception | None, optional): Failure reason. Defaults to None.
+        """
+        self._message = message
+        self._response = response
+        self._delay = delay
+        self._error = error
+
+    def get_message(self) -> HoppieMessage:
+        """Return dispatched message
+        """
+        return self._message
+
+    def get_response(self) -> HoppieResponse | None:
+        """Return response data, or None if the request failed
+        """
+        return self._response
+
+    def get_delay(self) -> timedelta | None:
+        """Return response delay, or None if the request failed
+        """
+        return self._delay
+
+    def get_error(self) -> Exception | None:
+        """Return failure reason, or None if the message was delivered
+        """
+        return self._error
+
+    def is_ok(self) -> bool:
+        """Check if the message was delivered and accepted by the server
+        """
+        return (self._error is None) and not isinstance(self._response, ErrorResponse)
+
+    def __repr__(self) -> str:
+        return f"SendResult(message={self._message!r}, response={self._response!r}, delay={self._delay!r}, error={self._error!r})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, SendResult) and (self._message == __value._message) and (self._response == __value._response) and (self._delay == __value._delay) and (self._error is __value._error)
 
 class HoppieAPI(object):
-    """HoppieAPI(logon[, url])
-    
+    """HoppieAPI(logon[, url[, pool_maxsize[, pool_block[, timeout[, on_timing[, retry_policy[, circuit_breaker[, journal]]]]]]]])
+
     Hoppie API connection
+
+    Note:
+        All requests are issued through a single HTTP session owning a pool of
+        keep-alive connections. Call `close()` or use the API object as a
+        context manager to release the pooled connections.
+
+        If `on_timing` is given, it receives a `TimingEvent` for each
+        processing stage of a call: `ENCODE`, `HTTP` (full request including
+        body transfer), `TTFB` (until response headers were parsed), `DECODE`
+        and `PARSE_RESPONSE`.
+
+        Failed requests are retried according to `retry_policy`. A
+        `circuit_breaker`, typically shared per endpoint through
+        `get_circuit_breaker()`, rejects requests with `CircuitOpenError`
+        while the server is considered down.
+
+        If a `journal` is given, every response body is appended to it before
+        it is decoded, returned or parsed. Non-ASCII bytes are journaled as
+        backslash escapes.
     """
     _DEFAULT_URL: str = 'https://www.hoppie.nl/acars/system/connect.html'
+    _DEFAULT_POOL_MAXSIZE: int = 10
 
-    def __init__(self, logon: str, url: str | None = None):
+    def __init__(self, logon: str, url: str | None = None, pool_maxsize: int = _DEFAULT_POOL_MAXSIZE, pool_block: bool = False, timeout: float | None = None, on_timing: TimingHook | None = None, retry_policy: RetryPolicy | None = None, circuit_breaker: CircuitBreaker | None = None, journal: ResponseJournal | None = None):
         """Prepare new API connection
 
         Args:
             logon (str): Logon code
             url (str, optional): API URL. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of pooled keep-alive connections. Defaults to 10.
+            pool_block (bool, optional): Block when no pooled connection is available instead of opening a new one. Defaults to False.
+            timeout (float | None, optional): Request timeout in seconds. Defaults to None.
+            on_timing (TimingHook | None, optional): Per-stage timing hook. Defaults to None.
+            retry_policy (RetryPolicy | None, optional): Retry policy for failed requests. Defaults to None (no retries).
+            circuit_breaker (CircuitBreaker | None, optional): Endpoint circuit breaker. Defaults to None.
+            journal (ResponseJournal | None, optional): Journal receiving all raw response bodies. Defaults to None.
         """
+        if pool_maxsize < 1:
+            raise ValueError('Pool size must be a positive integer')
         self._url = url if url is not None else self._DEFAULT_URL
         self._logon = logon
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._timeout = timeout
+        self._on_timing = on_timing
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._journal = journal
+        self._session: requests.Session | None = None
+        self._session_lock = threading.Lock()
+        self._parser_factory = HoppieResponseParserFactory()
+
+    def _create_session(self) -> requests.Session:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize, pool_block=self._pool_block)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def get_pool_maxsize(self) -> int:
+        """Return maximum number of pooled connections
+        """
+        return self._pool_maxsize
 
     def connect(self, msg: HoppieMessage) -> tuple[HoppieResponse, timedelta]:
         """Issue "connect" call to the API
@@ -29,29 +184,284 @@ class HoppieAPI(object):
         Returns:
             tuple[HoppieResponse, timedelta]: Response data (ASCII string encoding) and delay
         """
-        if not isinstance(msg, HoppieMessage):
+        content, delay = self.fetch(msg)
+        parser = self._parser_factory.create_parser(msg.get_msg_type())
+        with timed(self._on_timing, TimingStage.PARSE_RESPONSE, msg):
+            response = parser.parse(content)
+        return (response, delay)
+
+    def fetch(self, msg: HoppieMessage) -> tuple[str, timedelta]:
+        """Issue "connect" call to the API and return the unparsed response text
+
+        Args:
+            msg (HoppieMessage): Message data
+
+        Returns:
+            tuple[str, timedelta]: Response text (ASCII string encoding) and delay
+        """
+        params, data = _encode_request(msg, self._on_timing)
+
+        attempt = 1
+        while True:
+            try:
+                response = self._send(msg, params, data)
+                break
+            except (requests.RequestException, HTTPStatusError) as e:
+                if (self._retry_policy is None) or not self._retry_policy.should_retry(msg.get_msg_type(), attempt, e):
+                    raise
+                self._retry_policy.wait(attempt)
+                attempt += 1
+
+        content = _decode_response(msg, response.content, self._on_timing, self._journal)
+        return (content, response.elapsed)
+
+    def _send(self, msg: HoppieMessage, params: dict, data: dict | None) -> requests.Response:
+        breaker = self._circuit_breaker
+        if (breaker is not None) and not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self._url}")
+        try:
+            with timed(self._on_timing, TimingStage.HTTP, msg):
+                session = self._get_session()
+                if data is not None:
+                    response = session.post(self._url, params={'logon': self._logon, **params}, data=data, timeout=self._timeout)
+                else:
+                    response = session.get(self._url, params={'logon': self._logon, **params}, timeout=self._timeout)
+            if self._on_timing is not None:
+                self._on_timing(TimingEvent(TimingStage.TTFB, response.elapsed, msg))
+            if not response.ok:
+                raise HTTPStatusError(response.status_code, response.reason)
+        except (requests.RequestException, HTTPStatusError) as e:
+            _record_outcome(breaker, e)
+            raise
+        except BaseException:
+            # Cancelled, or failed without reaching a conclusion about the server
+            _record_cancelled(breaker)
+            raise
+        _record_outcome(breaker, None)
+        return response
+
+    def send_many(self, messages: Iterable[HoppieMessage], max_workers: int | None = None, ordered: bool = True) -> list[SendResult]:
+        """Issue "connect" calls for many messages concurrently
+
+        Note:
+            If `ordered` is set, messages are grouped by recipient station.
+            Groups are dispatched concurrently, while the messages of each
+            group are sent one after another in input order. Otherwise, all
+            messages are dispatched independently. A message failing with a
+            connection error or an invalid response does not abort the batch;
+            its exception is stored in the corresponding result.
+
+        Args:
+            messages (Iterable[HoppieMessage]): Messages to send
+            max_workers (int | None, optional): Maximum number of concurrent requests. Defaults to None (connection pool size).
+            ordered (bool, optional): Preserve message order per recipient station. Defaults to True.
+
+        Returns:
+            list[SendResult]: Result of each message, in input order
+        """
+        messages = list(messages)
+        if not all(isinstance(m, HoppieMessage) for m in messages):
             raise ValueError('Invalid input message data type')
+        if max_workers is None:
+            max_workers = self._pool_maxsize
+        elif max_workers < 1:
+            raise ValueError('Number of workers must be a positive integer')
 
-        match msg.get_msg_type():
-            case HoppieMessage.MessageType.TELEX:
-                params = msg.get_msg_params()
-                data = params.pop('packet')
-                response = requests.post(self._url, params={'logon': self._logon, **params}, data={'packet': data})
-            case _:
-                params = msg.get_msg_params()
-                if not params['packet']:
-                    del params['packet']
-                response = requests.get(self._url, params={'logon': self._logon, **params})
-        
-        if not response.ok: 
-            raise ConnectionError(f"Error {response.status_code}: {response.reason}")
-        
-        parser = HoppieResponseParserFactory().create_parser(msg.get_msg_type())
-        content = response.content.decode('ascii')
-        return (parser.parse(content), response.elapsed)
+        groups: dict[str | int, list[int]] = {}
+        for i, msg in enumerate(messages):
+            groups.setdefault(msg.get_to_name() if ordered else i, []).append(i)
+
+        results: dict[int, SendResult] = {}
+        def _send_group(indices: list[int]) -> None:
+            for i in indices:
+                try:
+                    response, delay = self.connect(messages[i])
+                except (requests.RequestException, ConnectionError, ValueError) as e:
+                    results[i] = SendResult(messages[i], None, None, e)
+                else:
+                    results[i] = SendResult(messages[i], response, delay)
+
+        if len(groups) <= 1:
+            for indices in groups.values():
+                _send_group(indices)
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(groups)), thread_name_prefix='hoppie-send') as executor:
+                for f in [executor.submit(_send_group, indices) for indices in groups.values()]:
+                    f.result()
+        return [results[i] for i in range(len(messages))]
+
+    def close(self) -> None:
+        """Close all pooled connections
+
+        Note:
+            The API object remains usable; a new connection pool is created
+            on the next request.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     def __repr__(self) -> str:
-        return f"HoppieAPI(logon={self._logon!r}, url={self._url!r})"
-    
+        return f"HoppieAPI(logon={self._logon!r}, url={self._url!r}, pool_maxsize={self._pool_maxsize!r}, pool_block={self._pool_block!r}, timeout={self._timeout!r}, retry_policy={self._retry_policy!r}, circuit_breaker={self._circuit_breaker!r}, journal={self._journal!r})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, HoppieAPI) and (self._logon == __value._logon) and (self._url == __value._url)
+
+
+class AsyncHoppieAPI(object):
+    """AsyncHoppieAPI(logon[, url[, pool_maxsize[, timeout[, on_timing[, retry_policy[, circuit_breaker[, journal[, session]]]]]]]])
+
+    Awaitable Hoppie API connection
+
+    Note:
+        Requests are issued natively on the event loop through an `aiohttp`
+        client session, without worker threads. Pass the same `session` to
+        all API objects (or connectors) of an application to share a single
+        connection pool between any number of stations; a shared session is
+        not closed by `close()`. Otherwise, a private session limited to
+        `pool_maxsize` connections is created on the first request. Requests
+        exceeding the connection limit wait for a free connection.
+
+        Only `peek` and `ping` are sent as GET requests. All other requests
+        are sent as POST, which `aiohttp` never resends by itself after a
+        dropped connection, so that e.g. a `poll` is not relayed twice.
+        Retries are left to the retry policy.
+
+        Timing, retries, circuit breaker and journal behave as in `HoppieAPI`.
+        Requires the `Async` extra (`pip install hoppie-connector[Async]`).
+    """
+    def __init__(self, logon: str, url: str | None = None, pool_maxsize: int = HoppieAPI._DEFAULT_POOL_MAXSIZE, timeout: float | None = None, on_timing: TimingHook | None = None, retry_policy: RetryPolicy | None = None, circuit_breaker: CircuitBreaker | None = None, journal: ResponseJournal | None = None, session: 'aiohttp.ClientSession | None' = None):
+        """Prepare new API connection
+
+        Args:
+            logon (str): Logon code
+            url (str, optional): API URL. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of connections of the private session. Defaults to 10.
+            timeout (float | None, optional): Connect and read timeout in seconds. Defaults to None.
+            on_timing (TimingHook | None, optional): Per-stage timing hook. Defaults to None.
+            retry_policy (RetryPolicy | None, optional): Retry policy for failed requests. Defaults to None (no retries).
+            circuit_breaker (CircuitBreaker | None, optional): Endpoint circuit breaker. Defaults to None.
+            journal (ResponseJournal | None, optional): Journal receiving all raw response bodies. Defaults to None.
+            session (aiohttp.ClientSession | None, optional): Shared HTTP session. Defaults to None (private session).
+        """
+        if aiohttp is None:  # pragma: no cover
+            raise ImportError('AsyncHoppieAPI requires aiohttp, install hoppie-connector[Async]')
+        if pool_maxsize < 1:
+            raise ValueError('Pool size must be a positive integer')
+        self._url = url if url is not None else HoppieAPI._DEFAULT_URL
+        self._logon = logon
+        self._pool_maxsize = pool_maxsize
+        self._timeout = timeout
+        self._on_timing = on_timing
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._journal = journal
+        self._session = session
+        self._owns_session = session is None
+        self._client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        self._parser_factory = HoppieResponseParserFactory()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._pool_maxsize))
+        return self._session
+
+    def get_pool_maxsize(self) -> int:
+        """Return maximum number of connections of the private session
+        """
+        return self._pool_maxsize
+
+    async def connect(self, msg: HoppieMessage) -> tuple[HoppieResponse, timedelta]:
+        """Issue "connect" call to the API
+
+        Args:
+            msg (HoppieMessage): Message data
+
+        Returns:
+            tuple[HoppieResponse, timedelta]: Response data (ASCII string encoding) and delay
+        """
+        content, delay = await self.fetch(msg)
+        parser = self._parser_factory.create_parser(msg.get_msg_type())
+        with timed(self._on_timing, TimingStage.PARSE_RESPONSE, msg):
+            response = parser.parse(content)
+        return (response, delay)
+
+    async def fetch(self, msg: HoppieMessage) -> tuple[str, timedelta]:
+        """Issue "connect" call to the API and return the unparsed response text
+
+        Args:
+            msg (HoppieMessage): Message data
+
+        Returns:
+            tuple[str, timedelta]: Response text (ASCII string encoding) and delay
+        """
+        params, data = _encode_request(msg, self._on_timing)
+
+        attempt = 1
+        while True:
+            try:
+                body, delay = await self._send(msg, params, data)
+                break
+            except (aiohttp.ClientError, TimeoutError, HTTPStatusError) as e:
+                if (self._retry_policy is None) or not self._retry_policy.should_retry(msg.get_msg_type(), attempt, e):
+                    raise
+                await asyncio.sleep(self._retry_policy.get_delay(attempt).total_seconds())
+                attempt += 1
+
+        content = _decode_response(msg, body, self._on_timing, self._journal)
+        return (content, delay)
+
+    async def _send(self, msg: HoppieMessage, params: dict, data: dict | None) -> tuple[bytes, timedelta]:
+        breaker = self._circuit_breaker
+        if (breaker is not None) and not breaker.allow_request():
+            raise CircuitOpenError(f"Circuit open for {self._url}")
+        method = 'GET' if (data is None) and (msg.get_msg_type() in _IDEMPOTENT_TYPES) else 'POST'
+        try:
+            with timed(self._on_timing, TimingStage.HTTP, msg):
+                start = time.perf_counter()
+                async with self._get_session().request(method, self._url, params={'logon': self._logon, **params}, data=data, timeout=self._client_timeout) as response:
+                    delay = timedelta(seconds=time.perf_counter() - start)
+                    body = await response.read()
+            if self._on_timing is not None:
+                self._on_timing(TimingEvent(TimingStage.TTFB, delay, msg))
+            if not response.ok:
+                raise HTTPStatusError(response.status, response.reason)
+        except (aiohttp.ClientError, TimeoutError, HTTPStatusError) as e:
+            _record_outcome(breaker, e)
+            raise
+        except BaseException:
+            # Cancelled, or failed without reaching a conclusion about the server
+            _record_cancelled(breaker)
+            raise
+        _record_outcome(breaker, None)
+        return body, delay
+
+    async def close(self) -> None:
+        """Close all pooled connections of the private session
+
+        Note:
+            A shared session is left open. The API object remains usable; a
+            new private session is created on the next request.
+        """
+        if self._owns_session and (self._session is not None):
+            session, self._session = self._session, None
+            await session.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f"AsyncHoppieAPI(logon={self._logon!r}, url={self._url!r}, pool_maxsize={self._pool_maxsize!r}, timeout={self._timeout!r}, retry_policy={self._retry_policy!r}, circuit_breaker={self._circuit_breaker!r}, journal={self._journal!r})"
+
     def __eq__(self, __value: object) -> bool:
-        return isinstance(__value, HoppieAPI) and (self._logon == __value._logon) and (self._url == __value._url)
\ No newline at end of file
+        return isinstance(__value, AsyncHoppieAPI) and (self._logon == __value._logon) and (self._url == __value._url)
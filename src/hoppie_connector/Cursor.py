@@ -0,0 +1,71 @@
+import os
+
+class PeekCursor(object):
+    """PeekCursor([path])
+
+    Watermark of the highest processed peek message id.
+
+    Note:
+        If a state file path is given, the watermark is loaded from it on
+        creation and written back by `save()`. The file is replaced atomically.
+    """
+    def __init__(self, path: str | os.PathLike | None = None):
+        """Create a new cursor
+
+        Args:
+            path (str | os.PathLike | None, optional): State file path. Defaults to None (in-memory only).
+        """
+        self._path = path
+        self._last_id = self._load()
+        self._dirty = False
+
+    def _load(self) -> int | None:
+        if self._path is None:
+            return None
+        try:
+            with open(self._path, 'r', encoding='ascii') as f:
+                content = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return int(content, base=10) if content else None
+
+    def get_last_id(self) -> int | None:
+        """Return highest processed message id, or None if no message has been processed
+        """
+        return self._last_id
+
+    def advance(self, id: int) -> None:
+        """Raise watermark to given message id
+
+        Note:
+            Ids lower than or equal to the current watermark are ignored.
+
+        Args:
+            id (int): Processed message id
+        """
+        if (self._last_id is None) or (id > self._last_id):
+            self._last_id = id
+            self._dirty = True
+
+    def reset(self, last_id: int | None = None) -> None:
+        """Set watermark to given value, discarding the current one
+
+        Args:
+            last_id (int | None, optional): New watermark. Defaults to None (process all messages).
+        """
+        self._last_id = last_id
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write watermark to the state file if it has changed
+        """
+        if (self._path is None) or not self._dirty:
+            return
+        tmp_path = f"{os.fspath(self._path)}.tmp"
+        with open(tmp_path, 'w', encoding='ascii') as f:
+            f.write('' if self._last_id is None else str(self._last_id))
+        os.replace(tmp_path, self._path)
+        self._dirty = False
+
+    def __repr__(self) -> str:
+        return f"PeekCursor(path={self._path!r})"
@@ -0,0 +1,368 @@
+from .CPDLC import CpdlcResponseRequirement
+from .Messages import CpdlcMessage
+from collections.abc import Callable
+from datetime import timedelta
+from typing import ClassVar
+import enum
+import heapq
+import itertools
+import threading
+import time
+
+class CpdlcDialogue(object):
+    """CpdlcDialogue(request, outbound)
+
+    CPDLC dialogue opened by a message requiring a response
+    """
+    __slots__ = ('_deadline', '_outbound', '_request', '_responses', '_state')
+
+    class State(enum.StrEnum):
+        OPEN = 'open'
+        CLOSED = 'closed'
+        EXPIRED = 'expired'
+
+        def __repr__(self) -> str:
+            return f"CpdlcDialogue.State.{self.name}"
+
+    # Responses closing a dialogue, per response requirement of the request.
+    # Any other response, e.g. STANDBY, leaves the dialogue open.
+    _CLOSING_RESPONSES: ClassVar[dict[CpdlcResponseRequirement, frozenset[str]]] = {
+        CpdlcResponseRequirement.WILCO_UNABLE: frozenset(['WILCO', 'UNABLE']),
+        CpdlcResponseRequirement.AFFIRM_NEGATIVE: frozenset(['AFFIRM', 'NEGATIVE']),
+        CpdlcResponseRequirement.ROGER: frozenset(['ROGER', 'UNABLE']),
+    }
+
+    def __init__(self, request: CpdlcMessage, outbound: bool):
+        """Create an open dialogue
+
+        Args:
+            request (CpdlcMessage): Message opening the dialogue
+            outbound (bool): True if the request was sent by own station, False if it was received
+        """
+        self._request = request
+        self._outbound = outbound
+        self._responses: list[CpdlcMessage] = []
+        self._state = CpdlcDialogue.State.OPEN
+        self._deadline = 0.0
+
+    @staticmethod
+    def requires_response(rr: CpdlcResponseRequirement) -> bool:
+        """Check if a response requirement opens a dialogue
+
+        Args:
+            rr (CpdlcResponseRequirement): Response requirement
+        """
+        return (rr in CpdlcDialogue._CLOSING_RESPONSES) or (rr == CpdlcResponseRequirement.YES)
+
+    def get_request(self) -> CpdlcMessage:
+        """Return message opening the dialogue
+        """
+        return self._request
+
+    def get_peer(self) -> str:
+        """Return station name of the other party
+        """
+        return self._request.get_to_name() if self._outbound else self._request.get_from_name()
+
+    def get_min(self) -> int:
+        """Return Message Identification Number (MIN) of the request
+        """
+        return self._request.get_min()
+
+    def get_rr(self) -> CpdlcResponseRequirement:
+        """Return Response Requirement of the request
+        """
+        return self._request.get_rr()
+
+    def is_outbound(self) -> bool:
+        """Check if the request was sent by own station
+        """
+        return self._outbound
+
+    def get_responses(self) -> list[CpdlcMessage]:
+        """Return responses referencing the request, in order of arrival
+        """
+        return list(self._responses)
+
+    def get_state(self) -> State:
+        """Return dialogue state
+        """
+        return self._state
+
+    def is_open(self) -> bool:
+        """Check if the dialogue still awaits a closing response
+        """
+        return self._state == CpdlcDialogue.State.OPEN
+
+    def _add_response(self, response: CpdlcMessage) -> None:
+        self._responses.append(response)
+        closing = self._CLOSING_RESPONSES.get(self._request.get_rr())
+        word = response.get_message().split(' ', 1)[0]
+        if closing is None:
+            # Any response except STANDBY answers a request requiring a response
+            closed = word != 'STANDBY'
+        else:
+            closed = word in closing
+        if closed:
+            self._state = CpdlcDialogue.State.CLOSED
+
+    def __repr__(self) -> str:
+        return f"CpdlcDialogue(request={self._request!r}, outbound={self._outbound!r})"
+
+class DialogueManager(object):
+    """DialogueManager([timeout[, clock]])
+
+    Correlation of CPDLC requests and responses
+
+    Note:
+        Sent and received messages requiring a response (WILCO/UNABLE,
+        AFFIRM/NEGATIVE, ROGER or any response) open a dialogue, indexed by
+        peer station and MIN. A message with an MRN is matched to the
+        dialogue opened by the peer's or own message with that MIN in
+        constant time. WILCO, UNABLE, AFFIRM, NEGATIVE and ROGER close the
+        corresponding dialogues; other responses such as STANDBY are recorded
+        and leave the dialogue open.
+
+        Dialogues without a closing response expire `timeout` after they were
+        opened. Deadlines are kept in a heap, so `expire()` only visits
+        expired entries. An open dialogue is also expired if the same MIN is
+        reused before it was closed.
+
+        The manager may be shared between threads.
+    """
+    TIMEOUT: timedelta = timedelta(minutes=5)
+
+    def __init__(self, timeout: timedelta = TIMEOUT, clock: Callable[[], float] = time.monotonic):
+        """Create a new dialogue manager
+
+        Args:
+            timeout (timedelta, optional): Time after which an open dialogue expires. Defaults to 5 min.
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to `time.monotonic`.
+        """
+        if timeout <= timedelta(0):
+            raise ValueError('Invalid timeout')
+        self._timeout = timeout.total_seconds()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Open dialogues by (peer, MIN), separately for sent and received requests
+        self._outbound: dict[tuple[str, int], CpdlcDialogue] = {}
+        self._inbound: dict[tuple[str, int], CpdlcDialogue] = {}
+        self._deadlines: list[tuple[float, int, CpdlcDialogue]] = []
+        self._sequence = itertools.count()
+
+    def _index(self, outbound: bool) -> dict[tuple[str, int], CpdlcDialogue]:
+        return self._outbound if outbound else self._inbound
+
+    def _add(self, message: CpdlcMessage, outbound: bool) -> CpdlcDialogue | None:
+        peer = message.get_to_name() if outbound else message.get_from_name()
+        matched = None
+        if message.get_mrn() is not None:
+            # A sent message answers a received request and vice versa
+            responded = self._index(not outbound)
+            key = (peer, message.get_mrn())
+            matched = responded.get(key)
+            if matched is not None:
+                matched._add_response(message)
+                if not matched.is_open():
+                    del responded[key]
+
+        if not CpdlcDialogue.requires_response(message.get_rr()):
+            return matched
+        index = self._index(outbound)
+        key = (peer, message.get_min())
+        previous = index.get(key)
+        if previous is not None:
+            previous._state = CpdlcDialogue.State.EXPIRED
+        dialogue = index[key] = CpdlcDialogue(message, outbound)
+        dialogue._deadline = self._clock() + self._timeout
+        heapq.heappush(self._deadlines, (dialogue._deadline, next(self._sequence), dialogue))
+        return matched if matched is not None else dialogue
+
+    def add_outbound(self, message: CpdlcMessage) -> CpdlcDialogue | None:
+        """Register a sent message
+
+        Args:
+            message (CpdlcMessage): Sent message
+
+        Returns:
+            CpdlcDialogue | None: Dialogue answered by the message if its MRN matches, otherwise the dialogue opened by it, if any
+        """
+        with self._lock:
+            return self._add(message, True)
+
+    def add_inbound(self, message: CpdlcMessage) -> CpdlcDialogue | None:
+        """Register a received message
+
+        Args:
+            message (CpdlcMessage): Received message
+
+        Returns:
+            CpdlcDialogue | None: Dialogue answered by the message if its MRN matches, otherwise the dialogue opened by it, if any
+        """
+        with self._lock:
+            return self._add(message, False)
+
+    def get_dialogue(self, peer: str, min: int, outbound: bool) -> CpdlcDialogue | None:
+        """Return open dialogue of a request
+
+        Args:
+            peer (str): Station name of the other party
+            min (int): MIN of the request
+            outbound (bool): True for a sent request, False for a received one
+
+        Returns:
+            CpdlcDialogue | None: Open dialogue, or None if unknown, closed or past its timeout
+        """
+        with self._lock:
+            dialogue = self._index(outbound).get((peer, min))
+            if (dialogue is not None) and (dialogue._deadline <= self._clock()):
+                # Timed out, but not yet removed by `expire()`
+                return None
+            return dialogue
+
+    def get_awaiting_response(self, rr: CpdlcResponseRequirement | None = None) -> list[CpdlcDialogue]:
+        """Return open dialogues of sent requests, awaiting a response from the peer
+
+        Args:
+            rr (CpdlcResponseRequirement | None, optional): Only return dialogues with this response requirement. Defaults to None (all).
+
+        Returns:
+            list[CpdlcDialogue]: Open dialogues, in order of opening
+        """
+        with self._lock:
+            return [d for d in self._outbound.values() if (rr is None) or (d.get_rr() == rr)]
+
+    def get_awaiting_reply(self, rr: CpdlcResponseRequirement | None = None) -> list[CpdlcDialogue]:
+        """Return open dialogues of received requests, awaiting a response from own station
+
+        Args:
+            rr (CpdlcResponseRequirement | None, optional): Only return dialogues with this response requirement. Defaults to None (all).
+
+        Returns:
+            list[CpdlcDialogue]: Open dialogues, in order of opening
+        """
+        with self._lock:
+            return [d for d in self._inbound.values() if (rr is None) or (d.get_rr() == rr)]
+
+    def _discard_stale(self) -> None:
+        while self._deadlines and not self._deadlines[0][2].is_open():
+            heapq.heappop(self._deadlines)
+
+    def get_next_expiry(self) -> timedelta | None:
+        """Return time until the next open dialogue expires, or None if no dialogue is open
+        """
+        with self._lock:
+            self._discard_stale()
+            if not self._deadlines:
+                return None
+            return timedelta(seconds=max(0.0, self._deadlines[0][0] - self._clock()))
+
+    def expire(self) -> list[CpdlcDialogue]:
+        """Expire open dialogues whose timeout has elapsed
+
+        Returns:
+            list[CpdlcDialogue]: Newly expired dialogues, in order of expiry
+        """
+        now = self._clock()
+        result = []
+        with self._lock:
+            while True:
+                self._discard_stale()
+                if not self._deadlines or self._deadlines[0][0] > now:
+                    return result
+                _, _, dialogue = heapq.heappop(self._deadlines)
+                dialogue._state = CpdlcDialogue.State.EXPIRED
+                del self._index(dialogue.is_outbound())[(dialogue.get_peer(), dialogue.get_min())]
+                result.append(dialogue)
+
+    def __len__(self) -> int:
+        return len(self._outbound) + len(self._inbound)
+
+    def __repr__(self) -> str:
+        return f"DialogueManager(timeout={timedelta(seconds=self._timeout)!r})"
+
+class MinAllocator(object):
+    """MinAllocator([limit[, dialogues]])
+
+    Per-peer allocator of CPDLC Message Identification Numbers (MIN)
+
+    Note:
+        MINs are allocated per peer station in ascending order, wrapping
+        around to 0 after `limit - 1`. A MIN is skipped while it is reserved
+        by an unfinished `allocate()`/`release()` pair, or while `dialogues`
+        holds an open dialogue of a sent request with that MIN, so that it is
+        only reused once the dialogue was closed or has timed out. Sent and
+        received CPDLC messages must be registered with `dialogues`, which is
+        a private dialogue manager unless given; the connectors do so
+        automatically.
+
+        Allocation takes a single lock for a few dictionary operations and
+        never blocks on I/O, so one allocator can be shared by many threads
+        and coroutines.
+    """
+    LIMIT: int = 64
+
+    def __init__(self, limit: int = LIMIT, dialogues: DialogueManager | None = None):
+        """Create a new allocator
+
+        Args:
+            limit (int, optional): Number of distinct MINs per peer. Defaults to 64 (six-bit FANS MIN).
+            dialogues (DialogueManager | None, optional): Dialogues whose MINs must not be reused while open. Defaults to None (private dialogue manager).
+        """
+        if limit < 1:
+            raise ValueError('Limit must be a positive integer')
+        self._limit = limit
+        self._owns_dialogues = dialogues is None
+        self._dialogues = dialogues if dialogues is not None else DialogueManager()
+        self._lock = threading.Lock()
+        self._next: dict[str, int] = {}
+        self._reserved: set[tuple[str, int]] = set()
+
+    def _is_free(self, peer: str, min: int) -> bool:
+        if (peer, min) in self._reserved:
+            return False
+        return self._dialogues.get_dialogue(peer, min, outbound=True) is None
+
+    def allocate(self, peer: str) -> int:
+        """Allocate and reserve the next free MIN for a peer
+
+        Note:
+            Call `release()` once the message was sent and, if applicable,
+            registered with the dialogue manager.
+
+        Args:
+            peer (str): Recipient station name
+
+        Returns:
+            int: Reserved MIN
+        """
+        if self._owns_dialogues:
+            # Nobody else expires the private dialogue manager
+            self._dialogues.expire()
+        with self._lock:
+            start = self._next.get(peer, 0)
+            for i in range(self._limit):
+                min = (start + i) % self._limit
+                if self._is_free(peer, min):
+                    self._next[peer] = (min + 1) % self._limit
+                    self._reserved.add((peer, min))
+                    return min
+        raise RuntimeError(f"No free MIN for station {peer}")
+
+    def release(self, peer: str, min: int) -> None:
+        """Release reservation of an allocated MIN
+
+        Args:
+            peer (str): Recipient station name
+            min (int): Allocated MIN
+        """
+        with self._lock:
+            self._reserved.discard((peer, min))
+
+    def get_dialogues(self) -> DialogueManager:
+        """Return dialogue manager consulted before reusing a MIN
+        """
+        return self._dialogues
+
+    def __repr__(self) -> str:
+        return f"MinAllocator(limit={self._limit!r})"
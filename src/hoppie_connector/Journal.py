@@ -0,0 +1,231 @@
+from .Messages import HoppieMessage
+from collections.abc import Callable, Iterator
+from datetime import datetime, UTC
+from typing import Self
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+
+class JournalRecord(object):
+    """JournalRecord(timestamp, station, request_type, body)
+
+    Raw API response stored in a journal
+    """
+    def __init__(self, timestamp: datetime, station: str, request_type: HoppieMessage.MessageType, body: str):
+        """Create a new record
+
+        Args:
+            timestamp (datetime): Reception time
+            station (str): Requesting station name
+            request_type (HoppieMessage.MessageType): Request message type
+            body (str): Raw response body
+        """
+        self._timestamp = timestamp
+        self._station = station
+        self._request_type = request_type
+        self._body = body
+
+    def get_timestamp(self) -> datetime:
+        """Return reception time
+        """
+        return self._timestamp
+
+    def get_station(self) -> str:
+        """Return requesting station name
+        """
+        return self._station
+
+    def get_request_type(self) -> HoppieMessage.MessageType:
+        """Return request message type
+        """
+        return self._request_type
+
+    def get_body(self) -> str:
+        """Return raw response body
+        """
+        return self._body
+
+    def __repr__(self) -> str:
+        return f"JournalRecord(timestamp={self._timestamp!r}, station={self._station!r}, request_type={self._request_type!r}, body={self._body!r})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, JournalRecord) and (self._timestamp == __value._timestamp) and (self._station == __value._station) and (self._request_type == __value._request_type) and (self._body == __value._body)
+
+# Segment: magic, then records of <length> <CRC-32> <data>, where data is
+# <timestamp> <station length> <type length> <station> <type> <body>
+_SEGMENT_MAGIC: bytes = b'HOPPIEJ1'
+_SEGMENT_PATTERN: re.Pattern = re.compile(r'^journal-(\d{8})\.seg$')
+_RECORD_PREFIX: struct.Struct = struct.Struct('<II')
+_RECORD_HEADER: struct.Struct = struct.Struct('<dBB')
+
+def _get_segments(directory: str) -> list[tuple[int, str]]:
+    if not os.path.isdir(directory):
+        return []
+    segments = [(int(m.group(1)), os.path.join(directory, name)) for name in os.listdir(directory) if (m := _SEGMENT_PATTERN.match(name))]
+    return sorted(segments)
+
+class ResponseJournal(object):
+    """ResponseJournal(directory[, segment_size[, fsync[, clock]]])
+
+    Append-only journal of raw API responses
+
+    Note:
+        Records are appended to numbered segment files in `directory`, with
+        a length prefix and checksum each. A new segment is started once the
+        current one exceeds `segment_size`. Every journal object starts a
+        new segment, so that a segment torn by a crash is never appended to.
+        Several journals, also of different processes, may share a
+        directory; each creates its own segments, which are read in order of
+        creation.
+
+        Each record is written with a single write call and flushed before
+        `append()` returns, which protects against crashes of the process.
+        Enable `fsync` to also survive power loss, at the cost of a disk sync
+        per response.
+    """
+    _DEFAULT_SEGMENT_SIZE: int = 64 * 2**20
+
+    def __init__(self, directory: str | os.PathLike, segment_size: int = _DEFAULT_SEGMENT_SIZE, fsync: bool = False, clock: Callable[[], float] = time.time):
+        """Open a journal for appending
+
+        Args:
+            directory (str | os.PathLike): Segment directory, created if missing
+            segment_size (int, optional): Size in bytes after which a new segment is started. Defaults to 64 MiB.
+            fsync (bool, optional): Sync each record to disk. Defaults to False.
+            clock (Callable[[], float], optional): Wall clock in POSIX seconds. Defaults to `time.time`.
+        """
+        if segment_size < 1:
+            raise ValueError('Segment size must be a positive integer')
+        self._directory = os.fspath(directory)
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._file = None
+        os.makedirs(self._directory, exist_ok=True)
+        segments = _get_segments(self._directory)
+        self._next_index = segments[-1][0] + 1 if segments else 0
+
+    def _open_segment(self) -> None:
+        while True:
+            path = os.path.join(self._directory, f"journal-{self._next_index:08d}.seg")
+            try:
+                # Kept open across appends until the segment is full or the journal is closed
+                self._file = open(path, 'xb')  # noqa: SIM115
+            except FileExistsError:
+                # Segment created by another journal in the same directory
+                self._next_index = max([self._next_index] + [i for i, _ in _get_segments(self._directory)]) + 1
+                continue
+            self._next_index += 1
+            self._file.write(_SEGMENT_MAGIC)
+            return
+
+    def append(self, station: str, request_type: HoppieMessage.MessageType, body: str, timestamp: datetime | None = None) -> None:
+        """Append a response to the journal
+
+        Args:
+            station (str): Requesting station name
+            request_type (HoppieMessage.MessageType): Request message type
+            body (str): Raw response body (ASCII)
+            timestamp (datetime | None, optional): Reception time. Defaults to None (now).
+        """
+        station_data = station.encode('ascii')
+        type_data = request_type.value.encode('ascii')
+        data = _RECORD_HEADER.pack(timestamp.timestamp() if timestamp is not None else self._clock(), len(station_data), len(type_data)) + \
+            station_data + type_data + body.encode('ascii')
+        record = _RECORD_PREFIX.pack(len(data), zlib.crc32(data)) + data
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(record)
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            if self._file.tell() >= self._segment_size:
+                self._file.close()
+                self._file = None
+
+    def close(self) -> None:
+        """Close the current segment
+
+        Note:
+            The journal remains usable; the next append starts a new segment.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ResponseJournal(directory={self._directory!r}, segment_size={self._segment_size!r}, fsync={self._fsync!r})"
+
+def _read_segment(path: str) -> Iterator[JournalRecord]:
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < len(_SEGMENT_MAGIC):
+            # Segment torn right after creation
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:len(_SEGMENT_MAGIC)] != _SEGMENT_MAGIC:
+                raise ValueError(f"Invalid journal segment {path}")
+            offset = len(_SEGMENT_MAGIC)
+            while offset + _RECORD_PREFIX.size <= size:
+                length, crc = _RECORD_PREFIX.unpack_from(mm, offset)
+                start = offset + _RECORD_PREFIX.size
+                end = start + length
+                if (end > size) or (length < _RECORD_HEADER.size):
+                    break
+                data = mm[start:end]
+                if zlib.crc32(data) != crc:
+                    break
+                timestamp, station_length, type_length = _RECORD_HEADER.unpack_from(data)
+                station_end = _RECORD_HEADER.size + station_length
+                type_end = station_end + type_length
+                yield JournalRecord(
+                    datetime.fromtimestamp(timestamp, UTC),
+                    data[_RECORD_HEADER.size:station_end].decode('ascii'),
+                    HoppieMessage.MessageType(data[station_end:type_end].decode('ascii')),
+                    data[type_end:].decode('ascii')
+                )
+                offset = end
+
+class JournalReader(object):
+    """JournalReader(directory)
+
+    Sequential reader of a response journal
+
+    Note:
+        Segments are memory-mapped and decoded one record at a time, so that
+        whole files are never loaded into memory. Reading a segment stops at
+        the first incomplete or corrupt record, as left behind by a crash
+        during an append; following segments are still read.
+    """
+    def __init__(self, directory: str | os.PathLike):
+        """Create a new reader
+
+        Args:
+            directory (str | os.PathLike): Segment directory
+        """
+        self._directory = os.fspath(directory)
+
+    def get_segments(self) -> list[str]:
+        """Return paths of all segments, in append order
+        """
+        return [path for _, path in _get_segments(self._directory)]
+
+    def __iter__(self) -> Iterator[JournalRecord]:
+        for path in self.get_segments():
+            yield from _read_segment(path)
+
+    def __repr__(self) -> str:
+        return f"JournalReader(directory={self._directory!r})"
@@ -2,7 +2,8 @@ from .ADSC import AdscData, BasicGroup, FlightIdentGroup, EarthRefGroup, MeteoGr
 from .CPDLC import CpdlcResponseRequirement
 from .Utilities import is_valid_station_name, is_valid_airport_code, get_fixed_width_float_str, ICAO_AIRPORT_REGEX, STATION_NAME_REGEX
 from datetime import datetime, time, UTC
-from typing import Self
+from collections.abc import Callable
+from typing import ClassVar, Self
 import enum
 import re
 
@@ -10,7 +11,13 @@ class HoppieMessage(object):
     """HoppieMessage(from_name, to_name, type)
     
     Abstract base message object
+
+    Note:
+        Messages are immutable. The packet content is encoded on first use
+        and cached, so that comparing and hashing messages is cheap.
     """
+    __slots__ = ('_from', '_packet', '_to', '_type')
+
     class MessageType(enum.StrEnum):
         ADS_C = 'ads-c'
         PROGRESS = 'progress'
@@ -42,9 +49,9 @@ class HoppieMessage(object):
         elif not is_valid_station_name(to_name):
             raise ValueError('Invalid TO station name')
         else:
-            self._from = from_name
-            self._to = to_name
-            self._type = type
+            object.__setattr__(self, '_from', from_name)
+            object.__setattr__(self, '_to', to_name)
+            object.__setattr__(self, '_type', type)
 
     def get_from_name(self) -> str:
         """Return sender station name
@@ -61,10 +68,21 @@ class HoppieMessage(object):
         """
         return self._type
 
+    def _encode_packet(self) -> str:
+        """Encode packet content, overridden by message types with a payload
+        """
+        return ''
+
     def get_packet_content(self) -> str:
         """Return encoded packet content
         """
-        return ''
+        try:
+            return self._packet
+        except AttributeError:
+            packet = self._encode_packet()
+            # Concurrent first calls store equal values
+            object.__setattr__(self, '_packet', packet)
+            return packet
 
     def get_msg_params(self) -> dict:
         """Return collated metadata
@@ -83,13 +101,32 @@ class HoppieMessage(object):
         return f"HoppieMessage(from_name={self.get_from_name()!r}, to_name={self.get_to_name()!r}, type={self.get_msg_type()!r})"
 
     def __eq__(self, __value: object) -> bool:
-        return isinstance(__value, HoppieMessage) and (self.get_msg_params() == __value.get_msg_params())
+        return isinstance(__value, HoppieMessage) and \
+            (self._from == __value._from) and (self._to == __value._to) and (self._type == __value._type) and \
+            (self.get_packet_content() == __value.get_packet_content())
+
+    def __hash__(self) -> int:
+        return hash((self._from, self._to, self._type, self.get_packet_content()))
+
+    # Constructors assign attributes with `object.__setattr__`, like frozen dataclasses
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __setstate__(self, state: tuple[None, dict[str, object]]) -> None:
+        # Restore slots of copied or unpickled messages
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
 
 class PeekMessage(HoppieMessage): 
     """PeekMessage()
     
     Retrieve messages without appearing online or marking them as relayed.
     """
+    __slots__ = ()
+
     def __init__(self, from_name: str):
         """Create "peek"-message
 
@@ -106,6 +143,8 @@ class PollMessage(HoppieMessage):
     
     Retrieve unread messages and mark station as 'online'.
     """
+    __slots__ = ()
+
     def __init__(self, from_name: str):
         """Create "poll"-message
 
@@ -122,6 +161,7 @@ class TelexMessage(HoppieMessage):
 
     Freetext ACARS message
     """
+    __slots__ = ('_message',)
     _TELEX_MAX_MSG_LEN: int = 220
 
     @classmethod
@@ -149,14 +189,14 @@ class TelexMessage(HoppieMessage):
             raise ValueError('Message contains non-ASCII characters')
         else:
             super().__init__(from_name, to_name, self.MessageType.TELEX)
-            self._message = message
+            object.__setattr__(self, '_message', message)
 
     def get_message(self) -> str:
         """Return freetext message content
         """
         return self._message
 
-    def get_packet_content(self) -> str:
+    def _encode_packet(self) -> str:
         return self._message.upper()
 
     def __repr__(self) -> str:
@@ -167,6 +207,13 @@ class ProgressMessage(HoppieMessage):
     
     ACARS OOOI (Out-off-on-in) Report
     """
+    __slots__ = ('_arr', '_dep', '_eta', '_in', '_off', '_on', '_out')
+    _APRT_PATTERN: re.Pattern = re.compile(r'^(' + ICAO_AIRPORT_REGEX + r')\/(' + ICAO_AIRPORT_REGEX + r')')
+    _TIME_OUT_PATTERN: re.Pattern = re.compile(r'OUT\/(\d{4})Z?')
+    _TIME_OFF_PATTERN: re.Pattern = re.compile(r'OFF\/(\d{4})Z?')
+    _ETA_PATTERN: re.Pattern = re.compile(r'ETA\/(\d{4})Z?')
+    _TIME_ON_PATTERN: re.Pattern = re.compile(r'ON\/(\d{4})Z?')
+    _TIME_IN_PATTERN: re.Pattern = re.compile(r'IN\/(\d{4})Z?')
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str, packet: str) -> Self:
@@ -178,45 +225,45 @@ class ProgressMessage(HoppieMessage):
             packet (str): Packet string
         """
         def _get_aprt(packet: str) -> tuple[str, str] | None:
-            m = re.match(r'^(' + ICAO_AIRPORT_REGEX + r')\/(' + ICAO_AIRPORT_REGEX + r')', packet)
+            m = cls._APRT_PATTERN.match(packet)
             if not m:
                 raise ValueError('Invalid dep/arr value')
             else:
                 return m.group(1), m.group(2)
 
         def _get_time(timestr: str) -> time:
-            return datetime.strptime(timestr, '%H%M').replace(tzinfo=UTC).timetz()
+            return time(int(timestr[0:2]), int(timestr[2:4]), tzinfo=UTC)
 
         def _get_time_out(packet: str) -> time | None:
-            m = re.search(r'OUT\/(\d{4})Z?', packet)
+            m = cls._TIME_OUT_PATTERN.search(packet)
             if not m:
                 raise ValueError('Invalid OUT value')
             else:
                 return _get_time(m.group(1))
 
         def _get_time_off(packet: str) -> time | None:
-            m = re.search(r'OFF\/(\d{4})Z?', packet)
+            m = cls._TIME_OFF_PATTERN.search(packet)
             if not m:
                 return None
             else:
                 return _get_time(m.group(1))
 
         def _get_eta(packet: str) -> time | None:
-            m = re.search(r'ETA\/(\d{4})Z?', packet)
+            m = cls._ETA_PATTERN.search(packet)
             if not m:
                 return None
             else:
                 return _get_time(m.group(1))
 
         def _get_time_on(packet: str) -> time | None:
-            m = re.search(r'ON\/(\d{4})Z?', packet)
+            m = cls._TIME_ON_PATTERN.search(packet)
             if not m:
                 return None
             else: 
                 return _get_time(m.group(1))
 
         def _get_time_in(packet: str) -> time | None:
-            m = re.search(r'IN\/(\d{4})Z?', packet)
+            m = cls._TIME_IN_PATTERN.search(packet)
             if not m:
                 return None
             else:
@@ -259,13 +306,13 @@ class ProgressMessage(HoppieMessage):
             raise ValueError('Invalid ETA after arrival specified')
         else:
             super().__init__(from_name, to_name, self.MessageType.PROGRESS)
-            self._dep = dep
-            self._arr = arr
-            self._out = time_out
-            self._off = time_off
-            self._on = time_on
-            self._in = time_in
-            self._eta = time_eta
+            object.__setattr__(self, '_dep', dep)
+            object.__setattr__(self, '_arr', arr)
+            object.__setattr__(self, '_out', time_out)
+            object.__setattr__(self, '_off', time_off)
+            object.__setattr__(self, '_on', time_on)
+            object.__setattr__(self, '_in', time_in)
+            object.__setattr__(self, '_eta', time_eta)
 
     def get_departure(self) -> str:
         """Return departure airport code
@@ -302,7 +349,7 @@ class ProgressMessage(HoppieMessage):
         """
         return self._eta
 
-    def get_packet_content(self) -> str:
+    def _encode_packet(self) -> str:
         def _get_utc(t: time) -> time: 
             offset = t.utcoffset()
             if not offset:
@@ -330,6 +377,7 @@ class AdscMessage(HoppieMessage):
     
     ADS-C message base class
     """
+    __slots__ = ('_adsc_msg_type',)
     
     class AdscMessageType(enum.StrEnum):
         REQUEST_PERIODIC = 'REQUEST PERIODIC'
@@ -349,7 +397,7 @@ class AdscMessage(HoppieMessage):
             adsc_msg_type (AdscMessageType): ADS-C message subtype
         """
         super().__init__(from_name, to_name, HoppieMessage.MessageType.ADS_C)
-        self._adsc_msg_type = adsc_msg_type
+        object.__setattr__(self, '_adsc_msg_type', adsc_msg_type)
 
     def get_adsc_msg_type(self) -> AdscMessageType:
         """Return message subtype
@@ -361,8 +409,9 @@ class AdscMessage(HoppieMessage):
         """
         return ''
 
-    def get_packet_content(self) -> str:
-        return self.get_adsc_msg_type() + (f" {self.get_adsc_data_packet()}" if len(self.get_adsc_data_packet()) > 0 else '')
+    def _encode_packet(self) -> str:
+        data_packet = self.get_adsc_data_packet()
+        return self.get_adsc_msg_type() + (f" {data_packet}" if len(data_packet) > 0 else '')
 
     def __repr__(self) -> str:
         return f"AdscMessage(from_name={self.get_from_name()!r}, to_name={self.get_to_name()!r}, adsc_msg_type={self.get_adsc_msg_type()!r})"
@@ -370,11 +419,15 @@ class AdscMessage(HoppieMessage):
     def __eq__(self, __value: object) -> bool:
         return super().__eq__(__value) and isinstance(__value, AdscMessage) and (__value.get_adsc_msg_type() == self.get_adsc_msg_type())
 
+    __hash__ = HoppieMessage.__hash__
+
 class AdscPeriodicContractRequestMessage(AdscMessage):
     """AdscPeriodicContractRequestMessage(from_name, to_name, interval)
 
     ADS-C Periodic Contract Request message
     """
+    __slots__ = ('_interval',)
+    _PACKET_PATTERN: re.Pattern = re.compile(AdscMessage.AdscMessageType.REQUEST_PERIODIC + r'\s(\d+)')
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str, packet: str) -> Self:
@@ -385,7 +438,7 @@ class AdscPeriodicContractRequestMessage(AdscMessage):
             to_name (str): Recipient station name
             packet (str): Packet string
         """
-        m = re.match(AdscMessage.AdscMessageType.REQUEST_PERIODIC + r'\s(\d+)', packet)
+        m = cls._PACKET_PATTERN.match(packet)
         if not m:
             raise ValueError('Invalid ADS-C contract request format')
         
@@ -406,7 +459,7 @@ class AdscPeriodicContractRequestMessage(AdscMessage):
         if interval < 0:
             raise ValueError('Report interval must be a positive integer')
         super().__init__(from_name, to_name, AdscMessage.AdscMessageType.REQUEST_PERIODIC)
-        self._interval = interval
+        object.__setattr__(self, '_interval', interval)
 
     def is_demand_contract_request(self) -> bool:
         """Check if this request is a Demand Contract Request
@@ -434,11 +487,21 @@ class AdscPeriodicContractRequestMessage(AdscMessage):
     def __eq__(self, __value: object) -> bool:
         return super().__eq__(__value) and isinstance(__value, AdscPeriodicContractRequestMessage) and (__value.get_interval() == self.get_interval())
 
+    __hash__ = HoppieMessage.__hash__
+
 class AdscPeriodicReportMessage(AdscMessage):
     """AdscPeriodicReportMessage(from_name, to_name, data)
     
     ADC-C Periodic Report message
     """
+    __slots__ = ('_data',)
+    _PACKET_PATTERN: re.Pattern = re.compile(
+        AdscMessage.AdscMessageType.REPORT_PERIODIC + r'\s(' + STATION_NAME_REGEX + r')\s(\d{6})\s(\-?\d{1,2}\.\d{4,6})\s(\-?\d{1,3}\.\d{3,6})\s(\d{1,5})' + \
+        r'(?:\s(\d{3})\s(\d{1,3})' + \
+            r'(?:\s(\d{3})\/(\d{1,3})\s(\-?\d{1,3})' + \
+                r'(?:\s(DES|LVL|CLB))?' + \
+            r')?' + \
+        r')?')
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str, packet: str) -> Self:
@@ -449,13 +512,7 @@ class AdscPeriodicReportMessage(AdscMessage):
             to_name (str): Recipipent station name
             packet (str): Packet string
         """
-        m = re.match(AdscMessage.AdscMessageType.REPORT_PERIODIC + r'\s(' + STATION_NAME_REGEX + r')\s(\d{6})\s(\-?\d{1,2}\.\d{4,6})\s(\-?\d{1,3}\.\d{3,6})\s(\d{1,5})' + \
-                     r'(?:\s(\d{3})\s(\d{1,3})' + \
-                        r'(?:\s(\d{3})\/(\d{1,3})\s(\-?\d{1,3})' + \
-                            r'(?:\s(DES|LVL|CLB))?' + \
-                        r')?' + \
-                     r')?', 
-                     packet)
+        m = cls._PACKET_PATTERN.match(packet)
         if not m:
             raise ValueError('Invalid ADS-C Periodic Report message format')
 
@@ -463,7 +520,8 @@ class AdscPeriodicReportMessage(AdscMessage):
         acft_ident = m.group(1)
         flight_ident_group = FlightIdentGroup(acft_ident)
 
-        timestamp = datetime.strptime(m.group(2), r'%d%H%M').replace(tzinfo=UTC)
+        ts = m.group(2)
+        timestamp = datetime(1900, 1, int(ts[0:2]), int(ts[2:4]), int(ts[4:6]), tzinfo=UTC)
         position = (float(m.group(3)), float(m.group(4)))
         altitude = 1.0 * int(m.group(5), base=10)
         basic_group = BasicGroup(timestamp, position, altitude)
@@ -474,7 +532,7 @@ class AdscPeriodicReportMessage(AdscMessage):
         if (m.group(6) is not None) and (m.group(7) is not None):
             true_track = 1.0 * int(m.group(6), base=10)
             ground_speed = 1.0 * int(m.group(7), base=10)
-            earth_ref_group = EarthRefGroup(true_track, ground_speed, None)
+            vertical_rate = None
 
             if (m.group(8) is not None) and (m.group(9) is not None) and (m.group(10) is not None):
                 wind_dir = 1.0 * int(m.group(8), base=10)
@@ -483,8 +541,10 @@ class AdscPeriodicReportMessage(AdscMessage):
                 meteo_group = MeteoGroup((wind_dir, wind_spd), temperature)
 
                 if m.group(11) is not None:
-                    vertical_rate = m.group(11)
-                    earth_ref_group.vertical_rate = vertical_rate
+                    vertical_rate = EarthRefGroup.VerticalRate(m.group(11))
+
+            # Groups are immutable, vertical rate is only known after parsing the meteo group
+            earth_ref_group = EarthRefGroup(true_track, ground_speed, vertical_rate)
 
         data = AdscData(basic_group, flight_ident_group, earth_ref_group, meteo_group)
         return AdscPeriodicReportMessage(from_name, to_name, data)
@@ -498,7 +558,7 @@ class AdscPeriodicReportMessage(AdscMessage):
             data (AdscGroupCollection): ADS-C data groups
         """
         super().__init__(from_name, to_name, AdscMessage.AdscMessageType.REPORT_PERIODIC)
-        self._data = data
+        object.__setattr__(self, '_data', data)
 
     def get_data(self) -> AdscData:
         """Return ADS-C group data
@@ -531,11 +591,14 @@ class AdscPeriodicReportMessage(AdscMessage):
     def __eq__(self, __value: object) -> bool:
         return super().__eq__(__value) and isinstance(__value, AdscPeriodicReportMessage) and (__value.get_data() == self.get_data())
 
+    __hash__ = HoppieMessage.__hash__
+
 class AdscContractCancellationMessage(AdscMessage):
     """AdscContractCancellationMessage(from_name, to_name)
     
     ADS-C Surveillance Contract Cancellation message.
     """
+    __slots__ = ()
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str) -> Self:
@@ -562,11 +625,14 @@ class AdscContractCancellationMessage(AdscMessage):
     def __eq__(self, __value: object) -> bool:
         return super().__eq__(__value) and isinstance(__value, AdscContractCancellationMessage)
 
+    __hash__ = HoppieMessage.__hash__
+
 class AdscContractRejectionMessage(AdscMessage):
     """AdscContractRejectionMessage(from_name, to_name)
     
     ADS-C Surveillance Contract Rejection message.
     """
+    __slots__ = ()
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str) -> Self:
@@ -593,13 +659,18 @@ class AdscContractRejectionMessage(AdscMessage):
     def __eq__(self, __value: object) -> bool:
         return super().__eq__(__value) and isinstance(__value, AdscContractRejectionMessage)
 
+    __hash__ = HoppieMessage.__hash__
+
 class CpdlcMessage(HoppieMessage):
     """CpdlcMessage(from_name, to_name, min, rr, message[, mrn])
 
     CPDLC message
     """
+    __slots__ = ('_message', '_min', '_mrn', '_rr')
     _EXCHG_FORMAT_PREFIX: str = 'data2'
     _MSG_CHARS: re.Pattern = r'[A-Z0-9\.\_\@ ]'
+    _PACKET_PATTERN: re.Pattern = re.compile(r'^/' + _EXCHG_FORMAT_PREFIX + r'/(\d+)/(\d*)/(WU|AN|R|NE|N|Y)/(' + _MSG_CHARS + r'*)$')
+    _MESSAGE_PATTERN: re.Pattern = re.compile(r'^' + _MSG_CHARS + r'+$')
 
     @classmethod
     def from_packet(cls, from_name: str, to_name: str, packet: str) -> Self:
@@ -610,7 +681,7 @@ class CpdlcMessage(HoppieMessage):
             to_name (str): Recipient station name
             packet (str): Packet string
         """
-        m = re.match(r'^/' + cls._EXCHG_FORMAT_PREFIX + r'/(\d+)/(\d*)/(WU|AN|R|NE|N|Y)/(' + cls._MSG_CHARS + r'*)$', packet)
+        m = cls._PACKET_PATTERN.match(packet)
         if not m:
             raise ValueError('Invalid CPDLC message format')
         
@@ -636,14 +707,14 @@ class CpdlcMessage(HoppieMessage):
             raise ValueError('Invalid MIN')
         elif mrn is not None and mrn < 0:
             raise ValueError('Invalid MRN')
-        elif not re.match(r'^' + self._MSG_CHARS + r'+$', message):
+        elif not self._MESSAGE_PATTERN.match(message):
             raise ValueError('Message contains invalid characters')
         else:
             super().__init__(from_name, to_name, self.MessageType.CPDLC)
-            self._min = min
-            self._rr = CpdlcResponseRequirement(rr)
-            self._message = message
-            self._mrn = mrn
+            object.__setattr__(self, '_min', min)
+            object.__setattr__(self, '_rr', CpdlcResponseRequirement(rr))
+            object.__setattr__(self, '_message', message)
+            object.__setattr__(self, '_mrn', mrn)
 
     def get_min(self) -> int:
         """Return Message Identification Number (MIN)
@@ -665,7 +736,7 @@ class CpdlcMessage(HoppieMessage):
         """
         return self._mrn
 
-    def get_packet_content(self) -> str:
+    def _encode_packet(self) -> str:
         return f"/{self._EXCHG_FORMAT_PREFIX}" \
                f"/{self._min}" \
                f"/{self._mrn if self._mrn is not None else ''}" \
@@ -680,7 +751,8 @@ class PingMessage(HoppieMessage):
 
     Station online check
     """
-    _PING_MAX_STATION_COUNT: int = 24
+    __slots__ = ('_stations',)
+    MAX_STATION_COUNT: int = 24
     
     def __init__(self, from_name=str, stations: list[str] | str | None = None):
         """Create a ping message.
@@ -700,21 +772,21 @@ class PingMessage(HoppieMessage):
         else:
             if isinstance(stations, str):
                 stations = [stations]
-            elif len(stations) > self._PING_MAX_STATION_COUNT:
+            elif len(stations) > self.MAX_STATION_COUNT:
                 raise ValueError('Too many stations requested')
             for s in stations:
                 if not is_valid_station_name(s):
                     raise ValueError(f"Invalid station name {s}")
         super().__init__(from_name, 'SERVER', HoppieMessage.MessageType.PING)
-        self._stations = stations
+        object.__setattr__(self, '_stations', tuple(stations))
 
     def get_stations(self) -> list[str]:
         """Return list of stations to check
         """
-        return self._stations
+        return list(self._stations)
 
-    def get_packet_content(self) -> str:
-        return ' '.join(self.get_stations())
+    def _encode_packet(self) -> str:
+        return ' '.join(self._stations)
 
     def __repr__(self) -> str:
         return f"PingMessage(from_name={self.get_from_name()!r}, stations={self.get_stations()!r})"
@@ -755,6 +827,13 @@ class HoppieMessageParser(object):
     
     Parser for creating `HoppieMessage` objects from received response data
     """
+    _PACKET_PARSERS: ClassVar[dict[str, Callable[[str, str, str], HoppieMessage]]] = {
+        HoppieMessage.MessageType.TELEX: TelexMessage.from_packet,
+        HoppieMessage.MessageType.CPDLC: CpdlcMessage.from_packet,
+        HoppieMessage.MessageType.PROGRESS: ProgressMessage.from_packet,
+        HoppieMessage.MessageType.ADS_C: AdscMessageParser.from_packet,
+    }
+
     def __init__(self, station: str):
         """Instantiate message parser
 
@@ -769,21 +848,11 @@ class HoppieMessageParser(object):
         Args:
             data (dict): API response data
         """
-        from_name = data['from']
         type_name = data['type']
-        packet = data['packet']
-
-        match HoppieMessage.MessageType(type_name):
-            case HoppieMessage.MessageType.TELEX:
-                return TelexMessage.from_packet(from_name, self._station, packet)
-            case HoppieMessage.MessageType.CPDLC:
-                return CpdlcMessage.from_packet(from_name, self._station, packet)
-            case HoppieMessage.MessageType.PROGRESS:
-                return ProgressMessage.from_packet(from_name, self._station, packet)
-            case HoppieMessage.MessageType.ADS_C:
-                return AdscMessageParser.from_packet(from_name, self._station, packet)
-            case _:
-                raise ValueError(f"Message type '{type_name}' not yet implemented")
+        packet_parser = self._PACKET_PARSERS.get(type_name)
+        if packet_parser is None:
+            raise ValueError(f"Message type '{type_name}' not yet implemented")
+        return packet_parser(data['from'], self._station, data['packet'])
 
     def __repr__(self) -> str:
         return f"HoppieMessageParser(station={self._station!r})"
@@ -0,0 +1,157 @@
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import bisect
+import time
+
+class PresenceCache(object):
+    """PresenceCache([ttl[, clock]])
+
+    Station online status cache
+
+    Note:
+        Status entries expire `ttl` after they were recorded. Expired and
+        unknown stations are reported as stale and need to be queried again.
+    """
+    TTL: timedelta = timedelta(seconds=60)
+
+    def __init__(self, ttl: timedelta = TTL, clock: Callable[[], float] = time.monotonic):
+        """Create a new cache
+
+        Args:
+            ttl (timedelta, optional): Lifetime of a status entry. Defaults to 60 s.
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to `time.monotonic`.
+        """
+        if ttl < timedelta(0):
+            raise ValueError('Invalid TTL')
+        self._ttl = ttl.total_seconds()
+        self._clock = clock
+        self._entries: dict[str, tuple[bool, float]] = {}
+
+    def is_online(self, station: str) -> bool | None:
+        """Return cached online status of a station
+
+        Args:
+            station (str): Station name
+
+        Returns:
+            bool | None: Online status, or None if the station is unknown or its entry has expired
+        """
+        entry = self._entries.get(station)
+        if (entry is None) or (self._clock() - entry[1] >= self._ttl):
+            return None
+        return entry[0]
+
+    def get_stale(self, stations: Iterable[str]) -> list[str]:
+        """Return stations without a valid status entry
+
+        Args:
+            stations (Iterable[str]): Station names
+
+        Returns:
+            list[str]: Unknown or expired stations, in input order
+        """
+        return [s for s in stations if self.is_online(s) is None]
+
+    def mark_online(self, station: str) -> None:
+        """Record a station as online
+
+        Note:
+            Call for each station that traffic was received from.
+
+        Args:
+            station (str): Station name
+        """
+        self._entries[station] = (True, self._clock())
+
+    def update(self, stations: Iterable[str], online: Iterable[str]) -> None:
+        """Record result of an online status query
+
+        Args:
+            stations (Iterable[str]): Queried station names
+            online (Iterable[str]): Stations reported as online
+        """
+        now = self._clock()
+        online = set(online)
+        for s in stations:
+            self._entries[s] = (s in online, now)
+        for s in online:
+            self._entries[s] = (True, now)
+
+    def clear(self) -> None:
+        """Discard all status entries
+        """
+        self._entries.clear()
+
+    def __repr__(self) -> str:
+        return f"PresenceCache(ttl={timedelta(seconds=self._ttl)!r})"
+
+class PresenceIndex(object):
+    """PresenceIndex()
+
+    Index of online stations built from consecutive `ping('*')` results
+
+    Note:
+        Membership is answered from a hash set, prefix queries by binary
+        search over a sorted list of station names. The sorted list is
+        merged incrementally, so an update costs linear time in the number
+        of stations plus sorting of the joined ones.
+    """
+    def __init__(self):
+        self._online: set[str] = set()
+        self._sorted: list[str] = []
+
+    def update(self, snapshot: Iterable[str]) -> tuple[list[str], list[str]]:
+        """Replace the set of online stations by a new snapshot
+
+        Args:
+            snapshot (Iterable[str]): All currently online stations
+
+        Returns:
+            tuple[list[str], list[str]]: Joined and left stations, each sorted by name
+        """
+        online = set(snapshot)
+        joined = sorted(online - self._online)
+        left = self._online - online
+        if left:
+            self._sorted = [s for s in self._sorted if s not in left]
+        if joined:
+            # Merging two sorted runs is linear with Timsort
+            self._sorted.extend(joined)
+            self._sorted.sort()
+        self._online = online
+        return joined, sorted(left)
+
+    def is_online(self, station: str) -> bool:
+        """Check if a station is online
+
+        Args:
+            station (str): Station name
+        """
+        return station in self._online
+
+    def get_stations(self) -> list[str]:
+        """Return all online stations, sorted by name
+        """
+        return list(self._sorted)
+
+    def get_stations_by_prefix(self, prefix: str) -> list[str]:
+        """Return online stations whose name starts with a prefix
+
+        Args:
+            prefix (str): Station name prefix, e.g. airline ICAO code
+
+        Returns:
+            list[str]: Matching stations, sorted by name
+        """
+        start = bisect.bisect_left(self._sorted, prefix)
+        end = bisect.bisect_left(self._sorted, prefix + '\uffff', lo=start)
+        return self._sorted[start:end]
+
+    def __contains__(self, station: object) -> bool:
+        return station in self._online
+
+    def __len__(self) -> int:
+        return len(self._online)
+
+    def __repr__(self) -> str:
+        return "PresenceIndex()"
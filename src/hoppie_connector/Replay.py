@@ -0,0 +1,203 @@
+from .Journal import JournalRecord
+from .Messages import HoppieMessage, HoppieMessageParser
+from .Responses import HoppieResponseParserFactory, PeekSuccessResponse, PollSuccessResponse
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+import time
+
+class ReplayStats(object):
+    """ReplayStats(responses, messages, response_failures, malformed_items, message_failures, response_time, type_counts, type_failures, type_timings, elapsed)
+
+    Result of a replay run
+    """
+    def __init__(self, responses: int, messages: int, response_failures: int, malformed_items: int, message_failures: int, response_time: timedelta, type_counts: dict[str, int], type_failures: dict[str, int], type_timings: dict[str, timedelta], elapsed: timedelta):
+        """Create replay result
+
+        Args:
+            responses (int): Number of replayed responses
+            messages (int): Number of parsed messages
+            response_failures (int): Number of responses which could not be parsed
+            malformed_items (int): Number of malformed data items
+            message_failures (int): Number of data items which could not be parsed into messages
+            response_time (timedelta): Time spent parsing responses
+            type_counts (dict[str, int]): Number of parsed messages per message type name
+            type_failures (dict[str, int]): Number of message parse failures per message type name
+            type_timings (dict[str, timedelta]): Time spent parsing messages per message type name, including failed attempts
+            elapsed (timedelta): Wall time of the run, including pacing delays
+        """
+        self._responses = responses
+        self._messages = messages
+        self._response_failures = response_failures
+        self._malformed_items = malformed_items
+        self._message_failures = message_failures
+        self._response_time = response_time
+        self._type_counts = type_counts
+        self._type_failures = type_failures
+        self._type_timings = type_timings
+        self._elapsed = elapsed
+
+    def get_responses(self) -> int:
+        """Return number of replayed responses
+        """
+        return self._responses
+
+    def get_messages(self) -> int:
+        """Return number of parsed messages
+        """
+        return self._messages
+
+    def get_response_failures(self) -> int:
+        """Return number of responses which could not be parsed
+        """
+        return self._response_failures
+
+    def get_malformed_items(self) -> int:
+        """Return number of malformed data items
+        """
+        return self._malformed_items
+
+    def get_message_failures(self) -> int:
+        """Return number of data items which could not be parsed into messages
+        """
+        return self._message_failures
+
+    def get_response_time(self) -> timedelta:
+        """Return time spent parsing responses
+        """
+        return self._response_time
+
+    def get_type_counts(self) -> dict[str, int]:
+        """Return number of parsed messages per message type name
+        """
+        return dict(self._type_counts)
+
+    def get_type_failures(self) -> dict[str, int]:
+        """Return number of message parse failures per message type name
+        """
+        return dict(self._type_failures)
+
+    def get_type_timings(self) -> dict[str, timedelta]:
+        """Return time spent parsing messages per message type name, including failed attempts
+        """
+        return dict(self._type_timings)
+
+    def get_parse_time(self) -> timedelta:
+        """Return total time spent parsing responses and messages
+        """
+        return sum(self._type_timings.values(), self._response_time)
+
+    def get_elapsed(self) -> timedelta:
+        """Return wall time of the run, including pacing delays
+        """
+        return self._elapsed
+
+    def get_messages_per_second(self) -> float:
+        """Return parsing throughput
+
+        Returns:
+            float: Parsed messages per second of parse time, or 0 if nothing was parsed
+        """
+        parse_time = self.get_parse_time().total_seconds()
+        return self._messages / parse_time if parse_time > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"ReplayStats(responses={self._responses!r}, messages={self._messages!r}, response_failures={self._response_failures!r}, malformed_items={self._malformed_items!r}, message_failures={self._message_failures!r}, response_time={self._response_time!r}, type_counts={self._type_counts!r}, type_failures={self._type_failures!r}, type_timings={self._type_timings!r}, elapsed={self._elapsed!r})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, ReplayStats) and (self._responses == __value._responses) and (self._messages == __value._messages) and (self._response_failures == __value._response_failures) and (self._malformed_items == __value._malformed_items) and (self._message_failures == __value._message_failures) and (self._response_time == __value._response_time) and (self._type_counts == __value._type_counts) and (self._type_failures == __value._type_failures) and (self._type_timings == __value._type_timings) and (self._elapsed == __value._elapsed)
+
+class ReplayEngine(object):
+    """ReplayEngine([speed[, clock[, sleep]]])
+
+    Replay of recorded API responses through the response and message parsers
+
+    Note:
+        Each record is parsed with the response parser of its request type,
+        and each data item with a `HoppieMessageParser` of the requesting
+        station, exactly as received by the connector. Without `speed`,
+        records are replayed back to back. Otherwise, the intervals between
+        record timestamps are divided by `speed`, so that `1.0` reproduces the
+        original cadence. Pacing delays are not counted as parse time.
+    """
+    def __init__(self, speed: float | None = None, clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep):
+        """Create a new replay engine
+
+        Args:
+            speed (float | None, optional): Time scale relative to the original cadence. Defaults to None (full speed).
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to `time.perf_counter`.
+            sleep (Callable[[float], None], optional): Sleep function in seconds. Defaults to `time.sleep`.
+        """
+        if (speed is not None) and not (speed > 0):
+            raise ValueError('Speed must be positive')
+        self._speed = speed
+        self._clock = clock
+        self._sleep = sleep
+        self._factory = HoppieResponseParserFactory()
+        self._parsers: dict[str, HoppieMessageParser] = {}
+
+    def run(self, records: Iterable[JournalRecord], on_message: Callable[[HoppieMessage], None] | None = None) -> ReplayStats:
+        """Replay recorded responses
+
+        Args:
+            records (Iterable[JournalRecord]): Recorded responses in reception order, e.g. a `JournalReader`
+            on_message (Callable[[HoppieMessage], None] | None, optional): Consumer of parsed messages, not counted as parse time. Defaults to None.
+
+        Returns:
+            ReplayStats: Counts and timings of the run
+        """
+        clock = self._clock
+        responses = messages = response_failures = malformed_items = message_failures = 0
+        response_time = 0.0
+        type_counts: dict[str, int] = {}
+        type_failures: dict[str, int] = {}
+        type_timings: dict[str, float] = {}
+        origin = None
+
+        start = clock()
+        for record in records:
+            if self._speed is not None:
+                if origin is None:
+                    origin = (record.get_timestamp(), clock())
+                delay = origin[1] + (record.get_timestamp() - origin[0]).total_seconds() / self._speed - clock()
+                if delay > 0:
+                    self._sleep(delay)
+
+            responses += 1
+            t0 = clock()
+            try:
+                response = self._factory.create_parser(record.get_request_type()).parse(record.get_body())
+            except ValueError:
+                response_failures += 1
+                response = None
+            response_time += clock() - t0
+            if not isinstance(response, (PollSuccessResponse, PeekSuccessResponse)):
+                continue
+
+            malformed_items += len(response.get_malformed_items())
+            station = record.get_station()
+            parser = self._parsers.get(station)
+            if parser is None:
+                parser = self._parsers[station] = HoppieMessageParser(station)
+            for d in response.get_data():
+                type_name = d['type']
+                t0 = clock()
+                try:
+                    message = parser.parse(d)
+                except ValueError:
+                    message = None
+                type_timings[type_name] = type_timings.get(type_name, 0.0) + (clock() - t0)
+                if message is None:
+                    message_failures += 1
+                    type_failures[type_name] = type_failures.get(type_name, 0) + 1
+                    continue
+                messages += 1
+                type_counts[type_name] = type_counts.get(type_name, 0) + 1
+                if on_message is not None:
+                    on_message(message)
+        elapsed = clock() - start
+
+        return ReplayStats(responses, messages, response_failures, malformed_items, message_failures, timedelta(seconds=response_time),
+                           type_counts, type_failures, {k: timedelta(seconds=v) for k, v in type_timings.items()}, timedelta(seconds=elapsed))
+
+    def __repr__(self) -> str:
+        return f"ReplayEngine(speed={self._speed!r})"
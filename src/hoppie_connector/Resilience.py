@@ -0,0 +1,269 @@
+from .Messages import HoppieMessage
+from collections.abc import Callable
+from datetime import timedelta
+import enum
+import random
+import requests
+import threading
+import time
+import urllib3
+
+try:
+    import aiohttp
+    _UNSENT_ERRORS: tuple[type[Exception], ...] = (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError)
+    _TRANSIENT_ERRORS: tuple[type[Exception], ...] = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, TimeoutError)
+except ImportError:  # pragma: no cover
+    _UNSENT_ERRORS = _TRANSIENT_ERRORS = ()
+
+class HTTPStatusError(ConnectionError):
+    """HTTPStatusError(status_code, reason)
+
+    Non-OK HTTP response from the API server
+    """
+    def __init__(self, status_code: int, reason: str):
+        super().__init__(f"Error {status_code}: {reason}")
+        self._status_code = status_code
+
+    def get_status_code(self) -> int:
+        """Return HTTP status code
+        """
+        return self._status_code
+
+class CircuitOpenError(ConnectionError):
+    """Request rejected by an open circuit breaker
+    """
+
+def is_unsent_error(error: Exception) -> bool:
+    """Check if a request failed before it could reach the server
+
+    Args:
+        error (Exception): Request failure
+
+    Returns:
+        bool: True if the request was never delivered (connect timeout, refused connection, open circuit)
+    """
+    if isinstance(error, (requests.ConnectTimeout, CircuitOpenError, *_UNSENT_ERRORS)):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], 'reason', None), urllib3.exceptions.NewConnectionError)
+    return False
+
+def is_transient_error(error: Exception) -> bool:
+    """Check if a request failure indicates a temporary server or network problem
+
+    Args:
+        error (Exception): Request failure
+
+    Returns:
+        bool: True for network errors, timeouts, rate limiting and server errors
+    """
+    if isinstance(error, HTTPStatusError):
+        return (error.get_status_code() >= 500) or (error.get_status_code() == 429)
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, *_TRANSIENT_ERRORS))
+
+class RetryPolicy(object):
+    """RetryPolicy([max_attempts[, backoff[, max_backoff[, jitter[, rng[, sleep]]]]]])
+
+    Retry policy with capped exponential backoff
+
+    Note:
+        With `jitter` enabled, each delay is drawn uniformly between zero and
+        the exponential backoff ("full jitter"), so that many stations failing
+        at the same time do not retry in lockstep.
+
+        `poll` marks messages as relayed and message types such as `telex` or
+        `cpdlc` are delivered to the recipient, so repeating them after the
+        server may have received them could lose or duplicate messages. Such
+        requests are only retried if they never reached the server. `peek`
+        and `ping` are also retried on timeouts, server errors and rate
+        limiting.
+    """
+    _IDEMPOTENT_TYPES: frozenset[HoppieMessage.MessageType] = frozenset([
+        HoppieMessage.MessageType.PEEK,
+        HoppieMessage.MessageType.PING,
+    ])
+
+    def __init__(self, max_attempts: int = 3, backoff: timedelta = timedelta(seconds=1), max_backoff: timedelta = timedelta(seconds=30), jitter: bool = True, rng: Callable[[], float] = random.random, sleep: Callable[[float], None] = time.sleep):
+        """Create a new retry policy
+
+        Args:
+            max_attempts (int, optional): Maximum number of attempts per request, including the first one. Defaults to 3.
+            backoff (timedelta, optional): Delay before the first retry, doubled on each further retry. Defaults to 1 s.
+            max_backoff (timedelta, optional): Upper limit of the retry delay. Defaults to 30 s.
+            jitter (bool, optional): Randomize retry delays. Defaults to True.
+            rng (Callable[[], float], optional): Random number source in [0, 1). Defaults to `random.random`.
+            sleep (Callable[[float], None], optional): Sleep function in seconds. Defaults to `time.sleep`.
+        """
+        if max_attempts < 1:
+            raise ValueError('Number of attempts must be a positive integer')
+        if (backoff < timedelta(0)) or (max_backoff < backoff):
+            raise ValueError('Invalid backoff')
+        self._max_attempts = max_attempts
+        self._backoff = backoff.total_seconds()
+        self._max_backoff = max_backoff.total_seconds()
+        self._jitter = jitter
+        self._rng = rng
+        self._sleep = sleep
+
+    def get_max_attempts(self) -> int:
+        """Return maximum number of attempts per request
+        """
+        return self._max_attempts
+
+    def get_delay(self, attempt: int) -> timedelta:
+        """Return delay before retrying after a failed attempt
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 1
+
+        Returns:
+            timedelta: Retry delay
+        """
+        delay = min(self._max_backoff, self._backoff * (2 ** (attempt - 1)))
+        return timedelta(seconds=self._rng() * delay if self._jitter else delay)
+
+    def should_retry(self, msg_type: HoppieMessage.MessageType, attempt: int, error: Exception) -> bool:
+        """Check if a failed request should be retried
+
+        Args:
+            msg_type (HoppieMessage.MessageType): Request message type
+            attempt (int): Number of the failed attempt, starting at 1
+            error (Exception): Request failure
+
+        Returns:
+            bool: True if the request should be retried
+        """
+        if (attempt >= self._max_attempts) or isinstance(error, CircuitOpenError):
+            return False
+        if is_unsent_error(error):
+            return True
+        return (msg_type in self._IDEMPOTENT_TYPES) and is_transient_error(error)
+
+    def wait(self, attempt: int) -> None:
+        """Sleep for the retry delay of a failed attempt
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 1
+        """
+        self._sleep(self.get_delay(attempt).total_seconds())
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self._max_attempts!r}, backoff={timedelta(seconds=self._backoff)!r}, max_backoff={timedelta(seconds=self._max_backoff)!r}, jitter={self._jitter!r})"
+
+class CircuitBreaker(object):
+    """CircuitBreaker([failure_threshold[, reset_timeout[, clock]]])
+
+    Circuit breaker for an API endpoint
+
+    Note:
+        After `failure_threshold` consecutive transient failures, the circuit
+        opens and all requests are rejected with `CircuitOpenError`. Once
+        `reset_timeout` has elapsed, a single probe request is let through:
+        the circuit closes if it succeeds and re-opens otherwise. A probe
+        without outcome, e.g. a cancelled request, is released, and a probe
+        which is never reported expires after another `reset_timeout`. Use
+        `get_circuit_breaker()` to share one breaker between all API objects
+        of an endpoint.
+    """
+    class State(enum.StrEnum):
+        CLOSED = 'closed'
+        OPEN = 'open'
+        HALF_OPEN = 'half-open'
+
+        def __repr__(self) -> str:
+            return f"CircuitBreaker.State.{self.name}"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: timedelta = timedelta(seconds=30), clock: Callable[[], float] = time.monotonic):
+        """Create a new circuit breaker
+
+        Args:
+            failure_threshold (int, optional): Number of consecutive failures which open the circuit. Defaults to 5.
+            reset_timeout (timedelta, optional): Time after which an open circuit is probed. Defaults to 30 s.
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to `time.monotonic`.
+        """
+        if failure_threshold < 1:
+            raise ValueError('Failure threshold must be a positive integer')
+        self._threshold = failure_threshold
+        self._reset_timeout = reset_timeout.total_seconds()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitBreaker.State.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def get_state(self) -> State:
+        """Return current circuit state
+        """
+        with self._lock:
+            if (self._state == CircuitBreaker.State.OPEN) and (self._clock() - self._opened_at >= self._reset_timeout):
+                return CircuitBreaker.State.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Check if a request may be sent, claiming the probe of an expired open circuit
+
+        Returns:
+            bool: True if the request may be sent
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.State.CLOSED:
+                return True
+            now = self._clock()
+            if now - self._opened_at >= self._reset_timeout:
+                # Open circuit expired, or probe lost without outcome
+                self._state = CircuitBreaker.State.HALF_OPEN
+                self._opened_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Report a request which reached a working server
+        """
+        with self._lock:
+            self._state = CircuitBreaker.State.CLOSED
+            self._failures = 0
+
+    def record_cancelled(self) -> None:
+        """Report a request which ended without outcome, e.g. because it was cancelled
+
+        Note:
+            Releases a claimed probe, so that the next request probes the
+            server again.
+        """
+        with self._lock:
+            if self._state == CircuitBreaker.State.HALF_OPEN:
+                self._state = CircuitBreaker.State.OPEN
+                self._opened_at = self._clock() - self._reset_timeout
+
+    def record_failure(self) -> None:
+        """Report a transient request failure
+        """
+        with self._lock:
+            self._failures += 1
+            if (self._state == CircuitBreaker.State.HALF_OPEN) or (self._failures >= self._threshold):
+                self._state = CircuitBreaker.State.OPEN
+                self._opened_at = self._clock()
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(failure_threshold={self._threshold!r}, reset_timeout={timedelta(seconds=self._reset_timeout)!r})"
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Return the shared circuit breaker of an API endpoint
+
+    Note:
+        The breaker is created with default settings on first use.
+
+    Args:
+        url (str): API URL
+
+    Returns:
+        CircuitBreaker: Circuit breaker shared by all callers of the endpoint
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(url)
+        if breaker is None:
+            breaker = _circuit_breakers[url] = CircuitBreaker()
+        return breaker
@@ -1,4 +1,6 @@
 from hoppie_connector.Messages import HoppieMessage
+from collections.abc import Iterator
+from typing import ClassVar
 import enum
 import re
 
@@ -87,60 +89,74 @@ class SuccessResponse(HoppieResponse):
         return 'SuccessResponse()'
 
 class PollSuccessResponse(SuccessResponse):
-    """PollSuccessResponse(msg_data)
+    """PollSuccessResponse(msg_data[, malformed])
     
     Success indication issued by the Hoppie API server in response to a poll request
     """
-    def __init__(self, msg_data: list[dict]):
+    def __init__(self, msg_data: list[dict], malformed: list[str] | None = None):
         """Create success response
 
         Args:
             msg_data (list[dict]): List of message data objects
+            malformed (list[str] | None, optional): List of raw data items which could not be parsed. Defaults to None.
         """
         super().__init__()
         self._data = msg_data
+        self._malformed = malformed if malformed is not None else []
 
     def get_data(self) -> list[dict]:
         """Return contained message data
         """
         return self._data
 
+    def get_malformed_items(self) -> list[str]:
+        """Return raw data items which could not be parsed
+        """
+        return self._malformed
+
     def __eq__(self, __value: object) -> bool:
-        return isinstance(__value, PollSuccessResponse) and super().__eq__(__value) and (self.get_data() == __value.get_data())
+        return isinstance(__value, PollSuccessResponse) and super().__eq__(__value) and (self.get_data() == __value.get_data()) and (self.get_malformed_items() == __value.get_malformed_items())
 
     def __str__(self) -> str:
         return f"{super().__str__()} {self.get_data()}"
 
     def __repr__(self) -> str:
-        return f"PollSuccessResponse(msg_data={self.get_data()!r})"
+        return f"PollSuccessResponse(msg_data={self.get_data()!r}, malformed={self.get_malformed_items()!r})"
 
 class PeekSuccessResponse(SuccessResponse):
-    """PeekSuccessResponse(msg_data)
+    """PeekSuccessResponse(msg_data[, malformed])
     
     Success indication issued by the Hoppie API server in response to a peek request
     """
-    def __init__(self, msg_data: list[dict]):
+    def __init__(self, msg_data: list[dict], malformed: list[str] | None = None):
         """Create success response
 
         Args:
             msg_data (list[dict]): List of message data objects
+            malformed (list[str] | None, optional): List of raw data items which could not be parsed. Defaults to None.
         """
         super().__init__()
         self._data = msg_data
+        self._malformed = malformed if malformed is not None else []
 
     def get_data(self) -> list[dict]:
         """Return contained message data
         """
         return self._data
 
+    def get_malformed_items(self) -> list[str]:
+        """Return raw data items which could not be parsed
+        """
+        return self._malformed
+
     def __eq__(self, __value: object) -> bool:
-        return isinstance(__value, PeekSuccessResponse) and super().__eq__(__value) and (self.get_data() == __value.get_data())
+        return isinstance(__value, PeekSuccessResponse) and super().__eq__(__value) and (self.get_data() == __value.get_data()) and (self.get_malformed_items() == __value.get_malformed_items())
 
     def __str__(self) -> str:
         return f"{super().__str__()} {self.get_data()}"
 
     def __repr__(self) -> str:
-        return f"PeekSuccessResponse(msg_data={self.get_data()!r})"
+        return f"PeekSuccessResponse(msg_data={self.get_data()!r}, malformed={self.get_malformed_items()!r})"
 
 class PingSuccessResponse(SuccessResponse):
     """PingSuccessResponse(stations)
@@ -175,8 +191,11 @@ class HoppieResponseParser(object):
     
     Parser of Hoppie's custom-format data items, encoded in plain text
     """
+    _RESPONSE_PATTERN: re.Pattern = re.compile(r'^(ok|error)\s?(.*)$', flags=re.DOTALL)
+    _ERROR_PATTERN: re.Pattern = re.compile(r'\{(.*)\}', flags=re.DOTALL)
+
     def _parse_error(self, content: str) -> ErrorResponse:
-        m = re.search(r'\{(.*)\}', content, flags=re.DOTALL)
+        m = self._ERROR_PATTERN.search(content)
         if not m:
             raise ValueError('Invalid error message format')
         else:
@@ -185,6 +204,20 @@ class HoppieResponseParser(object):
     def _parse_success(self, content: str) -> SuccessResponse:
         return SuccessResponse()
 
+    def split(self, response: str) -> tuple[HoppieResponse.ResponseCode, str]:
+        """Split API response text into response code and content
+
+        Args:
+            response (str): Response text
+
+        Returns:
+            tuple[HoppieResponse.ResponseCode, str]: Response code and content
+        """
+        m = self._RESPONSE_PATTERN.match(response)
+        if not m:
+            raise ValueError('Invalid response format')
+        return HoppieResponse.ResponseCode(m.group(1)), (m.group(2).strip() if m.group(2) else '')
+
     def parse(self, response: str) -> HoppieResponse:
         """Parse response from API response text
 
@@ -194,12 +227,8 @@ class HoppieResponseParser(object):
         Returns:
             HoppieResponse: Parsed response
         """
-        m = re.match(r'^(ok|error)\s?(.*)$', response, flags=re.DOTALL)
-        if not m:
-            raise ValueError('Invalid response format')
-        
-        content = m.group(2).strip() if m.group(2) else ''
-        if m.group(1) == 'ok':
+        code, content = self.split(response)
+        if code == HoppieResponse.ResponseCode.OK:
             return self._parse_success(content)
         else:
             return self._parse_error(content)
@@ -210,27 +239,59 @@ class HoppieResponseParser(object):
     def __repr__(self) -> str:
         return 'HoppieResponseParser()'
 
-class PollResponseParser(HoppieResponseParser):
+class _DataItemResponseParser(HoppieResponseParser):
+    """_DataItemResponseParser()
+
+    Base parser for responses carrying a list of `{header {packet}}` data items
+
+    Note:
+        Items are tokenized and their fields extracted in a single linear pass
+        over the response content. Text outside of braces is skipped. Items
+        which do not match the expected format are reported as malformed.
+        Subclasses provide `_ITEM_PATTERN`, `_create_item(m)` and
+        `_create_response(msg_data, malformed)`.
+    """
+    # Brace-aware fallback consuming exactly one malformed item
+    _MALFORMED_ITEM_REGEX: str = r'[^{}]*(?:\{[^}]*\}?\}?|\}?)'
+
+    def iter_data_items(self, content: str) -> Iterator[tuple[dict | None, str]]:
+        """Parse message data items from response content one at a time
+
+        Args:
+            content (str): Response content following the response code
+
+        Yields:
+            tuple[dict | None, str]: Message data (None if malformed) and raw item text
+        """
+        for m in self._ITEM_PATTERN.finditer(content):
+            yield (self._create_item(m) if m.group(1) is not None else None), m.group(0)
+
+    def _parse_success(self, content: str) -> SuccessResponse:
+        msg_data = []
+        malformed = []
+        for m in self._ITEM_PATTERN.finditer(content):
+            if m.group(1) is not None:
+                msg_data.append(self._create_item(m))
+            else:
+                malformed.append(m.group(0))
+        return self._create_response(msg_data, malformed)
+
+class PollResponseParser(_DataItemResponseParser):
     """PollResponseParser()
     
     Parser of Hoppie's custom-format data items, encoded in plain text
     """
-    def _parse_message_data_item(self, content: str) -> dict | None:
-        m = re.match(r'\{([A-Z0-9]+)\s([a-z\s\-]+)\s\{([^\}]*)\}\}', content)
-        from_name = m.group(1)
-        type_name = m.group(2)
-        packet_content = m.group(3)
+    _ITEM_PATTERN: re.Pattern = re.compile(r'\{(?:([A-Z0-9]+)\s([a-z\s\-]+)\s\{([^}]*)\}\}|' + _DataItemResponseParser._MALFORMED_ITEM_REGEX + r')')
+
+    def _create_item(self, m: re.Match) -> dict:
         return {
-            'from': from_name,
-            'type': type_name,
-            'packet': packet_content
+            'from': m.group(1),
+            'type': m.group(2),
+            'packet': m.group(3)
         }
 
-    def _parse_success(self, content: str) -> SuccessResponse:
-        msg_data = []
-        for m in re.findall(r'(\{[A-Z0-9]+\s[a-z\s\-]+\s\{[^\}]*\}\})', content, flags=re.DOTALL):
-            msg_data.append(self._parse_message_data_item(m))
-        return PollSuccessResponse(msg_data)
+    def _create_response(self, msg_data: list[dict], malformed: list[str]) -> SuccessResponse:
+        return PollSuccessResponse(msg_data, malformed)
 
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, PollResponseParser)
@@ -238,29 +299,23 @@ class PollResponseParser(HoppieResponseParser):
     def __repr__(self) -> str:
         return 'PollResponseParser()'
 
-class PeekResponseParser(HoppieResponseParser):
+class PeekResponseParser(_DataItemResponseParser):
     """PeekResponseParser()
     
     Parser of Hoppie's custom-format data items, encoded in plain text
     """
-    def _parse_message_data_item(self, content: str) -> dict | None:
-        m = re.match(r'\{(\d+)\s([A-Z0-9]+)\s([a-z\s\-]+)\s\{([^\}]*)\}\}', content)
-        id = int(m.group(1), base=10)
-        from_name = m.group(2)
-        type_name = m.group(3)
-        packet_content = m.group(4)
+    _ITEM_PATTERN: re.Pattern = re.compile(r'\{(?:(\d+)\s([A-Z0-9]+)\s([a-z\s\-]+)\s\{([^}]*)\}\}|' + _DataItemResponseParser._MALFORMED_ITEM_REGEX + r')')
+
+    def _create_item(self, m: re.Match) -> dict:
         return {
-            'id': id,
-            'from': from_name,
-            'type': type_name,
-            'packet': packet_content
+            'id': int(m.group(1), base=10),
+            'from': m.group(2),
+            'type': m.group(3),
+            'packet': m.group(4)
         }
 
-    def _parse_success(self, content: str) -> SuccessResponse:
-        msg_data = []
-        for m in re.findall(r'(\{\d+\s[A-Z0-9]+\s[a-z\s\-]+\s\{[^\}]*\}\})', content, flags=re.DOTALL):
-            msg_data.append(self._parse_message_data_item(m))
-        return PeekSuccessResponse(msg_data)
+    def _create_response(self, msg_data: list[dict], malformed: list[str]) -> SuccessResponse:
+        return PeekSuccessResponse(msg_data, malformed)
 
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, PeekResponseParser)
@@ -273,8 +328,10 @@ class PingResponseParser(HoppieResponseParser):
     
     Parser of Hoppie's custom-format data items, encoded in plain text
     """
+    _STATIONS_PATTERN: re.Pattern = re.compile(r'\s?([A-Z0-9]{3,9})')
+
     def _parse_success(self, content: str) -> SuccessResponse:
-        return PingSuccessResponse(re.findall(r'\s?([A-Z0-9]{3,9})', content))
+        return PingSuccessResponse(self._STATIONS_PATTERN.findall(content))
 
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, PingResponseParser)
@@ -286,7 +343,22 @@ class HoppieResponseParserFactory(object):
     """HoppieResponseParserFactory()
 
     Factory class to create the corresponding parser for a given message type
+
+    Note:
+        Parsers are stateless. One parser instance per request type is
+        created on first use and shared afterwards.
     """
+    _PARSER_TYPES: ClassVar[dict[str, type[HoppieResponseParser]]] = {
+        HoppieMessage.MessageType.POLL: PollResponseParser,
+        HoppieMessage.MessageType.PEEK: PeekResponseParser,
+        HoppieMessage.MessageType.PING: PingResponseParser,
+    }
+
+    def __init__(self):
+        """Create parser factory
+        """
+        self._parsers: dict[HoppieMessage.MessageType, HoppieResponseParser] = {}
+
     def create_parser(self, request_type: HoppieMessage.MessageType) -> HoppieResponseParser:
         """Create parser for given request type
 
@@ -296,12 +368,9 @@ class HoppieResponseParserFactory(object):
         Returns:
             HoppieResponseParser: Corresponding parser for request type
         """
-        match HoppieMessage.MessageType(request_type):
-            case HoppieMessage.MessageType.POLL:
-                return PollResponseParser()
-            case HoppieMessage.MessageType.PEEK:
-                return PeekResponseParser()
-            case HoppieMessage.MessageType.PING:
-                return PingResponseParser()
-            case _:
-                return HoppieResponseParser()
\ No newline at end of file
+        parser = self._parsers.get(request_type)
+        if parser is None:
+            request_type = HoppieMessage.MessageType(request_type)
+            parser = self._PARSER_TYPES.get(request_type, HoppieResponseParser)()
+            self._parsers[request_type] = parser
+        return parser
\ No newline at end of file
@@ -0,0 +1,327 @@
+from .Messages import HoppieMessage
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Protocol
+import asyncio
+import heapq
+import threading
+import time
+
+class PollingConnector(Protocol):
+    """Minimum connector interface required by `PollScheduler`
+    """
+    def get_station_name(self) -> str: ...
+    def poll(self) -> tuple[list[HoppieMessage], timedelta]: ...
+
+class AsyncPollingConnector(Protocol):
+    """Minimum connector interface required by `AsyncPollScheduler`
+    """
+    def get_station_name(self) -> str: ...
+    async def poll(self) -> tuple[list[HoppieMessage], timedelta]: ...
+
+@dataclass(slots=True)
+class _PollSession:
+    connector: PollingConnector | AsyncPollingConnector
+    next_due: float
+    last_poll: float | None = None
+    last_activity: float | None = None
+
+class _PollSchedulerBase(object):
+    IDLE_INTERVAL: timedelta = timedelta(seconds=60)
+    ACTIVE_INTERVAL: timedelta = timedelta(seconds=20)
+    ACTIVE_TIMEOUT: timedelta = timedelta(seconds=120)
+    MAX_WORKERS: int = 10
+
+    # Fractional part of the golden ratio, used to generate a low-discrepancy
+    # sequence of start offsets within the idle interval.
+    _SPREAD_FACTOR: float = 0.6180339887498949
+
+    def __init__(self, idle_interval: timedelta = IDLE_INTERVAL, active_interval: timedelta = ACTIVE_INTERVAL, active_timeout: timedelta = ACTIVE_TIMEOUT, max_workers: int = MAX_WORKERS, clock: Callable[[], float] = time.monotonic):
+        """Create a new scheduler
+
+        Args:
+            idle_interval (timedelta, optional): Polling interval without active exchange. Defaults to 60 s.
+            active_interval (timedelta, optional): Polling interval during an active exchange. Defaults to 20 s.
+            active_timeout (timedelta, optional): Time without traffic after which an exchange is considered finished. Defaults to 120 s.
+            max_workers (int, optional): Maximum number of concurrent polls. Defaults to 10.
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to `time.monotonic`.
+        """
+        if active_interval <= timedelta(0) or idle_interval < active_interval:
+            raise ValueError('Invalid polling intervals')
+        if max_workers < 1:
+            raise ValueError('Number of workers must be a positive integer')
+        self._idle = idle_interval.total_seconds()
+        self._active = active_interval.total_seconds()
+        self._timeout = active_timeout.total_seconds()
+        self._max_workers = max_workers
+        self._clock = clock
+        self._sessions: dict[str, _PollSession] = {}
+        self._queue: list[tuple[float, str]] = []
+        self._added = 0
+        self._undelivered: dict[str, list[HoppieMessage]] = {}
+        # Guards sessions and queue, which are changed by callers while `run()`
+        # sleeps. Subclasses implement `_wake()` to end that sleep early.
+        self._lock = threading.RLock()
+
+    def _push(self, station: str, due: float) -> None:
+        self._sessions[station].next_due = due
+        heapq.heappush(self._queue, (due, station))
+
+    def _is_active(self, session: _PollSession, now: float) -> bool:
+        return (session.last_activity is not None) and (now - session.last_activity < self._timeout)
+
+    def add(self, connector: PollingConnector | AsyncPollingConnector) -> None:
+        """Add station session
+
+        Args:
+            connector (PollingConnector | AsyncPollingConnector): Connector of the station to poll
+        """
+        station = connector.get_station_name()
+        with self._lock:
+            if station in self._sessions:
+                raise ValueError(f"Station {station} already scheduled")
+            offset = ((self._added * self._SPREAD_FACTOR) % 1.0) * self._idle
+            self._added += 1
+            self._sessions[station] = _PollSession(connector, 0.0)
+            self._push(station, self._clock() + offset)
+            self._wake()
+
+    def remove(self, station: str) -> None:
+        """Remove station session
+
+        Args:
+            station (str): Station name
+        """
+        with self._lock:
+            del self._sessions[station]
+
+    def get_stations(self) -> list[str]:
+        """Return list of scheduled station names
+        """
+        with self._lock:
+            return list(self._sessions)
+
+    def notify_activity(self, station: str) -> None:
+        """Mark station exchange as active
+
+        Note:
+            Call after sending a CPDLC or telex message in order to switch the
+            station to the active polling interval. A sleeping `run()` is
+            woken up if the station becomes due earlier.
+
+        Args:
+            station (str): Station name
+        """
+        with self._lock:
+            session = self._sessions[station]
+            session.last_activity = self._clock()
+            if session.last_poll is not None:
+                due = session.last_poll + self._active
+                if due < session.next_due:
+                    self._push(station, due)
+                    self._wake()
+
+    def is_active(self, station: str) -> bool:
+        """Check if station exchange is active
+
+        Args:
+            station (str): Station name
+        """
+        with self._lock:
+            return self._is_active(self._sessions[station], self._clock())
+
+    def get_next_due(self, station: str) -> float:
+        """Return next due time of a station in scheduler clock seconds
+
+        Args:
+            station (str): Station name
+        """
+        with self._lock:
+            return self._sessions[station].next_due
+
+    def get_sleep_time(self) -> timedelta | None:
+        """Return time until the next station is due, or None if no stations are scheduled
+        """
+        with self._lock:
+            self._discard_stale()
+            if not self._queue:
+                return None
+            return timedelta(seconds=max(0.0, self._queue[0][0] - self._clock()))
+
+    def _get_wait_time(self) -> float:
+        sleep_time = self.get_sleep_time()
+        return self._idle if sleep_time is None else sleep_time.total_seconds()
+
+    def _discard_stale(self) -> None:
+        while self._queue:
+            due, station = self._queue[0]
+            session = self._sessions.get(station)
+            if (session is not None) and (session.next_due == due):
+                return
+            heapq.heappop(self._queue)
+
+    def _take_due(self) -> tuple[float, list[tuple[str, _PollSession]]]:
+        due = []
+        with self._lock:
+            now = self._clock()
+            while True:
+                self._discard_stale()
+                if not self._queue or self._queue[0][0] > now:
+                    return now, due
+                _, station = heapq.heappop(self._queue)
+                session = self._sessions[station]
+                session.last_poll = now
+                due.append((station, session))
+
+    def _complete(self, now: float, due: list[tuple[str, _PollSession]], outcomes: list, on_error: Callable[[str, Exception], None] | None) -> dict[str, list[HoppieMessage]]:
+        errors = []
+        with self._lock:
+            result, self._undelivered = self._undelivered, {}
+            for (station, session), outcome in zip(due, outcomes):
+                failed = isinstance(outcome, BaseException)
+                if not failed and outcome:
+                    session.last_activity = now
+                if self._sessions.get(station) is session:
+                    self._push(station, now + (self._active if self._is_active(session, now) else self._idle))
+                if not failed:
+                    result[station] = result.get(station, []) + outcome
+                else:
+                    errors.append((station, outcome))
+            if errors and (on_error is None):
+                self._undelivered = result
+        if on_error is not None:
+            for station, error in errors:
+                on_error(station, error)
+        elif errors:
+            raise errors[0][1]
+        return result
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(idle_interval={timedelta(seconds=self._idle)!r}, active_interval={timedelta(seconds=self._active)!r}, active_timeout={timedelta(seconds=self._timeout)!r}, max_workers={self._max_workers!r})"
+
+class PollScheduler(_PollSchedulerBase):
+    """PollScheduler([idle_interval[, active_interval[, active_timeout[, max_workers[, clock]]]]])
+
+    Poll scheduler for many station sessions.
+
+    Note:
+        Stations are polled at most once per `idle_interval` (60 s). While an
+        exchange is active (messages were received, or `notify_activity()` was
+        called), a station is polled once per `active_interval` (20 s) until
+        `active_timeout` has elapsed without further traffic. Initial poll times
+        of newly added stations are spread evenly over the idle interval.
+
+        Stations which are due at the same time are polled concurrently on up
+        to `max_workers` threads, so connectors must be thread-safe. Stations
+        may be added and notified from other threads while `run()` sleeps.
+    """
+    # Maximum time `run()` sleeps before checking its stop request
+    _STOP_CHECK_INTERVAL: float = 0.1
+
+    def __init__(self, idle_interval: timedelta = _PollSchedulerBase.IDLE_INTERVAL, active_interval: timedelta = _PollSchedulerBase.ACTIVE_INTERVAL, active_timeout: timedelta = _PollSchedulerBase.ACTIVE_TIMEOUT, max_workers: int = _PollSchedulerBase.MAX_WORKERS, clock: Callable[[], float] = time.monotonic):
+        super().__init__(idle_interval, active_interval, active_timeout, max_workers, clock)
+        self._changed = threading.Condition(self._lock)
+
+    def _wake(self) -> None:
+        self._changed.notify_all()
+
+    def poll_due(self, on_error: Callable[[str, Exception], None] | None = None) -> dict[str, list[HoppieMessage]]:
+        """Poll all stations which are currently due
+
+        Note:
+            A failing station is rescheduled normally. Its exception is passed
+            to `on_error` if given. Otherwise, the first exception is raised
+            once all due stations were polled, and the messages received by
+            the other stations are returned by the next call.
+
+        Args:
+            on_error (Callable[[str, Exception], None] | None, optional): Error handler. Defaults to None.
+
+        Returns:
+            dict[str, list[HoppieMessage]]: Received messages per polled station
+        """
+        now, due = self._take_due()
+        outcomes = []
+        if due:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(due)), thread_name_prefix='hoppie-poll') as executor:
+                futures = [executor.submit(session.connector.poll) for _, session in due]
+                outcomes = [f.exception() or f.result()[0] for f in futures]
+        return self._complete(now, due, outcomes, on_error)
+
+    def run(self, on_messages: Callable[[str, list[HoppieMessage]], None], stop: threading.Event, on_error: Callable[[str, Exception], None] | None = None) -> None:
+        """Poll stations as they become due until stopped
+
+        Note:
+            The stop request is checked at least every 100 ms.
+
+        Args:
+            on_messages (Callable[[str, list[HoppieMessage]], None]): Handler for received messages, called once per non-empty poll
+            stop (threading.Event): Stop request
+            on_error (Callable[[str, Exception], None] | None, optional): Error handler. Defaults to None.
+        """
+        while not stop.is_set():
+            for station, messages in self.poll_due(on_error).items():
+                if messages:
+                    on_messages(station, messages)
+            with self._changed:
+                # Woken up early by `add()` and `notify_activity()`
+                self._changed.wait(min(self._get_wait_time(), self._STOP_CHECK_INTERVAL))
+
+class AsyncPollScheduler(_PollSchedulerBase):
+    """AsyncPollScheduler([idle_interval[, active_interval[, active_timeout[, max_workers[, clock]]]]])
+
+    Awaitable poll scheduler for many station sessions, e.g. `AsyncHoppieConnector`
+
+    Note:
+        Uses the same cadence as `PollScheduler`. Stations which are due at
+        the same time are polled concurrently on the event loop, up to
+        `max_workers` at once. The scheduler must only be used from the
+        thread running its event loop.
+    """
+    def __init__(self, idle_interval: timedelta = _PollSchedulerBase.IDLE_INTERVAL, active_interval: timedelta = _PollSchedulerBase.ACTIVE_INTERVAL, active_timeout: timedelta = _PollSchedulerBase.ACTIVE_TIMEOUT, max_workers: int = _PollSchedulerBase.MAX_WORKERS, clock: Callable[[], float] = time.monotonic):
+        super().__init__(idle_interval, active_interval, active_timeout, max_workers, clock)
+        self._changed = asyncio.Event()
+
+    def _wake(self) -> None:
+        self._changed.set()
+
+    async def poll_due(self, on_error: Callable[[str, Exception], None] | None = None) -> dict[str, list[HoppieMessage]]:
+        """Poll all stations which are currently due
+
+        Note:
+            See `PollScheduler.poll_due()`.
+
+        Args:
+            on_error (Callable[[str, Exception], None] | None, optional): Error handler. Defaults to None.
+
+        Returns:
+            dict[str, list[HoppieMessage]]: Received messages per polled station
+        """
+        now, due = self._take_due()
+        semaphore = asyncio.Semaphore(self._max_workers)
+        async def _poll(session: _PollSession) -> list[HoppieMessage]:
+            async with semaphore:
+                return (await session.connector.poll())[0]
+        outcomes = await asyncio.gather(*(_poll(session) for _, session in due), return_exceptions=True)
+        return self._complete(now, due, outcomes, on_error)
+
+    async def run(self, on_messages: Callable[[str, list[HoppieMessage]], None], stop: asyncio.Event, on_error: Callable[[str, Exception], None] | None = None) -> None:
+        """Poll stations as they become due until stopped
+
+        Args:
+            on_messages (Callable[[str, list[HoppieMessage]], None]): Handler for received messages, called once per non-empty poll
+            stop (asyncio.Event): Stop request
+            on_error (Callable[[str, Exception], None] | None, optional): Error handler. Defaults to None.
+        """
+        while not stop.is_set():
+            for station, messages in (await self.poll_due(on_error)).items():
+                if messages:
+                    on_messages(station, messages)
+            self._changed.clear()
+            # Woken up early by the stop request, `add()` and `notify_activity()`
+            waits = [asyncio.ensure_future(stop.wait()), asyncio.ensure_future(self._changed.wait())]
+            await asyncio.wait(waits, timeout=self._get_wait_time(), return_when=asyncio.FIRST_COMPLETED)
+            for w in waits:
+                w.cancel()
@@ -0,0 +1,188 @@
+from .Messages import HoppieMessage, HoppieMessageParser, CpdlcMessage
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Self
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    received REAL NOT NULL,
+    peek_id INTEGER,
+    from_name TEXT NOT NULL,
+    to_name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    packet TEXT NOT NULL,
+    min INTEGER,
+    mrn INTEGER
+);
+CREATE INDEX IF NOT EXISTS messages_received ON messages (received);
+CREATE INDEX IF NOT EXISTS messages_from ON messages (from_name, type, received);
+CREATE INDEX IF NOT EXISTS messages_to ON messages (to_name, type, received);
+CREATE INDEX IF NOT EXISTS messages_type ON messages (type, received);
+CREATE UNIQUE INDEX IF NOT EXISTS messages_peek_id ON messages (peek_id, to_name);
+CREATE INDEX IF NOT EXISTS messages_min ON messages (min, from_name);
+CREATE INDEX IF NOT EXISTS messages_mrn ON messages (mrn, to_name);
+"""
+_INSERT: str = 'INSERT OR IGNORE INTO messages (received, peek_id, from_name, to_name, type, packet, min, mrn) VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+
+class MessageStore(object):
+    """MessageStore([path[, clock]])
+
+    Indexed local store of received messages
+
+    Note:
+        Messages are kept in an SQLite database, indexed by sender, recipient,
+        message type, peek id, reception time and CPDLC MIN/MRN. Each call to
+        `add_messages()` or `add_peek_messages()` is committed as a single
+        transaction. Peek messages already stored for the same recipient are
+        ignored, so that overlapping `peek()` results can be stored as a
+        whole.
+
+        Only message types received from the API (telex, CPDLC, progress and
+        ADS-C) can be stored. Queried messages are parsed back from their
+        stored packet content.
+
+        The store may be shared between threads. All of them use a single
+        database connection, serialized by a lock; queries fetch their rows
+        under the lock and parse them afterwards.
+    """
+    def __init__(self, path: str | os.PathLike = ':memory:', clock: Callable[[], float] = time.time):
+        """Open a message store
+
+        Args:
+            path (str | os.PathLike, optional): Database file path, created if missing. Defaults to ':memory:'.
+            clock (Callable[[], float], optional): Wall clock in POSIX seconds, used as default reception time. Defaults to `time.time`.
+        """
+        self._path = os.fspath(path)
+        self._clock = clock
+        self._parsers: dict[str, HoppieMessageParser] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        # Write-ahead logging lets readers query while a poll cycle is stored
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        with self._db:
+            self._db.executescript(_SCHEMA)
+
+    def _to_row(self, received: float, peek_id: int | None, message: HoppieMessage) -> tuple:
+        msg_type = message.get_msg_type()
+        if msg_type not in HoppieMessageParser._PACKET_PARSERS:
+            raise ValueError(f"Message type '{msg_type}' can not be stored")
+        if isinstance(message, CpdlcMessage):
+            min, mrn = message.get_min(), message.get_mrn()
+        else:
+            min = mrn = None
+        return (received, peek_id, message.get_from_name(), message.get_to_name(), msg_type.value, message.get_packet_content(), min, mrn)
+
+    def _insert(self, rows: Iterable[tuple]) -> int:
+        with self._lock, self._db:
+            return self._db.executemany(_INSERT, rows).rowcount
+
+    def add_messages(self, messages: Iterable[HoppieMessage], received: datetime | None = None) -> int:
+        """Store messages, e.g. the result of `poll()`
+
+        Args:
+            messages (Iterable[HoppieMessage]): Received messages
+            received (datetime | None, optional): Reception time. Defaults to None (now).
+
+        Returns:
+            int: Number of stored messages
+        """
+        t = received.timestamp() if received is not None else self._clock()
+        return self._insert([self._to_row(t, None, m) for m in messages])
+
+    def add_peek_messages(self, messages: Iterable[tuple[int, HoppieMessage]], received: datetime | None = None) -> int:
+        """Store peeked messages, e.g. the result of `peek()`
+
+        Note:
+            Messages whose peek id is already stored for the same recipient
+            are ignored.
+
+        Args:
+            messages (Iterable[tuple[int, HoppieMessage]]): Received messages (id, content)
+            received (datetime | None, optional): Reception time. Defaults to None (now).
+
+        Returns:
+            int: Number of newly stored messages
+        """
+        t = received.timestamp() if received is not None else self._clock()
+        return self._insert([self._to_row(t, i, m) for i, m in messages])
+
+    def _where(self, from_name: str | None, to_name: str | None, msg_type: HoppieMessage.MessageType | None, since: datetime | None, until: datetime | None, peek_id: int | None, min: int | None, mrn: int | None) -> tuple[str, list]:
+        conditions = []
+        params = []
+        for column, value in (('from_name', from_name), ('to_name', to_name), ('type', msg_type), ('peek_id', peek_id), ('min', min), ('mrn', mrn)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value.value if isinstance(value, HoppieMessage.MessageType) else value)
+        if since is not None:
+            conditions.append('received >= ?')
+            params.append(since.timestamp())
+        if until is not None:
+            conditions.append('received < ?')
+            params.append(until.timestamp())
+        return (' WHERE ' + ' AND '.join(conditions) if conditions else ''), params
+
+    def query(self, from_name: str | None = None, to_name: str | None = None, msg_type: HoppieMessage.MessageType | None = None, since: datetime | None = None, until: datetime | None = None, peek_id: int | None = None, min: int | None = None, mrn: int | None = None, limit: int | None = None) -> list[HoppieMessage]:
+        """Return stored messages matching all given criteria
+
+        Args:
+            from_name (str | None, optional): Sender station name. Defaults to None.
+            to_name (str | None, optional): Recipient station name. Defaults to None.
+            msg_type (HoppieMessage.MessageType | None, optional): Message type. Defaults to None.
+            since (datetime | None, optional): Earliest reception time (inclusive). Defaults to None.
+            until (datetime | None, optional): Latest reception time (exclusive). Defaults to None.
+            peek_id (int | None, optional): Peek message id. Defaults to None.
+            min (int | None, optional): CPDLC message identification number. Defaults to None.
+            mrn (int | None, optional): CPDLC message reference number. Defaults to None.
+            limit (int | None, optional): Maximum number of messages. Defaults to None (unlimited).
+
+        Returns:
+            list[HoppieMessage]: Matching messages, in reception order
+        """
+        where, params = self._where(from_name, to_name, msg_type, since, until, peek_id, min, mrn)
+        sql = f"SELECT from_name, to_name, type, packet FROM messages{where} ORDER BY received, id"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        result = []
+        for sender, recipient, type_name, packet in rows:
+            parser = self._parsers.get(recipient)
+            if parser is None:
+                parser = self._parsers[recipient] = HoppieMessageParser(recipient)
+            result.append(parser.parse({'from': sender, 'type': type_name, 'packet': packet}))
+        return result
+
+    def count(self, from_name: str | None = None, to_name: str | None = None, msg_type: HoppieMessage.MessageType | None = None, since: datetime | None = None, until: datetime | None = None, peek_id: int | None = None, min: int | None = None, mrn: int | None = None) -> int:
+        """Return number of stored messages matching all given criteria
+
+        Note:
+            See `query()` for the criteria.
+        """
+        where, params = self._where(from_name, to_name, msg_type, since, until, peek_id, min, mrn)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM messages{where}", params).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database
+        """
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MessageStore(path={self._path!r})"
@@ -0,0 +1,145 @@
+from .Messages import HoppieMessage, HoppieMessageParser
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from datetime import timedelta
+import enum
+import time
+
+class TimingStage(enum.StrEnum):
+    """Processing stage of an API call
+    """
+    ENCODE = 'encode'
+    HTTP = 'http'
+    TTFB = 'ttfb'
+    DECODE = 'decode'
+    PARSE_RESPONSE = 'parse_response'
+    PARSE_MESSAGE = 'parse_message'
+
+    def __repr__(self) -> str:
+        return f"TimingStage.{self.name}"
+
+class TimingEvent(object):
+    """TimingEvent(stage, duration[, message])
+
+    Time spent in a single processing stage
+    """
+    def __init__(self, stage: TimingStage, duration: timedelta, message: HoppieMessage | None = None):
+        """Create a new timing event
+
+        Args:
+            stage (TimingStage): Processing stage
+            duration (timedelta): Time spent in the stage
+            message (HoppieMessage | None, optional): Request message, or parsed message for `PARSE_MESSAGE`. Defaults to None.
+        """
+        self._stage = stage
+        self._duration = duration
+        self._message = message
+
+    def get_stage(self) -> TimingStage:
+        """Return processing stage
+        """
+        return self._stage
+
+    def get_duration(self) -> timedelta:
+        """Return time spent in the stage
+        """
+        return self._duration
+
+    def get_message(self) -> HoppieMessage | None:
+        """Return associated message
+        """
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"TimingEvent(stage={self._stage!r}, duration={self._duration!r}, message={self._message!r})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, TimingEvent) and (self._stage == __value._stage) and (self._duration == __value._duration) and (self._message == __value._message)
+
+TimingHook = Callable[[TimingEvent], None]
+
+class _StageTimer(object):
+    __slots__ = ('_hook', '_message', '_stage', '_start')
+
+    def __init__(self, hook: TimingHook, stage: TimingStage, message: HoppieMessage | None):
+        self._hook = hook
+        self._stage = stage
+        self._message = message
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *args) -> None:
+        self._hook(TimingEvent(self._stage, timedelta(seconds=time.perf_counter() - self._start), self._message))
+
+_NO_TIMER = nullcontext()
+
+def timed(hook: TimingHook | None, stage: TimingStage, message: HoppieMessage | None = None) -> AbstractContextManager[None]:
+    """Time the enclosed block and report it to a timing hook
+
+    Note:
+        Returns a shared no-op context manager if no hook is given.
+
+    Args:
+        hook (TimingHook | None): Timing hook
+        stage (TimingStage): Processing stage
+        message (HoppieMessage | None, optional): Associated message. Defaults to None.
+    """
+    return _NO_TIMER if hook is None else _StageTimer(hook, stage, message)
+
+class TimedMessageParser(HoppieMessageParser):
+    """TimedMessageParser(station, on_timing)
+
+    Message parser reporting the time spent on each parsed message
+    """
+    def __init__(self, station: str, on_timing: TimingHook):
+        """Instantiate message parser
+
+        Args:
+            station (str): Recipient station name
+            on_timing (TimingHook): Timing hook, receives a `PARSE_MESSAGE` event per parsed message
+        """
+        super().__init__(station)
+        self._on_timing = on_timing
+
+    def parse(self, data: dict) -> HoppieMessage:
+        start = time.perf_counter()
+        message = super().parse(data)
+        self._on_timing(TimingEvent(TimingStage.PARSE_MESSAGE, timedelta(seconds=time.perf_counter() - start), message))
+        return message
+
+    def __repr__(self) -> str:
+        return f"TimedMessageParser(station={self._station!r})"
+
+class TimingRecorder(object):
+    """TimingRecorder()
+
+    Timing hook accumulating the time spent per processing stage
+    """
+    def __init__(self):
+        self._totals: dict[TimingStage, timedelta] = {}
+        self._counts: dict[TimingStage, int] = {}
+
+    def __call__(self, event: TimingEvent) -> None:
+        stage = event.get_stage()
+        self._totals[stage] = self._totals.get(stage, timedelta(0)) + event.get_duration()
+        self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def get_totals(self) -> dict[TimingStage, timedelta]:
+        """Return accumulated time per stage
+        """
+        return dict(self._totals)
+
+    def get_counts(self) -> dict[TimingStage, int]:
+        """Return number of events per stage
+        """
+        return dict(self._counts)
+
+    def reset(self) -> None:
+        """Discard all accumulated timings
+        """
+        self._totals.clear()
+        self._counts.clear()
+
+    def __repr__(self) -> str:
+        return "TimingRecorder()"
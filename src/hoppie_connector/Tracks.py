@@ -0,0 +1,375 @@
+from .ADSC import AdscData, EarthRefGroup
+from .Messages import AdscMessage, AdscPeriodicReportMessage
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timedelta, UTC
+from types import MappingProxyType
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:  # pragma: no cover
+    raise ImportError('hoppie_connector.Tracks requires NumPy, install hoppie-connector[NumPy]') from e
+
+class _Track(object):
+    __slots__ = ('columns', 'size')
+
+    def __init__(self, capacity: int):
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in AdscTrackStore.COLUMNS.items()}
+        self.size = 0
+
+    def reserve(self, capacity: int) -> None:
+        for name, column in self.columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self.columns[name] = grown
+
+    def insert(self, row: dict[str, float]) -> None:
+        capacity = len(self.columns['timestamp'])
+        if self.size == capacity:
+            self.reserve(2 * capacity)
+        timestamps = self.columns['timestamp']
+        # Reports normally arrive in order; late reports are inserted in place
+        if (self.size == 0) or (row['timestamp'] >= timestamps[self.size - 1]):
+            for name, column in self.columns.items():
+                column[self.size] = row[name]
+        else:
+            index = int(np.searchsorted(timestamps[:self.size], row['timestamp'], side='right'))
+            for name, column in self.columns.items():
+                column[index + 1:self.size + 1] = column[index:self.size]
+                column[index] = row[name]
+        self.size += 1
+
+    def view(self, start: int, end: int) -> dict[str, np.ndarray]:
+        return {name: column[start:end].copy() for name, column in self.columns.items()}
+
+def resolve_report_time(timestamp: datetime, reference: datetime) -> datetime:
+    """Resolve day, hour and minute of an ADS-C report timestamp to a full date
+
+    Note:
+        ADS-C reports only carry day of month, hour and minute. The result is
+        the latest matching point in time which is not more than one day after
+        `reference`, in order to tolerate clock offsets between the stations.
+
+    Args:
+        timestamp (datetime): Report timestamp (day, hour, minute)
+        reference (datetime): Reception time
+
+    Returns:
+        datetime: Resolved timestamp (UTC)
+    """
+    reference = reference.astimezone(UTC)
+    limit = reference + timedelta(days=1)
+    year, month = limit.year, limit.month
+    while True:
+        try:
+            candidate = datetime(year, month, timestamp.day, timestamp.hour, timestamp.minute, tzinfo=UTC)
+        except ValueError:
+            candidate = None
+        if (candidate is not None) and (candidate <= limit):
+            return candidate
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+
+class AdscTrackStore(object):
+    """AdscTrackStore([initial_capacity])
+
+    Columnar store of ADS-C periodic reports per aircraft
+
+    Note:
+        Each aircraft station owns one NumPy array per column, which grows by
+        doubling. Rows are kept sorted by timestamp, so that time-range and
+        latest-position queries use binary search. Timestamps are stored as
+        POSIX seconds. Missing report groups are stored as NaN, and the vertical
+        rate as an integer code (see `VERTICAL_RATE_CODES`).
+    """
+    COLUMNS: Mapping[str, np.dtype] = MappingProxyType({
+        'timestamp': np.dtype(np.float64),
+        'latitude': np.dtype(np.float64),
+        'longitude': np.dtype(np.float64),
+        'altitude': np.dtype(np.float32),
+        'true_track': np.dtype(np.float32),
+        'ground_speed': np.dtype(np.float32),
+        'wind_direction': np.dtype(np.float32),
+        'wind_speed': np.dtype(np.float32),
+        'temperature': np.dtype(np.float32),
+        'vertical_rate': np.dtype(np.int8),
+    })
+    VERTICAL_RATE_CODES: Mapping[EarthRefGroup.VerticalRate | None, int] = MappingProxyType({
+        None: 0,
+        EarthRefGroup.VerticalRate.CLIMB: 1,
+        EarthRefGroup.VerticalRate.LEVEL: 2,
+        EarthRefGroup.VerticalRate.DESCENT: 3,
+    })
+    _INITIAL_CAPACITY: int = 64
+
+    def __init__(self, initial_capacity: int = _INITIAL_CAPACITY):
+        """Create a new track store
+
+        Args:
+            initial_capacity (int, optional): Number of reports preallocated per aircraft. Defaults to 64.
+        """
+        if initial_capacity < 1:
+            raise ValueError('Initial capacity must be a positive integer')
+        self._initial_capacity = initial_capacity
+        self._tracks: dict[str, _Track] = {}
+
+    def add(self, station: str, data: AdscData, reference: datetime | None = None) -> None:
+        """Add report data to the track of an aircraft
+
+        Args:
+            station (str): Aircraft station name
+            data (AdscData): Report data
+            reference (datetime | None, optional): Reception time used to resolve the report date. Defaults to None (now).
+        """
+        timestamp = resolve_report_time(data.basic.timestamp, reference if reference is not None else datetime.now(UTC))
+        earth_ref, meteo = data.earth_ref, data.meteo
+        row = {
+            'timestamp': timestamp.timestamp(),
+            'latitude': data.basic.position[0],
+            'longitude': data.basic.position[1],
+            'altitude': data.basic.altitude,
+            'true_track': earth_ref.true_track if earth_ref is not None else np.nan,
+            'ground_speed': earth_ref.ground_speed if earth_ref is not None else np.nan,
+            'wind_direction': meteo.wind[0] if meteo is not None else np.nan,
+            'wind_speed': meteo.wind[1] if meteo is not None else np.nan,
+            'temperature': meteo.temperature if meteo is not None else np.nan,
+            'vertical_rate': self.VERTICAL_RATE_CODES[earth_ref.vertical_rate if earth_ref is not None else None],
+        }
+        track = self._tracks.get(station)
+        if track is None:
+            track = self._tracks[station] = _Track(self._initial_capacity)
+        track.insert(row)
+
+    def add_message(self, message: AdscPeriodicReportMessage, reference: datetime | None = None) -> None:
+        """Add a received report message to the track of its sender
+
+        Args:
+            message (AdscPeriodicReportMessage): Report message
+            reference (datetime | None, optional): Reception time used to resolve the report date. Defaults to None (now).
+        """
+        self.add(message.get_from_name(), message.get_data(), reference)
+
+    def get_stations(self) -> list[str]:
+        """Return names of all tracked aircraft stations
+        """
+        return list(self._tracks)
+
+    def get_size(self, station: str) -> int:
+        """Return number of stored reports of an aircraft
+
+        Args:
+            station (str): Aircraft station name
+        """
+        track = self._tracks.get(station)
+        return track.size if track is not None else 0
+
+    def get_range(self, station: str, start: datetime | None = None, end: datetime | None = None) -> dict[str, np.ndarray]:
+        """Return reports of an aircraft within a time range
+
+        Args:
+            station (str): Aircraft station name
+            start (datetime | None, optional): Start time (inclusive). Defaults to None (first report).
+            end (datetime | None, optional): End time (inclusive). Defaults to None (last report).
+
+        Returns:
+            dict[str, np.ndarray]: Column arrays, sorted by timestamp
+        """
+        track = self._tracks.get(station)
+        if track is None:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        timestamps = track.columns['timestamp'][:track.size]
+        lo = int(np.searchsorted(timestamps, start.timestamp(), side='left')) if start is not None else 0
+        hi = int(np.searchsorted(timestamps, end.timestamp(), side='right')) if end is not None else track.size
+        return track.view(lo, max(lo, hi))
+
+    def get_latest(self, station: str, at: datetime | None = None) -> dict[str, float] | None:
+        """Return the latest report of an aircraft
+
+        Args:
+            station (str): Aircraft station name
+            at (datetime | None, optional): Return the latest report at or before this time. Defaults to None (last report).
+
+        Returns:
+            dict[str, float] | None: Column values, or None if no matching report exists
+        """
+        track = self._tracks.get(station)
+        if track is None:
+            return None
+        index = track.size
+        if at is not None:
+            index = int(np.searchsorted(track.columns['timestamp'][:track.size], at.timestamp(), side='right'))
+        if index == 0:
+            return None
+        return {name: column[index - 1].item() for name, column in track.columns.items()}
+
+    def get_latest_positions(self) -> dict[str, tuple[float, float, float]]:
+        """Return the latest position of every tracked aircraft
+
+        Returns:
+            dict[str, tuple[float, float, float]]: Latitude, longitude and altitude per aircraft station
+        """
+        return {
+            station: (track.columns['latitude'][track.size - 1].item(), track.columns['longitude'][track.size - 1].item(), track.columns['altitude'][track.size - 1].item())
+            for station, track in self._tracks.items()
+        }
+
+    def remove(self, station: str) -> None:
+        """Discard the track of an aircraft
+
+        Args:
+            station (str): Aircraft station name
+        """
+        del self._tracks[station]
+
+    def get_memory_usage(self) -> int:
+        """Return number of bytes allocated for column data
+        """
+        return sum(column.nbytes for track in self._tracks.values() for column in track.columns.values())
+
+    def __repr__(self) -> str:
+        return f"AdscTrackStore(initial_capacity={self._initial_capacity!r})"
+
+def decode_report_packets(packets: Iterable[str], reference: datetime | None = None) -> dict[str, np.ndarray]:
+    """Decode many ADS-C periodic report packets into column arrays
+
+    Note:
+        Decodes the same format as `AdscPeriodicReportMessage.from_packet`,
+        but without creating message or group objects per report. Columns
+        are named and typed like `AdscTrackStore.COLUMNS`, plus the
+        `acft_ident` string column. Missing optional groups are NaN, a
+        missing vertical rate is code 0 (see `AdscTrackStore.VERTICAL_RATE_CODES`).
+
+    Args:
+        packets (Iterable[str]): Packet strings, e.g. 'REPORT DLH123 011820 50.12345 -8.12345 35000'
+        reference (datetime | None, optional): Reception time used to resolve report dates. Defaults to None (now).
+
+    Returns:
+        dict[str, np.ndarray]: Column arrays in packet order
+    """
+    match = AdscPeriodicReportMessage._PACKET_PATTERN.match
+    rows = []
+    for index, packet in enumerate(packets):
+        m = match(packet)
+        if not m:
+            raise ValueError(f"Invalid ADS-C Periodic Report message format at index {index}")
+        rows.append(m.groups('nan'))
+    if not rows:
+        return {'acft_ident': np.empty(0, dtype=str)} | {name: np.empty(0, dtype=dtype) for name, dtype in AdscTrackStore.COLUMNS.items()}
+    (acft_ident, timestamp, latitude, longitude, altitude, true_track, ground_speed, wind_direction, wind_speed, temperature, vertical_rate) = zip(*rows)
+
+    # Reports carry few distinct timestamps, resolve each one only once
+    codes, inverse = np.unique(np.array(timestamp, dtype=np.int32), return_inverse=True)
+    invalid = (codes // 10000 < 1) | (codes // 10000 > 31) | (codes // 100 % 100 > 23) | (codes % 100 > 59)
+    if invalid.any():
+        raise ValueError(f"Invalid ADS-C Periodic Report timestamp at index {int(np.flatnonzero(invalid[inverse])[0])}")
+    reference = reference if reference is not None else datetime.now(UTC)
+    resolved = np.array([resolve_report_time(datetime(1900, 1, c // 10000, c // 100 % 100, c % 100), reference).timestamp() for c in codes.tolist()])
+
+    vertical_rate = np.array(vertical_rate)
+    vertical_rate_codes = np.zeros(len(rows), dtype=AdscTrackStore.COLUMNS['vertical_rate'])
+    for rate, code in AdscTrackStore.VERTICAL_RATE_CODES.items():
+        if rate is not None:
+            vertical_rate_codes[vertical_rate == rate.value] = code
+
+    columns = AdscTrackStore.COLUMNS
+    return {
+        'acft_ident': np.array(acft_ident),
+        'timestamp': resolved[inverse].astype(columns['timestamp']),
+        'latitude': np.array(latitude, dtype=columns['latitude']),
+        'longitude': np.array(longitude, dtype=columns['longitude']),
+        'altitude': np.array(altitude, dtype=columns['altitude']),
+        'true_track': np.array(true_track, dtype=columns['true_track']),
+        'ground_speed': np.array(ground_speed, dtype=columns['ground_speed']),
+        'wind_direction': np.array(wind_direction, dtype=columns['wind_direction']),
+        'wind_speed': np.array(wind_speed, dtype=columns['wind_speed']),
+        'temperature': np.array(temperature, dtype=columns['temperature']),
+        'vertical_rate': vertical_rate_codes,
+    }
+
+def _get_fixed_width_precision(values: np.ndarray, width: int) -> np.ndarray:
+    # Vectorized equivalent of the digit count in `get_fixed_width_float_str`
+    leading = np.where(values < 0.0, 2, 1)
+    scaled = np.abs(values)
+    pending = ~(scaled < 10.0)
+    while pending.any():
+        leading[pending] += 1
+        scaled[pending] /= 10.0
+        pending = ~(scaled < 10.0)
+    return np.where(leading >= width, 1, width - leading - 1)
+
+def encode_report_packets(acft_ident: npt.ArrayLike, timestamp: npt.ArrayLike, latitude: npt.ArrayLike, longitude: npt.ArrayLike, altitude: npt.ArrayLike,
+                          true_track: npt.ArrayLike | None = None, ground_speed: npt.ArrayLike | None = None,
+                          wind_direction: npt.ArrayLike | None = None, wind_speed: npt.ArrayLike | None = None, temperature: npt.ArrayLike | None = None,
+                          vertical_rate: npt.ArrayLike | None = None) -> list[str]:
+    """Encode many ADS-C periodic reports into packet strings
+
+    Note:
+        Output is identical to `AdscPeriodicReportMessage.get_packet_content`.
+        Columns are named like the result of `decode_report_packets`, so a
+        decoded batch can be encoded with `encode_report_packets(**columns)`.
+        An Earth Reference Group is only encoded if track and ground speed are
+        not NaN, a Meteorological Group only if it follows an Earth Reference
+        Group and no value is NaN, and a vertical rate only if it follows a
+        Meteorological Group and is not code 0.
+
+    Args:
+        acft_ident (npt.ArrayLike): Aircraft identifications
+        timestamp (npt.ArrayLike): Report times as POSIX seconds
+        latitude (npt.ArrayLike): Latitudes in degrees
+        longitude (npt.ArrayLike): Longitudes in degrees
+        altitude (npt.ArrayLike): Altitudes in ft
+        true_track (npt.ArrayLike | None, optional): True tracks in degrees. Defaults to None (no Earth Reference Group).
+        ground_speed (npt.ArrayLike | None, optional): Ground speeds in knots. Defaults to None (no Earth Reference Group).
+        wind_direction (npt.ArrayLike | None, optional): Wind directions in degrees. Defaults to None (no Meteorological Group).
+        wind_speed (npt.ArrayLike | None, optional): Wind speeds in knots. Defaults to None (no Meteorological Group).
+        temperature (npt.ArrayLike | None, optional): Temperatures in degrees Celsius. Defaults to None (no Meteorological Group).
+        vertical_rate (npt.ArrayLike | None, optional): Vertical rate codes (see `AdscTrackStore.VERTICAL_RATE_CODES`). Defaults to None (no vertical rate).
+
+    Returns:
+        list[str]: Packet strings
+    """
+    acft_ident = np.asarray(acft_ident, dtype=str)
+    size = len(acft_ident)
+    def _column(values: npt.ArrayLike | None, fill: float = np.nan) -> np.ndarray:
+        column = np.full(size, fill) if values is None else np.asarray(values, dtype=np.float64)
+        if column.shape != (size,):
+            raise ValueError('All columns must have the same length')
+        return column
+    timestamp, latitude, longitude, altitude = _column(timestamp), _column(latitude), _column(longitude), _column(altitude)
+    true_track, ground_speed = _column(true_track), _column(ground_speed)
+    wind_direction, wind_speed, temperature = _column(wind_direction), _column(wind_speed), _column(temperature)
+    vertical_rate = _column(vertical_rate, 0).astype(np.int64)
+    if not (np.isfinite(timestamp).all() and np.isfinite(latitude).all() and np.isfinite(longitude).all() and np.isfinite(altitude).all()):
+        raise ValueError('Basic Group values must be finite')
+
+    # Day, hour and minute of the timestamps as DDHHMM
+    minutes = np.floor(timestamp / 60.0).astype('datetime64[m]')
+    days = minutes.astype('datetime64[D]')
+    day = (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+    minute_of_day = (minutes - days).astype(np.int64)
+    timestamp_code = day * 10000 + (minute_of_day // 60) * 100 + minute_of_day % 60
+
+    rates = {code: rate.value for rate, code in AdscTrackStore.VERTICAL_RATE_CODES.items() if rate is not None}
+    if not np.isin(vertical_rate, [0] + list(rates)).all():
+        raise ValueError('Invalid vertical rate code')
+    rate_names = np.array([rates.get(code, '') for code in range(max(rates) + 1)])[vertical_rate]
+
+    # Rows are encoded in groups sharing the same set of optional groups
+    has_earth_ref = ~(np.isnan(true_track) | np.isnan(ground_speed))
+    has_meteo = has_earth_ref & ~(np.isnan(wind_direction) | np.isnan(wind_speed) | np.isnan(temperature))
+    has_vertical_rate = has_meteo & (vertical_rate != 0)
+    level = has_earth_ref.astype(np.int8) + has_meteo + has_vertical_rate
+
+    base = (acft_ident, timestamp_code, _get_fixed_width_precision(latitude, 8), latitude, _get_fixed_width_precision(longitude, 8), longitude, altitude)
+    formats = [
+        (AdscMessage.AdscMessageType.REPORT_PERIODIC + ' %s %06d %.*f %.*f %.0f', base),
+        (' %03.0f %.0f', (true_track, ground_speed)),
+        (' %03.0f/%.0f %.0f', (wind_direction, wind_speed, temperature)),
+        (' %s', (rate_names,)),
+    ]
+    packets = np.empty(size, dtype=object)
+    for n in np.unique(level).tolist():
+        rows = np.flatnonzero(level == n)
+        fmt = ''.join(f for f, _ in formats[:n + 1])
+        columns = [column[rows].tolist() for _, group in formats[:n + 1] for column in group]
+        packets[rows] = [fmt % values for values in zip(*columns)]
+    return packets.tolist()
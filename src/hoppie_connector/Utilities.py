@@ -3,6 +3,9 @@ import re
 ICAO_AIRPORT_REGEX: str = r'[A-Z]{4}'
 STATION_NAME_REGEX: str = r'[A-Z0-9]{3,8}'
 
+_ICAO_AIRPORT_PATTERN: re.Pattern = re.compile(r'^' + ICAO_AIRPORT_REGEX + r'$')
+_STATION_NAME_PATTERN: re.Pattern = re.compile(r'^' + STATION_NAME_REGEX + r'$')
+
 def is_valid_airport_code(designator: str) -> bool:
     """Simple helper function to determine validity of a 4-letter ICAO airport designator.
 
@@ -12,7 +15,7 @@ def is_valid_airport_code(designator: str) -> bool:
     Returns:
         bool: Designator validity
     """
-    return bool(re.match(r'^' + ICAO_AIRPORT_REGEX + r'$', designator))
+    return bool(_ICAO_AIRPORT_PATTERN.match(designator))
 
 def is_valid_station_name(name: str) -> bool:
     """Simple helper function to determine validity of a station name
@@ -23,7 +26,7 @@ def is_valid_station_name(name: str) -> bool:
     Returns:
         bool: Name validity
     """
-    return bool(re.match(r'^' + STATION_NAME_REGEX + r'$', name))
+    return bool(_STATION_NAME_PATTERN.match(name))
 
 def get_fixed_width_float_str(value: float, width: int) -> str:
     """Format floating-point value into fixed-width string
@@ -1,46 +1,211 @@
 from .Messages import HoppieMessage, ProgressMessage, PeekMessage, PollMessage, PingMessage, TelexMessage, AdscPeriodicContractRequestMessage, AdscContractCancellationMessage, AdscContractRejectionMessage, AdscPeriodicReportMessage, CpdlcMessage, HoppieMessageParser
-from .Responses import ErrorResponse, SuccessResponse, PollSuccessResponse, PingSuccessResponse, PeekSuccessResponse
+from .Responses import HoppieResponse, ErrorResponse, SuccessResponse, PollSuccessResponse, PingSuccessResponse, PeekSuccessResponse, PollResponseParser, PeekResponseParser
 from .ADSC import AdscData
 from .CPDLC import CpdlcResponseRequirement
-from .API import HoppieAPI
+from .API import HoppieAPI, AsyncHoppieAPI, SendResult
+from .Cursor import PeekCursor
+from .Dialogue import DialogueManager, MinAllocator
+from .Journal import ResponseJournal
+from .Presence import PresenceCache
+from .Resilience import CircuitBreaker, RetryPolicy
+from .Timing import TimedMessageParser, TimingHook, TimingStage, timed
 from datetime import timedelta, time
-from typing import TypeVar
+from time import perf_counter
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Self
+import asyncio
 import warnings
 
+if TYPE_CHECKING:
+    import aiohttp
+
 class HoppieError(Exception):
     pass
 class HoppieWarning(UserWarning):
     pass
 
+def _check_response[T](response: HoppieResponse, delay: timedelta, type: T) -> tuple[T, timedelta]:
+    if isinstance(response, ErrorResponse):
+        raise HoppieError(response.get_reason())
+    elif isinstance(response, type):
+        return response, delay
+    else:
+        raise TypeError('Response can not be represented by requested target type')
+
+def _parse_peek_data(p: HoppieMessageParser, response: PeekSuccessResponse) -> list[tuple[int, HoppieMessage]]:
+    for item in response.get_malformed_items():
+        warnings.warn(f"Malformed data item {item}", HoppieWarning)
+    result = []
+    for d in response.get_data():
+        try:
+            result.append((d['id'], p.parse(d)))
+        except ValueError as e:
+            warnings.warn(f"Unable to parse {d}: {e}", HoppieWarning)
+    return result
+
+def _parse_poll_data(p: HoppieMessageParser, response: PollSuccessResponse) -> list[HoppieMessage]:
+    for item in response.get_malformed_items():
+        warnings.warn(f"Malformed data item {item}", HoppieWarning)
+    result = []
+    for d in response.get_data():
+        try:
+            result.append(p.parse(d))
+        except ValueError as e:
+            warnings.warn(f"Unable to parse {d}: {e}", HoppieWarning)
+    return result
+
+def _iter_messages(p: HoppieMessageParser, items: Iterator[tuple[dict | None, str]]) -> Iterator[tuple[dict, HoppieMessage]]:
+    for d, raw in items:
+        if d is None:
+            warnings.warn(f"Malformed data item {raw}", HoppieWarning)
+            continue
+        try:
+            yield d, p.parse(d)
+        except ValueError as e:
+            warnings.warn(f"Unable to parse {d}: {e}", HoppieWarning)
+
+def _iter_peek_since(p: HoppieMessageParser, items: Iterator[tuple[dict | None, str]], cursor: PeekCursor, watermark: int | None) -> Iterator[tuple[int, HoppieMessage]]:
+    highest = watermark
+    def _new_items() -> Iterator[tuple[dict | None, str]]:
+        nonlocal highest
+        for d, raw in items:
+            if d is not None:
+                if (watermark is not None) and (d['id'] <= watermark):
+                    continue
+                highest = d['id'] if highest is None else max(highest, d['id'])
+            yield d, raw
+
+    for d, m in _iter_messages(p, _new_items()):
+        yield d['id'], m
+        # Consumer requested the next message, so the previous one is processed
+        cursor.advance(d['id'])
+    if highest is not None:
+        cursor.advance(highest)
+    cursor.save()
+
+def _get_cached_presence(cache: PresenceCache, stations: list[str] | str) -> tuple[list[str], dict[str, bool | None]]:
+    requested = [stations] if isinstance(stations, str) else list(stations)
+    return requested, {s: cache.is_online(s) for s in requested}
+
+def _merge_presence(cache: PresenceCache, requested: list[str], status: dict[str, bool | None], stale: list[str], online: list[str]) -> list[str]:
+    cache.update(stale, online)
+    online = set(online)
+    return [s for s in requested if (s in online if status[s] is None else status[s])]
+
+_PING_ALL_THRESHOLD: int = 4
+
+def _chunk_fleet(cache: PresenceCache | None, stations: Iterable[str]) -> tuple[list[str], dict[str, bool | None], list[list[str]]]:
+    requested = list(dict.fromkeys(stations))
+    status = {s: cache.is_online(s) for s in requested} if cache is not None else dict.fromkeys(requested)
+    stale = [s for s in requested if status[s] is None]
+    size = PingMessage.MAX_STATION_COUNT
+    return requested, status, [stale[i:i + size] for i in range(0, len(stale), size)]
+
+def _merge_fleet(cache: PresenceCache | None, requested: list[str], status: dict[str, bool | None], chunks: list[list[str]], online: list[str]) -> list[str]:
+    if cache is not None:
+        return _merge_presence(cache, requested, status, [s for c in chunks for s in c], online)
+    online = set(online)
+    return [s for s in requested if s in online]
+
+def _mark_senders_online(cache: PresenceCache, messages: Iterator[HoppieMessage]) -> Iterator[HoppieMessage]:
+    for m in messages:
+        cache.mark_online(m.get_from_name())
+        yield m
+
+def _register_inbound(dialogues: DialogueManager, messages: Iterator[HoppieMessage]) -> Iterator[HoppieMessage]:
+    for m in messages:
+        if isinstance(m, CpdlcMessage):
+            dialogues.add_inbound(m)
+        yield m
+
+def _register_peeked(dialogues: DialogueManager, cursor: PeekCursor, messages: Iterator[tuple[int, HoppieMessage]]) -> Iterator[tuple[int, HoppieMessage]]:
+    # Peeking returns the message history again, so only register messages above the watermark
+    watermark = cursor.get_last_id()
+    for i, m in messages:
+        if isinstance(m, CpdlcMessage) and ((watermark is None) or (i > watermark)):
+            dialogues.add_inbound(m)
+        cursor.advance(i)
+        yield i, m
+
 class HoppieConnector(object):
     """HoppieConnector(station_name, logon)
 
     Connector for interacting with Hoppie's ACARS service.
+
+    Note:
+        All calls share the connection pool of a single `HoppieAPI` instance.
+        Call `close()` or use the connector as a context manager to release it.
     """
 
-    def __init__(self, station_name: str, logon: str, url: str | None = None):
+    def __init__(self, station_name: str, logon: str, url: str | None = None, pool_maxsize: int = HoppieAPI._DEFAULT_POOL_MAXSIZE, timeout: float | None = None, peek_cursor: PeekCursor | None = None, on_timing: TimingHook | None = None, retry_policy: RetryPolicy | None = None, circuit_breaker: CircuitBreaker | None = None, presence_cache: PresenceCache | None = None, journal: ResponseJournal | None = None, dialogue_manager: DialogueManager | None = None, min_allocator: MinAllocator | None = None):
         """Create a new connector
 
         Note:
             Station name must be a valid ICAO flight number or 3-letter org code.
+            If `on_timing` is given, it receives the per-stage timings of
+            `HoppieAPI` as well as a `PARSE_MESSAGE` event per received message.
+            Sent CPDLC messages, and received ones as they are returned by the
+            poll and peek methods, are registered with the dialogue manager,
+            so that responses close the dialogues of sent requests and MINs
+            are only reused once answered or timed out. Peeked messages are
+            registered once per connector, by message id.
 
         Args:
             station_name (str): Own station name
             logon (str): API logon code
             url (str, optional): API URL. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of pooled keep-alive connections. Defaults to 10.
+            timeout (float | None, optional): Request timeout in seconds. Defaults to None.
+            peek_cursor (PeekCursor | None, optional): Watermark used by `peek_since()`. Defaults to None (in-memory cursor).
+            on_timing (TimingHook | None, optional): Per-stage timing hook. Defaults to None.
+            retry_policy (RetryPolicy | None, optional): Retry policy for failed requests. Defaults to None (no retries).
+            circuit_breaker (CircuitBreaker | None, optional): Endpoint circuit breaker. Defaults to None.
+            presence_cache (PresenceCache | None, optional): Station online status cache used by `ping()`. Defaults to None (always query).
+            journal (ResponseJournal | None, optional): Journal receiving all raw response bodies before they are parsed. Defaults to None.
+            dialogue_manager (DialogueManager | None, optional): Dialogue manager receiving all sent and received CPDLC messages. Defaults to None (dialogue manager of `min_allocator`).
+            min_allocator (MinAllocator | None, optional): MIN allocator used by `send_cpdlc()`. Defaults to None (own allocator, consulting `dialogue_manager`).
         """
         self._station = station_name
-        self._api = HoppieAPI(logon, url)
-
-    _T = TypeVar('_T')
-    def _connect(self, message: HoppieMessage, type: _T) -> tuple[_T, timedelta]:
-        response, delay = self._api.connect(message)
-        if isinstance(response, ErrorResponse): 
-            raise HoppieError(response.get_reason())
-        elif isinstance(response, type):
-            return response, delay
-        else:
-            raise TypeError('Response can not be represented by requested target type')
+        self._on_timing = on_timing
+        self._presence_cache = presence_cache
+        self._min_allocator = min_allocator if min_allocator is not None else MinAllocator(dialogues=dialogue_manager)
+        self._dialogue_manager = dialogue_manager if dialogue_manager is not None else self._min_allocator.get_dialogues()
+        # Highest peek id registered with the dialogue manager
+        self._dialogue_cursor = PeekCursor()
+        self._api = HoppieAPI(logon, url, pool_maxsize=pool_maxsize, timeout=timeout, on_timing=on_timing, retry_policy=retry_policy, circuit_breaker=circuit_breaker, journal=journal)
+        self._parser = HoppieMessageParser(station_name) if on_timing is None else TimedMessageParser(station_name, on_timing)
+        self._peek_parser = PeekResponseParser()
+        self._poll_parser = PollResponseParser()
+        self._peek_cursor = peek_cursor if peek_cursor is not None else PeekCursor()
+
+    def get_station_name(self) -> str:
+        """Return own station name
+        """
+        return self._station
+
+    def get_min_allocator(self) -> MinAllocator:
+        """Return MIN allocator used by `send_cpdlc()`
+        """
+        return self._min_allocator
+
+    def get_dialogue_manager(self) -> DialogueManager:
+        """Return dialogue manager receiving sent and received CPDLC messages
+        """
+        return self._dialogue_manager
+
+    def close(self) -> None:
+        """Close all pooled API connections
+        """
+        self._api.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _connect[T](self, message: HoppieMessage, type: T) -> tuple[T, timedelta]:
+        return _check_response(*self._api.connect(message), type)
 
     def peek(self) -> tuple[list[tuple[int, HoppieMessage]], timedelta]:
         """Peek all messages destined to own station
@@ -54,14 +219,9 @@ class HoppieConnector(object):
             tuple[list[tuple[int, HoppieMessage]], timedelta]: List of messages (id, content) and reponse delay
         """
         response, delay = self._connect(PeekMessage(self._station), PeekSuccessResponse)
-        result = []
-        p = HoppieMessageParser(self._station)
-        for d in response.get_data():
-            try:
-                result.append((d['id'], p.parse(d)))
-            except ValueError as e:
-                warnings.warn(f"Unable to parse {d}: {e}", HoppieWarning)
-        return result, delay
+        messages = _parse_peek_data(self._parser, response)
+        messages = list(_register_peeked(self._dialogue_manager, self._dialogue_cursor, messages))
+        return messages, delay
 
     def poll(self) -> tuple[list[HoppieMessage], timedelta]:
         """Poll for new messages destined to own station and mark them as relayed.
@@ -75,14 +235,83 @@ class HoppieConnector(object):
             tuple[list[HoppieMessage], timedelta]: List of messages and response delay
         """
         response, delay = self._connect(PollMessage(self._station), PollSuccessResponse)
-        result = []
-        p = HoppieMessageParser(self._station)
-        for d in response.get_data():
-            try:
-                result.append(p.parse(d))
-            except ValueError as e:
-                warnings.warn(f"Unable to parse {d}: {e}", HoppieWarning)
-        return result, delay
+        messages = _parse_poll_data(self._parser, response)
+        if self._presence_cache is not None:
+            messages = list(_mark_senders_online(self._presence_cache, messages))
+        messages = list(_register_inbound(self._dialogue_manager, messages))
+        return messages, delay
+
+    def _fetch_items(self, message: HoppieMessage, parser: PollResponseParser | PeekResponseParser) -> tuple[Iterator[tuple[dict | None, str]], timedelta]:
+        content, delay = self._api.fetch(message)
+        with timed(self._on_timing, TimingStage.PARSE_RESPONSE, message):
+            code, body = parser.split(content)
+        if code == HoppieResponse.ResponseCode.ERROR:
+            raise HoppieError(parser.parse(content).get_reason())
+        return parser.iter_data_items(body), delay
+
+    def iter_peek(self) -> tuple[Iterator[tuple[int, HoppieMessage]], timedelta]:
+        """Peek all messages destined to own station, parsing them on demand
+
+        Note:
+            The request is issued immediately and the full response body is
+            read and held in memory. Only the message objects are created
+            lazily: each data item is tokenized and parsed when the returned
+            iterator is advanced, so no list of parsed messages is built for
+            the whole message history. See `peek()`.
+
+        Returns:
+            tuple[Iterator[tuple[int, HoppieMessage]], timedelta]: Message iterator (id, content) and response delay
+        """
+        items, delay = self._fetch_items(PeekMessage(self._station), self._peek_parser)
+        messages = ((d['id'], m) for d, m in _iter_messages(self._parser, items))
+        messages = _register_peeked(self._dialogue_manager, self._dialogue_cursor, messages)
+        return messages, delay
+
+    def peek_since(self, last_id: int | None = None) -> tuple[Iterator[tuple[int, HoppieMessage]], timedelta]:
+        """Peek messages newer than the last processed message
+
+        Note:
+            Only messages with an id above the watermark are parsed and
+            returned. The watermark of the connector's `PeekCursor` advances
+            once the consumer requests the message following a returned one, and
+            is saved when the iterator is exhausted. Messages are therefore
+            delivered at least once across restarts.
+
+        Args:
+            last_id (int | None, optional): Watermark override. Defaults to None (use the cursor watermark).
+
+        Returns:
+            tuple[Iterator[tuple[int, HoppieMessage]], timedelta]: Message iterator (id, content) and response delay
+        """
+        watermark = last_id if last_id is not None else self._peek_cursor.get_last_id()
+        items, delay = self._fetch_items(PeekMessage(self._station), self._peek_parser)
+        messages = _iter_peek_since(self._parser, items, self._peek_cursor, watermark)
+        messages = _register_peeked(self._dialogue_manager, self._dialogue_cursor, messages)
+        return messages, delay
+
+    def get_peek_cursor(self) -> PeekCursor:
+        """Return watermark used by `peek_since()`
+        """
+        return self._peek_cursor
+
+    def iter_poll(self) -> tuple[Iterator[HoppieMessage], timedelta]:
+        """Poll for new messages destined to own station, parsing them on demand
+
+        Note:
+            The request is issued immediately and all returned messages are
+            marked as relayed, whether or not the iterator is consumed. The
+            full response body is held in memory; only the message objects
+            are parsed lazily as the iterator is advanced. See `poll()`.
+
+        Returns:
+            tuple[Iterator[HoppieMessage], timedelta]: Message iterator and response delay
+        """
+        items, delay = self._fetch_items(PollMessage(self._station), self._poll_parser)
+        messages = (m for _, m in _iter_messages(self._parser, items))
+        if self._presence_cache is not None:
+            messages = _mark_senders_online(self._presence_cache, messages)
+        messages = _register_inbound(self._dialogue_manager, messages)
+        return messages, delay
 
     def ping(self, stations: list[str] | str | None = None) -> tuple[list[str], timedelta]:
         """Check station online status.
@@ -90,6 +319,10 @@ class HoppieConnector(object):
         Note:
             Use `stations='*'` in order to retrieve a list of all currently online stations.
             An empty argument can serve as a connection check to the API server.
+            With a presence cache, only stations without a valid cache entry
+            are queried, and the delay is zero if none had to be queried. An
+            empty argument always reaches the server.
+            Senders of polled messages are recorded as online.
 
         Args:
             stations (list[str] | str | None, optional): List of stations to check. Defaults to None.
@@ -97,8 +330,49 @@ class HoppieConnector(object):
         Returns:
             tuple[list[str], timedelta]: List of online stations and response delay
         """
-        response, delay = self._connect(PingMessage(self._station, stations), PingSuccessResponse)
-        return response.get_stations(), delay
+        cache = self._presence_cache
+        if (cache is None) or not stations or (stations == '*'):
+            response, delay = self._connect(PingMessage(self._station, stations), PingSuccessResponse)
+            if cache is not None:
+                cache.update([], response.get_stations())
+            return response.get_stations(), delay
+
+        requested, status = _get_cached_presence(cache, stations)
+        stale = [s for s in requested if status[s] is None]
+        if not stale:
+            return [s for s in requested if status[s]], timedelta(0)
+        response, delay = self._connect(PingMessage(self._station, stale), PingSuccessResponse)
+        return _merge_presence(cache, requested, status, stale, response.get_stations()), delay
+
+    def ping_fleet(self, stations: Iterable[str], max_workers: int | None = None, all_threshold: int | None = _PING_ALL_THRESHOLD) -> tuple[list[str], timedelta]:
+        """Check online status of any number of stations
+
+        Note:
+            The station list is split into chunks of at most
+            `PingMessage.MAX_STATION_COUNT` (24) stations, which are checked
+            concurrently. If more than `all_threshold`
+            chunks would be needed, a single `ping('*')` request is issued
+            instead. Stations with a valid presence cache entry are not queried.
+
+        Args:
+            stations (Iterable[str]): Stations to check
+            max_workers (int | None, optional): Maximum number of concurrent requests. Defaults to None (connection pool size).
+            all_threshold (int | None, optional): Maximum number of chunked requests before switching to `ping('*')`. Defaults to 4. None disables the switch.
+
+        Returns:
+            tuple[list[str], timedelta]: List of online stations in input order and total elapsed time
+        """
+        start = perf_counter()
+        requested, status, chunks = _chunk_fleet(self._presence_cache, stations)
+        online = []
+        if (all_threshold is not None) and (len(chunks) > all_threshold):
+            online = self.ping('*')[0]
+        elif chunks:
+            for r in self._api.send_many([PingMessage(self._station, c) for c in chunks], max_workers, ordered=False):
+                if r.get_error() is not None:
+                    raise r.get_error()
+                online.extend(_check_response(r.get_response(), r.get_delay(), PingSuccessResponse)[0].get_stations())
+        return _merge_fleet(self._presence_cache, requested, status, chunks, online), timedelta(seconds=perf_counter() - start)
 
     def send_telex(self, to_name: str, message: str) -> timedelta:
         """Send a freetext message to recipient station.
@@ -188,16 +462,313 @@ class HoppieConnector(object):
         """
         return self._connect(AdscContractRejectionMessage(self._station, to_name), SuccessResponse)[1]
 
-    def send_cpdlc(self, to_name: str, min: int, rr: CpdlcResponseRequirement, message: str, mrn: int | None = None) -> timedelta:
+    def send_cpdlc(self, to_name: str, min: int | None, rr: CpdlcResponseRequirement, message: str, mrn: int | None = None) -> timedelta:
         """Send a CPDLC message to recipient station
 
         Note:
             Special restrictions regarding polling interval apply for airborne stations. See hoppie.nl docs.
             See CPDLC docs for further information about how to populate the data fields below.
 
+            If `min` is None, the next free MIN for the recipient is taken from
+            the connector's `MinAllocator`, so that concurrent callers never
+            send the same MIN. Sent messages are registered with the dialogue
+            manager.
+
+        Args:
+            to_name (str): Recipient station name
+            min (int | None): Message Identification Number, or None to allocate one
+            rr (CpdlcResponseRequirement): Response Requirement
+            message (str): Message element
+            mrn (int | None, optional): Message Reference Number. Defaults to None.
+
+        Returns:
+            timedelta: Response delay
+        """
+        allocated = min is None
+        if allocated:
+            min = self._min_allocator.allocate(to_name)
+        try:
+            msg = CpdlcMessage(self._station, to_name, min, rr, message, mrn)
+            delay = self._connect(msg, SuccessResponse)[1]
+            self._dialogue_manager.add_outbound(msg)
+            return delay
+        finally:
+            if allocated:
+                self._min_allocator.release(to_name, min)
+
+    def send_many(self, messages: Iterable[HoppieMessage], max_workers: int | None = None) -> list[SendResult]:
+        """Send many prepared messages concurrently
+
+        Note:
+            Messages to the same recipient station are delivered in input
+            order, while different stations are served in parallel. Error
+            responses are reported as `HoppieError` in the failing result
+            instead of being raised. See `HoppieAPI.send_many()`.
+
+        Args:
+            messages (Iterable[HoppieMessage]): Messages to send
+            max_workers (int | None, optional): Maximum number of concurrent requests. Defaults to None (connection pool size).
+
+        Returns:
+            list[SendResult]: Result of each message, in input order
+        """
+        results = self._api.send_many(messages, max_workers)
+        for i, r in enumerate(results):
+            response = r.get_response()
+            if isinstance(response, ErrorResponse):
+                results[i] = SendResult(r.get_message(), response, r.get_delay(), HoppieError(response.get_reason()))
+        return results
+
+class AsyncHoppieConnector(object):
+    """AsyncHoppieConnector(station_name, logon)
+
+    Awaitable connector for interacting with Hoppie's ACARS service.
+
+    Note:
+        Uses the same message builders and response parsers as
+        `HoppieConnector`. Requests are issued on the event loop through an
+        `aiohttp` session; several connectors may be driven concurrently from
+        a single event loop and share one `session` and connection pool.
+    """
+
+    def __init__(self, station_name: str, logon: str, url: str | None = None, pool_maxsize: int = HoppieAPI._DEFAULT_POOL_MAXSIZE, timeout: float | None = None, on_timing: TimingHook | None = None, retry_policy: RetryPolicy | None = None, circuit_breaker: CircuitBreaker | None = None, presence_cache: PresenceCache | None = None, journal: ResponseJournal | None = None, dialogue_manager: DialogueManager | None = None, min_allocator: MinAllocator | None = None, session: 'aiohttp.ClientSession | None' = None):
+        """Create a new connector
+
+        Note:
+            Station name must be a valid ICAO flight number or 3-letter org code.
+            Received CPDLC messages and MINs are handled as in `HoppieConnector`.
+
+        Args:
+            station_name (str): Own station name
+            logon (str): API logon code
+            url (str, optional): API URL. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of connections of the private session. Defaults to 10.
+            timeout (float | None, optional): Connect and read timeout in seconds. Defaults to None.
+            on_timing (TimingHook | None, optional): Per-stage timing hook. Defaults to None. See `HoppieConnector`.
+            retry_policy (RetryPolicy | None, optional): Retry policy for failed requests. Defaults to None (no retries).
+            circuit_breaker (CircuitBreaker | None, optional): Endpoint circuit breaker. Defaults to None.
+            presence_cache (PresenceCache | None, optional): Station online status cache used by `ping()`. Defaults to None (always query).
+            journal (ResponseJournal | None, optional): Journal receiving all raw response bodies before they are parsed. Defaults to None.
+            dialogue_manager (DialogueManager | None, optional): Dialogue manager receiving all sent and received CPDLC messages. Defaults to None (dialogue manager of `min_allocator`).
+            min_allocator (MinAllocator | None, optional): MIN allocator used by `send_cpdlc()`. Defaults to None (own allocator, consulting `dialogue_manager`).
+            session (aiohttp.ClientSession | None, optional): HTTP session shared with other connectors, left open by `close()`. Defaults to None (private session).
+        """
+        self._station = station_name
+        self._presence_cache = presence_cache
+        self._min_allocator = min_allocator if min_allocator is not None else MinAllocator(dialogues=dialogue_manager)
+        self._dialogue_manager = dialogue_manager if dialogue_manager is not None else self._min_allocator.get_dialogues()
+        # Highest peek id registered with the dialogue manager
+        self._dialogue_cursor = PeekCursor()
+        self._api = AsyncHoppieAPI(logon, url, pool_maxsize=pool_maxsize, timeout=timeout, on_timing=on_timing, retry_policy=retry_policy, circuit_breaker=circuit_breaker, journal=journal, session=session)
+        self._parser = HoppieMessageParser(station_name) if on_timing is None else TimedMessageParser(station_name, on_timing)
+
+    def get_station_name(self) -> str:
+        """Return own station name
+        """
+        return self._station
+
+    def get_min_allocator(self) -> MinAllocator:
+        """Return MIN allocator used by `send_cpdlc()`
+        """
+        return self._min_allocator
+
+    def get_dialogue_manager(self) -> DialogueManager:
+        """Return dialogue manager receiving sent and received CPDLC messages
+        """
+        return self._dialogue_manager
+
+    async def close(self) -> None:
+        """Close all pooled API connections of the private session
+        """
+        await self._api.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _connect[T](self, message: HoppieMessage, type: T) -> tuple[T, timedelta]:
+        return _check_response(*await self._api.connect(message), type)
+
+    async def peek(self) -> tuple[list[tuple[int, HoppieMessage]], timedelta]:
+        """Peek all messages destined to own station
+
+        Note:
+            See `HoppieConnector.peek()`.
+
+        Returns:
+            tuple[list[tuple[int, HoppieMessage]], timedelta]: List of messages (id, content) and reponse delay
+        """
+        response, delay = await self._connect(PeekMessage(self._station), PeekSuccessResponse)
+        messages = _parse_peek_data(self._parser, response)
+        messages = list(_register_peeked(self._dialogue_manager, self._dialogue_cursor, messages))
+        return messages, delay
+
+    async def poll(self) -> tuple[list[HoppieMessage], timedelta]:
+        """Poll for new messages destined to own station and mark them as relayed.
+
+        Note:
+            See `HoppieConnector.poll()`.
+
+        Returns:
+            tuple[list[HoppieMessage], timedelta]: List of messages and response delay
+        """
+        response, delay = await self._connect(PollMessage(self._station), PollSuccessResponse)
+        messages = _parse_poll_data(self._parser, response)
+        if self._presence_cache is not None:
+            messages = list(_mark_senders_online(self._presence_cache, messages))
+        messages = list(_register_inbound(self._dialogue_manager, messages))
+        return messages, delay
+
+    async def ping(self, stations: list[str] | str | None = None) -> tuple[list[str], timedelta]:
+        """Check station online status.
+
+        Note:
+            See `HoppieConnector.ping()`.
+
+        Args:
+            stations (list[str] | str | None, optional): List of stations to check. Defaults to None.
+
+        Returns:
+            tuple[list[str], timedelta]: List of online stations and response delay
+        """
+        cache = self._presence_cache
+        if (cache is None) or not stations or (stations == '*'):
+            response, delay = await self._connect(PingMessage(self._station, stations), PingSuccessResponse)
+            if cache is not None:
+                cache.update([], response.get_stations())
+            return response.get_stations(), delay
+
+        requested, status = _get_cached_presence(cache, stations)
+        stale = [s for s in requested if status[s] is None]
+        if not stale:
+            return [s for s in requested if status[s]], timedelta(0)
+        response, delay = await self._connect(PingMessage(self._station, stale), PingSuccessResponse)
+        return _merge_presence(cache, requested, status, stale, response.get_stations()), delay
+
+    async def ping_fleet(self, stations: Iterable[str], max_workers: int | None = None, all_threshold: int | None = _PING_ALL_THRESHOLD) -> tuple[list[str], timedelta]:
+        """Check online status of any number of stations
+
+        Note:
+            Chunks are checked concurrently, up to `max_workers` at once. If a
+            chunk fails, the first error is raised once all chunks have
+            completed. See `HoppieConnector.ping_fleet()`.
+
+        Args:
+            stations (Iterable[str]): Stations to check
+            max_workers (int | None, optional): Maximum number of concurrent requests. Defaults to None (connection pool size).
+            all_threshold (int | None, optional): Maximum number of chunked requests before switching to `ping('*')`. Defaults to 4. None disables the switch.
+
+        Returns:
+            tuple[list[str], timedelta]: List of online stations in input order and total elapsed time
+        """
+        if max_workers is None:
+            max_workers = self._api.get_pool_maxsize()
+        elif max_workers < 1:
+            raise ValueError('Number of workers must be a positive integer')
+        start = perf_counter()
+        requested, status, chunks = _chunk_fleet(self._presence_cache, stations)
+        online = []
+        if (all_threshold is not None) and (len(chunks) > all_threshold):
+            online = (await self.ping('*'))[0]
+        elif chunks:
+            semaphore = asyncio.Semaphore(max_workers)
+            async def _ping(chunk: list[str]) -> tuple[PingSuccessResponse, timedelta]:
+                async with semaphore:
+                    return await self._connect(PingMessage(self._station, chunk), PingSuccessResponse)
+            results = await asyncio.gather(*(_ping(c) for c in chunks), return_exceptions=True)
+            for r in results:
+                if isinstance(r, BaseException):
+                    raise r
+                online.extend(r[0].get_stations())
+        return _merge_fleet(self._presence_cache, requested, status, chunks, online), timedelta(seconds=perf_counter() - start)
+
+    async def send_telex(self, to_name: str, message: str) -> timedelta:
+        """Send a freetext message to recipient station.
+
+        Args:
+            to_name (str): Recipient station name
+            message (str): Message content
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(TelexMessage(self._station, to_name, message), SuccessResponse))[1]
+
+    async def send_progress(self, to_name: str, dep: str, arr: str, time_out: time, time_eta: time | None = None, time_off: time | None = None, time_on: time | None = None, time_in: time | None = None) -> timedelta:
+        """Send an OOOI progress report to recipient station
+
+        Args:
+            to_name (str): Recipient station name
+            dep (str): Departure airport ICAO code
+            arr (str): Arrival airport ICAO code
+            time_out (time): OUT time
+            time_eta (time | None, optional): Estimated time of arrival. Defaults to None.
+            time_off (time | None, optional): OFF time. Defaults to None.
+            time_on (time | None, optional): ON time. Defaults to None.
+            time_in (time | None, optional): IN time. Defaults to None.
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(ProgressMessage(self._station, to_name, dep, arr, time_out, time_eta, time_off, time_on, time_in), SuccessResponse))[1]
+
+    async def send_adsc_periodic_request(self, to_name: str, interval: int) -> timedelta:
+        """Send an ADS-C Periodic Contract Request to recipient station
+
+        Args:
+            to_name (str): Recipient station name
+            interval (int): Reporting interval in seconds (0 = Demand Contract Request)
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(AdscPeriodicContractRequestMessage(self._station, to_name, interval), SuccessResponse))[1]
+
+    async def send_adsc_periodic_report(self, to_name: str, data: AdscData) -> timedelta:
+        """Send an ADS-C Periodic Report message to recipient station
+
+        Args:
+            to_name (str): Recipient station name
+            data (AdscData): Report data
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(AdscPeriodicReportMessage(self._station, to_name, data), SuccessResponse))[1]
+
+    async def send_adsc_cancel(self, to_name: str) -> timedelta:
+        """Send an ADS-C Surveillance Contract cancellation message to recipient station
+
+        Args:
+            to_name (str): Recipient station name
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(AdscContractCancellationMessage(self._station, to_name), SuccessResponse))[1]
+
+    async def send_adsc_reject(self, to_name: str) -> timedelta:
+        """Send an ADS-C Surveillance Contract rejection message to recipient station
+
+        Args:
+            to_name (str): Recipient station name
+
+        Returns:
+            timedelta: Response delay
+        """
+        return (await self._connect(AdscContractRejectionMessage(self._station, to_name), SuccessResponse))[1]
+
+    async def send_cpdlc(self, to_name: str, min: int | None, rr: CpdlcResponseRequirement, message: str, mrn: int | None = None) -> timedelta:
+        """Send a CPDLC message to recipient station
+
+        Note:
+            See `HoppieConnector.send_cpdlc()`.
+
         Args:
             to_name (str): Recipient station name
-            min (int): Message Identification Number
+            min (int | None): Message Identification Number, or None to allocate one
             rr (CpdlcResponseRequirement): Response Requirement
             message (str): Message element
             mrn (int | None, optional): Message Reference Number. Defaults to None.
@@ -205,4 +776,14 @@ class HoppieConnector(object):
         Returns:
             timedelta: Response delay
         """
-        return self._connect(CpdlcMessage(self._station, to_name, min, rr, message, mrn), SuccessResponse)[1]
\ No newline at end of file
+        allocated = min is None
+        if allocated:
+            min = self._min_allocator.allocate(to_name)
+        try:
+            msg = CpdlcMessage(self._station, to_name, min, rr, message, mrn)
+            delay = (await self._connect(msg, SuccessResponse))[1]
+            self._dialogue_manager.add_outbound(msg)
+            return delay
+        finally:
+            if allocated:
+                self._min_allocator.release(to_name, min)
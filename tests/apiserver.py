@@ -0,0 +1,41 @@
+from aiohttp import test_utils, web
+import asyncio
+
+class ApiServer(object):
+    """ApiServer()
+
+    Local HTTP server answering API requests with scripted responses
+    """
+    def __init__(self):
+        self.requests: list[tuple[str, dict, dict]] = []
+        self._responses: list[tuple[dict, int | None, str, bool, float]] = []
+        app = web.Application()
+        app.router.add_route('*', '/api', self._handle)
+        self._server = test_utils.TestServer(app)
+
+    def add(self, body: str = 'ok', status: int | None = 200, match: dict | None = None, repeat: bool = False, delay: float = 0.0) -> None:
+        """Add a response to requests whose query contains `match`, answered once unless `repeat` is set, after `delay` seconds. A `status` of None drops the connection.
+        """
+        self._responses.append((match or {}, status, body, repeat, delay))
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        query = dict(request.query)
+        self.requests.append((request.method, query, dict(await request.post())))
+        for i, (match, status, body, repeat, delay) in enumerate(self._responses):
+            if all(query.get(k) == v for k, v in match.items()):
+                if not repeat:
+                    del self._responses[i]
+                await asyncio.sleep(delay)
+                if status is None:
+                    request.transport.close()
+                return web.Response(status=status or 500, text=body)
+        return web.Response(status=404)
+
+    async def start(self) -> str:
+        """Start serving and return the API URL
+        """
+        await self._server.start_server()
+        return str(self._server.make_url('/api'))
+
+    async def close(self) -> None:
+        await self._server.close()
@@ -64,6 +64,10 @@ class TestAdscMessageFromPacket(unittest.TestCase):
         actual = AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', 'REPORT CALLSIGN 011820 -10.0000 10.00000 3000 320 150 060/43 -5 DES')
         self.assertEqual(expected, actual)
     
+    def test_vertical_rate_type(self):
+        actual = AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', 'REPORT CALLSIGN 011820 -10.0000 10.00000 3000 320 150 060/43 -5 DES')
+        self.assertIs(EarthRefGroup.VerticalRate.DESCENT, actual.get_data().earth_ref.vertical_rate)
+
     def test_invalid_format(self):
         # BAVirtual Merlin (?) format with malformed timestamp and incorrect altitude
         self.assertRaises(ValueError, lambda: AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', 'REPORT CALLSIGN 1024 -10.0000 10.00000 30'))
@@ -77,6 +81,16 @@ class TestAdscPeriodicReportMessageRepresentation(unittest.TestCase):
         actual = eval(repr(expected))
         self.assertEqual(expected, actual)
 
+    def test_repr_vertical_rate(self):
+        expected = AdscPeriodicReportMessage('CALLSIGN', 'OPS', AdscData(
+            basic=BasicGroup(datetime.datetime(2000, 1, 1, 18, 20, tzinfo=datetime.UTC), (-10.0, 10.0), 3000),
+            flight_ident=FlightIdentGroup('CALLSIGN'),
+            earth_ref=EarthRefGroup(90.0, 450.0, EarthRefGroup.VerticalRate.DESCENT),
+            meteo=MeteoGroup((270.0, 35.0), -50.0)
+        ))
+        actual = eval(repr(expected))
+        self.assertEqual(expected, actual)
+
 class TestAdscPeriodicReportMessageComparison(unittest.TestCase):
     def test_same(self):
         value1 = AdscPeriodicReportMessage('CALLSIGN', 'OPS', AdscData(
@@ -107,4 +121,18 @@ class TestAdscPeriodicReportMessageComparison(unittest.TestCase):
             flight_ident=FlightIdentGroup('CALLSIGN'),
             meteo=MeteoGroup((120, 10), -5)
         ))
-        self.assertNotEqual(value1, value2)
\ No newline at end of file
+        self.assertNotEqual(value1, value2)
+
+class TestAdscPeriodicReportMessageSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        actual = AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', 'REPORT CALLSIGN 011820 -10.0000 10.00000 3000 320 150 060/43 -5 DES')
+        for value in [actual, actual.get_data(), actual.get_data().basic, actual.get_data().flight_ident, actual.get_data().earth_ref, actual.get_data().meteo]:
+            self.assertFalse(hasattr(value, '__dict__'))
+
+class TestAdscPeriodicReportMessageHash(unittest.TestCase):
+    def test_equal_hash(self):
+        packet = 'REPORT CALLSIGN 011820 -10.0000 10.00000 3000 320 150 060/43 -5 DES'
+        value1 = AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', packet)
+        value2 = AdscPeriodicReportMessage.from_packet('CALLSIGN', 'OPS', packet)
+        self.assertEqual(hash(value1), hash(value2))
+        self.assertEqual(1, len({value1, value2}))
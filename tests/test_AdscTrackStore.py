@@ -0,0 +1,226 @@
+from hoppie_connector.Tracks import AdscTrackStore, decode_report_packets, encode_report_packets, resolve_report_time
+from hoppie_connector.ADSC import AdscData, BasicGroup, EarthRefGroup, FlightIdentGroup, MeteoGroup
+from hoppie_connector.Messages import AdscPeriodicReportMessage
+from hoppie_connector.Utilities import get_fixed_width_float_str
+from datetime import datetime, UTC
+import math
+import unittest
+
+_REFERENCE = datetime(2024, 4, 3, 12, 0, tzinfo=UTC)
+
+def _data(minute: int, lat: float = 50.0, earth_ref: EarthRefGroup | None = None, meteo: MeteoGroup | None = None) -> AdscData:
+    return AdscData(BasicGroup(datetime(1900, 1, 3, 11, minute, tzinfo=UTC), (lat, 8.0), 35000.0), FlightIdentGroup('DLH123'), earth_ref, meteo)
+
+class TestResolveReportTime(unittest.TestCase):
+    def test_same_day(self):
+        self.assertEqual(datetime(2024, 4, 3, 11, 59, tzinfo=UTC), resolve_report_time(datetime(1900, 1, 3, 11, 59), _REFERENCE))
+
+    def test_next_day_tolerance(self):
+        self.assertEqual(datetime(2024, 4, 4, 11, 0, tzinfo=UTC), resolve_report_time(datetime(1900, 1, 4, 11, 0), _REFERENCE))
+
+    def test_previous_month(self):
+        self.assertEqual(datetime(2024, 3, 20, 0, 0, tzinfo=UTC), resolve_report_time(datetime(1900, 1, 20, 0, 0), _REFERENCE))
+
+    def test_skip_short_month(self):
+        self.assertEqual(datetime(2024, 1, 31, 0, 0, tzinfo=UTC), resolve_report_time(datetime(1900, 1, 31, 0, 0), datetime(2024, 3, 5, tzinfo=UTC)))
+
+    def test_previous_year(self):
+        self.assertEqual(datetime(2023, 12, 31, 23, 59, tzinfo=UTC), resolve_report_time(datetime(1900, 1, 31, 23, 59), datetime(2024, 1, 1, tzinfo=UTC)))
+
+class TestDecodeReportPackets(unittest.TestCase):
+    _PACKETS: list[str] = [
+        'REPORT DLH123 031110 50.00000 8.00000 35000 270 450 280/45 -54 CLB',
+        'REPORT DLH123 031120 50.50000 8.50000 36000 271 451 281/46 -55',
+        'REPORT BAW9 031105 -10.1234 -120.123 3000 090 120',
+        'REPORT AFR1 021900 1.00000 2.00000 100',
+    ]
+
+    def test_columns(self):
+        actual = decode_report_packets(self._PACKETS, _REFERENCE)
+        self.assertEqual(['acft_ident'] + list(AdscTrackStore.COLUMNS), list(actual))
+        for name, dtype in AdscTrackStore.COLUMNS.items():
+            self.assertEqual(dtype, actual[name].dtype)
+        self.assertEqual(['DLH123', 'DLH123', 'BAW9', 'AFR1'], actual['acft_ident'].tolist())
+        self.assertEqual([datetime(2024, 4, 3, 11, 10, tzinfo=UTC).timestamp(), datetime(2024, 4, 3, 11, 20, tzinfo=UTC).timestamp(),
+                          datetime(2024, 4, 3, 11, 5, tzinfo=UTC).timestamp(), datetime(2024, 4, 2, 19, 0, tzinfo=UTC).timestamp()], actual['timestamp'].tolist())
+        self.assertEqual([50.0, 50.5, -10.1234, 1.0], actual['latitude'].tolist())
+        self.assertEqual([8.0, 8.5, -120.123, 2.0], actual['longitude'].tolist())
+        self.assertEqual([35000, 36000, 3000, 100], actual['altitude'].tolist())
+        self.assertEqual([270, 271, 90], actual['true_track'].tolist()[:3])
+        self.assertEqual([450, 451, 120], actual['ground_speed'].tolist()[:3])
+        self.assertEqual([280, 281], actual['wind_direction'].tolist()[:2])
+        self.assertEqual([45, 46], actual['wind_speed'].tolist()[:2])
+        self.assertEqual([-54, -55], actual['temperature'].tolist()[:2])
+        self.assertEqual([1, 0, 0, 0], actual['vertical_rate'].tolist())
+
+    def test_missing_groups(self):
+        actual = decode_report_packets(self._PACKETS, _REFERENCE)
+        self.assertEqual([False, False, False, True], [math.isnan(v) for v in actual['true_track'].tolist()])
+        self.assertEqual([False, False, True, True], [math.isnan(v) for v in actual['temperature'].tolist()])
+
+    def test_matches_track_store(self):
+        store = AdscTrackStore()
+        for packet in self._PACKETS[:2]:
+            store.add_message(AdscPeriodicReportMessage.from_packet('DLH123', 'OPS', packet), _REFERENCE)
+        actual = decode_report_packets(self._PACKETS[:2], _REFERENCE)
+        expected = store.get_range('DLH123')
+        for name in AdscTrackStore.COLUMNS:
+            self.assertEqual(expected[name].tolist(), actual[name].tolist())
+
+    def test_empty(self):
+        actual = decode_report_packets([], _REFERENCE)
+        self.assertEqual(['acft_ident'] + list(AdscTrackStore.COLUMNS), list(actual))
+        self.assertTrue(all(len(column) == 0 for column in actual.values()))
+
+    def test_default_reference(self):
+        self.assertEqual(1, len(decode_report_packets(self._PACKETS[:1])['timestamp']))
+
+    def test_invalid_packet(self):
+        self.assertRaisesRegex(ValueError, 'index 1', lambda: decode_report_packets([self._PACKETS[0], 'REPORT DLH123 0311']))
+
+    def test_invalid_timestamp(self):
+        for timestamp in ['009999', '001820', '321820', '012420', '011860']:
+            with self.subTest(timestamp=timestamp):
+                packets = [self._PACKETS[0], self._PACKETS[0], f"REPORT DLH123 {timestamp} 50.12345 -8.12345 35000"]
+                self.assertRaisesRegex(ValueError, 'timestamp at index 2', lambda: decode_report_packets(packets))
+
+class TestEncodeReportPackets(unittest.TestCase):
+    def test_matches_message(self):
+        data = [
+            _data(10, lat=-0.0, earth_ref=EarthRefGroup(5.0, 450.0, EarthRefGroup.VerticalRate.DESCENT), meteo=MeteoGroup((5.0, 45.0), -0.4)),
+            _data(11, lat=9.9999999, earth_ref=EarthRefGroup(270.0, 450.0, EarthRefGroup.VerticalRate.LEVEL)),
+            _data(12, lat=-89.123456789, earth_ref=EarthRefGroup(270.0, 450.0), meteo=MeteoGroup((280.0, 45.0), -54.0)),
+            _data(13, lat=-1e-7, meteo=MeteoGroup((280.0, 45.0), -54.0)),
+        ]
+        expected = [AdscPeriodicReportMessage('DLH123', 'OPS', d).get_packet_content() for d in data]
+        nan = float('nan')
+        actual = encode_report_packets(
+            acft_ident=['DLH123'] * 4,
+            timestamp=[datetime(2024, 4, 3, 11, m, 59, tzinfo=UTC).timestamp() for m in range(10, 14)],
+            latitude=[d.basic.position[0] for d in data],
+            longitude=[d.basic.position[1] for d in data],
+            altitude=[d.basic.altitude for d in data],
+            true_track=[5.0, 270.0, 270.0, nan],
+            ground_speed=[450.0, 450.0, 450.0, nan],
+            wind_direction=[5.0, nan, 280.0, 280.0],
+            wind_speed=[45.0, nan, 45.0, 45.0],
+            temperature=[-0.4, nan, -54.0, -54.0],
+            vertical_rate=[3, 2, 0, 0]
+        )
+        self.assertEqual(expected, actual)
+
+    def test_fixed_width_overflow(self):
+        actual = encode_report_packets(['DLH123'], [0.0], [1234567.8], [-99999999.9], [100.0])
+        self.assertEqual([f"REPORT DLH123 010000 {get_fixed_width_float_str(1234567.8, 8)} {get_fixed_width_float_str(-99999999.9, 8)} 100"], actual)
+
+    def test_round_trip(self):
+        packets = [
+            'REPORT DLH123 031110 50.00000 8.000000 35000 270 450 280/45 -54 CLB',
+            'REPORT BAW9 031105 -10.1234 -120.123 3000 090 120',
+            'REPORT AFR1 021900 1.000000 2.000000 100',
+        ]
+        self.assertEqual(packets, encode_report_packets(**decode_report_packets(packets, _REFERENCE)))
+
+    def test_empty(self):
+        self.assertEqual([], encode_report_packets([], [], [], [], []))
+
+    def test_invalid_length(self):
+        self.assertRaises(ValueError, lambda: encode_report_packets(['DLH123'], [0.0], [1.0, 2.0], [1.0], [100.0]))
+
+    def test_invalid_basic_group(self):
+        self.assertRaises(ValueError, lambda: encode_report_packets(['DLH123'], [0.0], [float('nan')], [1.0], [100.0]))
+
+    def test_invalid_vertical_rate(self):
+        self.assertRaises(ValueError, lambda: encode_report_packets(['DLH123'], [0.0], [1.0], [1.0], [100.0], [1.0], [1.0], [1.0], [1.0], [1.0], [4]))
+
+class TestAdscTrackStore(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = AdscTrackStore(initial_capacity=2)
+
+    def test_empty(self):
+        self.assertEqual([], self._UUT.get_stations())
+        self.assertEqual(0, self._UUT.get_size('DLH123'))
+        self.assertIsNone(self._UUT.get_latest('DLH123'))
+        self.assertEqual(0, len(self._UUT.get_range('DLH123')['timestamp']))
+        self.assertEqual({}, self._UUT.get_latest_positions())
+        self.assertEqual(0, self._UUT.get_memory_usage())
+
+    def test_columns(self):
+        data = _data(10, earth_ref=EarthRefGroup(270.0, 450.0, EarthRefGroup.VerticalRate.CLIMB), meteo=MeteoGroup((280.0, 45.0), -54.0))
+        self._UUT.add('DLH123', data, _REFERENCE)
+        latest = self._UUT.get_latest('DLH123')
+        self.assertEqual(datetime(2024, 4, 3, 11, 10, tzinfo=UTC).timestamp(), latest['timestamp'])
+        self.assertEqual((50.0, 8.0, 35000.0), (latest['latitude'], latest['longitude'], latest['altitude']))
+        self.assertEqual((270.0, 450.0), (latest['true_track'], latest['ground_speed']))
+        self.assertEqual((280.0, 45.0, -54.0), (latest['wind_direction'], latest['wind_speed'], latest['temperature']))
+        self.assertEqual(1, latest['vertical_rate'])
+
+    def test_missing_groups(self):
+        self._UUT.add('DLH123', _data(10), _REFERENCE)
+        latest = self._UUT.get_latest('DLH123')
+        for name in ['true_track', 'ground_speed', 'wind_direction', 'wind_speed', 'temperature']:
+            self.assertTrue(math.isnan(latest[name]))
+        self.assertEqual(0, latest['vertical_rate'])
+
+    def test_add_message(self):
+        msg = AdscPeriodicReportMessage.from_packet('DLH123', 'OPS', 'REPORT DLH123 031110 50.00000 8.00000 35000 270 450 280/45 -54 LVL')
+        self._UUT.add_message(msg, _REFERENCE)
+        self.assertEqual(['DLH123'], self._UUT.get_stations())
+        self.assertEqual(2, self._UUT.get_latest('DLH123')['vertical_rate'])
+
+    def test_growth(self):
+        for minute in range(10):
+            self._UUT.add('DLH123', _data(minute, lat=float(minute)), _REFERENCE)
+        self.assertEqual(10, self._UUT.get_size('DLH123'))
+        self.assertEqual(list(range(10)), self._UUT.get_range('DLH123')['latitude'].tolist())
+        self.assertEqual(16 * sum(dt.itemsize for dt in AdscTrackStore.COLUMNS.values()), self._UUT.get_memory_usage())
+
+    def test_out_of_order(self):
+        for minute in [0, 2, 4, 1, 3, 4]:
+            self._UUT.add('DLH123', _data(minute, lat=float(minute)), _REFERENCE)
+        self.assertEqual([0, 1, 2, 3, 4, 4], self._UUT.get_range('DLH123')['latitude'].tolist())
+
+    def test_range(self):
+        for minute in range(10):
+            self._UUT.add('DLH123', _data(minute, lat=float(minute)), _REFERENCE)
+        actual = self._UUT.get_range('DLH123', datetime(2024, 4, 3, 11, 3, tzinfo=UTC), datetime(2024, 4, 3, 11, 5, tzinfo=UTC))
+        self.assertEqual([3, 4, 5], actual['latitude'].tolist())
+        self.assertEqual([7, 8, 9], self._UUT.get_range('DLH123', start=datetime(2024, 4, 3, 11, 7, tzinfo=UTC))['latitude'].tolist())
+        self.assertEqual([0, 1], self._UUT.get_range('DLH123', end=datetime(2024, 4, 3, 11, 1, 30, tzinfo=UTC))['latitude'].tolist())
+        self.assertEqual([], self._UUT.get_range('DLH123', datetime(2024, 4, 3, 11, 5, tzinfo=UTC), datetime(2024, 4, 3, 11, 3, tzinfo=UTC))['latitude'].tolist())
+
+    def test_range_is_copy(self):
+        self._UUT.add('DLH123', _data(0), _REFERENCE)
+        self._UUT.get_range('DLH123')['latitude'][0] = 0.0
+        self.assertEqual(50.0, self._UUT.get_latest('DLH123')['latitude'])
+
+    def test_latest_at(self):
+        for minute in range(0, 10, 2):
+            self._UUT.add('DLH123', _data(minute, lat=float(minute)), _REFERENCE)
+        self.assertEqual(4.0, self._UUT.get_latest('DLH123', datetime(2024, 4, 3, 11, 5, tzinfo=UTC))['latitude'])
+        self.assertEqual(4.0, self._UUT.get_latest('DLH123', datetime(2024, 4, 3, 11, 4, tzinfo=UTC))['latitude'])
+        self.assertIsNone(self._UUT.get_latest('DLH123', datetime(2024, 4, 3, 10, 0, tzinfo=UTC)))
+
+    def test_latest_positions(self):
+        self._UUT.add('DLH1', _data(0, lat=1.0), _REFERENCE)
+        self._UUT.add('DLH1', _data(1, lat=2.0), _REFERENCE)
+        self._UUT.add('DLH2', _data(0, lat=3.0), _REFERENCE)
+        self.assertEqual({'DLH1': (2.0, 8.0, 35000.0), 'DLH2': (3.0, 8.0, 35000.0)}, self._UUT.get_latest_positions())
+
+    def test_remove(self):
+        self._UUT.add('DLH1', _data(0), _REFERENCE)
+        self._UUT.remove('DLH1')
+        self.assertEqual([], self._UUT.get_stations())
+
+    def test_default_reference(self):
+        self._UUT.add('DLH1', _data(0))
+        self.assertEqual(1, self._UUT.get_size('DLH1'))
+
+class TestAdscTrackStoreErrorHandling(unittest.TestCase):
+    def test_invalid_capacity(self):
+        self.assertRaises(ValueError, lambda: AdscTrackStore(initial_capacity=0))
+
+class TestAdscTrackStoreRepresentation(unittest.TestCase):
+    def test_repr(self):
+        self.assertEqual('AdscTrackStore(initial_capacity=8)', repr(eval(repr(AdscTrackStore(8)))))
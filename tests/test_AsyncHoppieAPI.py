@@ -0,0 +1,188 @@
+from hoppie_connector.API import AsyncHoppieAPI
+from hoppie_connector.Messages import PeekMessage, PollMessage, TelexMessage
+from hoppie_connector.Responses import SuccessResponse, PeekSuccessResponse
+from hoppie_connector.Resilience import CircuitBreaker, CircuitOpenError, HTTPStatusError, RetryPolicy
+from hoppie_connector.Timing import TimingStage
+from apiserver import ApiServer
+from datetime import timedelta
+import aiohttp
+import asyncio
+import unittest
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self) -> float:
+        return self.now
+
+class TestAsyncHoppieApiConnect(unittest.IsolatedAsyncioTestCase):
+    _LOGON: str = '1234abcd'
+
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._url = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_connect_get(self):
+        self._server.add('ok {1 CALLSIGN telex {MESSAGE}}')
+        async with AsyncHoppieAPI(self._LOGON, self._url) as api:
+            response, delay = await api.connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(PeekSuccessResponse([{'id': 1, 'from': 'CALLSIGN', 'type': 'telex', 'packet': 'MESSAGE'}]), response)
+        self.assertGreater(delay, timedelta(0))
+        self.assertListEqual([('GET', {'logon': self._LOGON, 'from': 'CALLSIGN', 'to': 'SERVER', 'type': 'peek'}, {})], self._server.requests)
+
+    async def test_connect_post(self):
+        self._server.add('ok')
+        async with AsyncHoppieAPI(self._LOGON, self._url) as api:
+            response, _ = await api.connect(TelexMessage('CALLSIGN', 'OPS', 'MESSAGE'))
+        self.assertEqual(SuccessResponse(), response)
+        self.assertListEqual([('POST', {'logon': self._LOGON, 'from': 'CALLSIGN', 'to': 'OPS', 'type': 'telex'}, {'packet': 'MESSAGE'})], self._server.requests)
+
+    async def test_connect_poll(self):
+        self._server.add('ok')
+        async with AsyncHoppieAPI(self._LOGON, self._url) as api:
+            await api.connect(PollMessage('CALLSIGN'))
+        self.assertListEqual([('POST', {'logon': self._LOGON, 'from': 'CALLSIGN', 'to': 'SERVER', 'type': 'poll'}, {})], self._server.requests)
+
+    async def test_concurrent_connect(self):
+        self._server.add('ok', repeat=True)
+        async with AsyncHoppieAPI(self._LOGON, self._url, pool_maxsize=2) as api:
+            results = await asyncio.gather(*[api.connect(PollMessage(f"STN{i}")) for i in range(5)])
+        self.assertEqual(5, len(results))
+        self.assertEqual(5, len(self._server.requests))
+
+    async def test_http_error(self):
+        self._server.add('', status=500)
+        async with AsyncHoppieAPI(self._LOGON, self._url) as api:
+            with self.assertRaises(HTTPStatusError):
+                await api.connect(PeekMessage('CALLSIGN'))
+
+    async def test_invalid_connect_msg(self):
+        api = AsyncHoppieAPI(self._LOGON, self._url)
+        with self.assertRaises(ValueError):
+            await api.connect(None)
+        await api.close()
+
+    async def test_invalid_pool_size(self):
+        with self.assertRaises(ValueError):
+            AsyncHoppieAPI(self._LOGON, self._url, pool_maxsize=0)
+
+    async def test_timing(self):
+        self._server.add('ok')
+        events = []
+        async with AsyncHoppieAPI(self._LOGON, self._url, on_timing=events.append) as api:
+            await api.connect(PeekMessage('CALLSIGN'))
+        self.assertListEqual([TimingStage.ENCODE, TimingStage.HTTP, TimingStage.TTFB, TimingStage.DECODE, TimingStage.PARSE_RESPONSE], [e.get_stage() for e in events])
+
+class TestAsyncHoppieApiSession(unittest.IsolatedAsyncioTestCase):
+    _URL: str = 'http://example.com/1'
+
+    def test_pool_maxsize(self):
+        self.assertEqual(2, AsyncHoppieAPI('logon', self._URL, pool_maxsize=2).get_pool_maxsize())
+
+    async def test_close_unused(self):
+        api = AsyncHoppieAPI('logon', self._URL)
+        await api.close()
+        self.assertIsNone(api._session)
+
+    async def test_close_reopens(self):
+        api = AsyncHoppieAPI('logon', self._URL)
+        session = api._get_session()
+        await api.close()
+        self.assertTrue(session.closed)
+        self.assertIsNot(session, api._get_session())
+        await api.close()
+
+    async def test_shared_session(self):
+        async with aiohttp.ClientSession() as session:
+            api1 = AsyncHoppieAPI('logon1', self._URL, session=session)
+            api2 = AsyncHoppieAPI('logon2', self._URL, session=session)
+            self.assertIs(api1._get_session(), api2._get_session())
+            await api1.close()
+            await api2.close()
+            self.assertFalse(session.closed)
+
+class TestAsyncHoppieApiResilience(unittest.IsolatedAsyncioTestCase):
+    _RETRY_POLICY: RetryPolicy = RetryPolicy(backoff=timedelta(0))
+
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._url = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_retry_transient(self):
+        self._server.add('', status=503)
+        self._server.add(status=None)
+        self._server.add('ok')
+        async with AsyncHoppieAPI('logon', self._url, retry_policy=self._RETRY_POLICY) as api:
+            response, _ = await api.connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(PeekSuccessResponse([]), response)
+        self.assertEqual(3, len(self._server.requests))
+
+    async def test_no_retry_after_send(self):
+        self._server.add(status=None)
+        async with AsyncHoppieAPI('logon', self._url, retry_policy=self._RETRY_POLICY) as api:
+            with self.assertRaises(aiohttp.ServerDisconnectedError):
+                await api.connect(PollMessage('CALLSIGN'))
+        self.assertEqual(1, len(self._server.requests))
+
+    async def test_no_resend_shared_session(self):
+        self._server.add('ok')
+        self._server.add(status=None)
+        async with aiohttp.ClientSession() as session:
+            api = AsyncHoppieAPI('logon', self._url, session=session)
+            await api.connect(PollMessage('CALLSIGN'))
+            # Reuses the kept-alive connection, which is dropped by the server
+            with self.assertRaises(aiohttp.ServerDisconnectedError):
+                await api.connect(PollMessage('CALLSIGN'))
+        self.assertEqual(2, len(self._server.requests))
+
+    async def test_circuit_breaker(self):
+        self._server.add('', status=500)
+        async with AsyncHoppieAPI('logon', self._url, circuit_breaker=CircuitBreaker(failure_threshold=1)) as api:
+            with self.assertRaises(HTTPStatusError):
+                await api.connect(PeekMessage('CALLSIGN'))
+            with self.assertRaises(CircuitOpenError):
+                await api.connect(PeekMessage('CALLSIGN'))
+
+    async def test_circuit_breaker_success(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        self._server.add('', status=500)
+        self._server.add('ok')
+        async with AsyncHoppieAPI('logon', self._url, circuit_breaker=breaker) as api:
+            with self.assertRaises(HTTPStatusError):
+                await api.connect(PeekMessage('CALLSIGN'))
+            await api.connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.get_state())
+        self.assertEqual(0, breaker._failures)
+
+    async def test_circuit_breaker_cancelled_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=timedelta(seconds=30), clock=clock)
+        breaker.record_failure()
+        clock.now += 30.0
+        self._server.add('ok', delay=1.0)
+        self._server.add('ok')
+        async with AsyncHoppieAPI('logon', self._url, circuit_breaker=breaker) as api:
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(api.connect(PeekMessage('CALLSIGN')), 0.1)
+            await api.connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.get_state())
+
+class TestAsyncHoppieApiComparison(unittest.TestCase):
+    def test_equal_content(self):
+        self.assertEqual(AsyncHoppieAPI('logon', 'url'), AsyncHoppieAPI('logon', 'url'))
+
+    def test_differing_logon(self):
+        self.assertNotEqual(AsyncHoppieAPI('logon1', 'url'), AsyncHoppieAPI('logon2', 'url'))
+
+class TestAsyncHoppieApiRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = AsyncHoppieAPI('logon', 'url', pool_maxsize=2, timeout=1.0, on_timing=print)
+        actual = eval(repr(expected))
+        self.assertEqual(expected, actual)
+        self.assertNotIn('on_timing', repr(expected))
@@ -0,0 +1,281 @@
+from hoppie_connector import AsyncHoppieConnector, HoppieError, HoppieWarning
+from hoppie_connector.Journal import JournalReader, ResponseJournal
+from hoppie_connector.Messages import TelexMessage
+from hoppie_connector.Responses import PingSuccessResponse
+from hoppie_connector.Presence import PresenceCache
+from hoppie_connector.ADSC import AdscData, BasicGroup, FlightIdentGroup
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import DialogueManager
+from apiserver import ApiServer
+from datetime import timedelta, time, datetime
+import asyncio
+import tempfile
+import unittest
+
+class TestAsyncHoppieConnectorSuccess(unittest.IsolatedAsyncioTestCase):
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+        self._UUT = AsyncHoppieConnector(self._STATION, self._LOGON, self._URL)
+
+    async def asyncTearDown(self) -> None:
+        await self._UUT.close()
+        await self._server.close()
+
+    def _expect_get(self, params: dict, body: str = 'ok'):
+        self._server.add(body, match={'logon': self._LOGON, 'from': self._STATION, **params})
+
+    def test_get_station_name(self):
+        self.assertEqual(self._STATION, self._UUT.get_station_name())
+
+    async def test_peek(self):
+        self._expect_get({'to': 'SERVER', 'type': 'peek'}, 'ok {1 CALLSIGN telex {MESSAGE}}')
+        actual_msg, actual_delay = await self._UUT.peek()
+        self.assertListEqual([(1, TelexMessage('CALLSIGN', self._STATION, 'MESSAGE'))], actual_msg)
+        self.assertGreater(actual_delay, timedelta(0))
+
+    async def test_poll(self):
+        self._expect_get({'to': 'SERVER', 'type': 'poll'}, 'ok {CALLSIGN telex {MESSAGE}}')
+        actual_msg, _ = await self._UUT.poll()
+        self.assertListEqual([TelexMessage('CALLSIGN', self._STATION, 'MESSAGE')], actual_msg)
+
+    async def test_ping(self):
+        self._expect_get({'to': 'SERVER', 'type': 'ping', 'packet': 'ALL-CALLSIGNS'}, 'ok {CALLSIGN}')
+        actual, _ = await self._UUT.ping('*')
+        self.assertListEqual(['CALLSIGN'], actual)
+
+    async def test_send_telex(self):
+        self._server.add('ok')
+        self.assertGreater(await self._UUT.send_telex('CALLSIGN', 'MESSAGE'), timedelta(0))
+        self.assertEqual([('POST', {'logon': self._LOGON, 'from': self._STATION, 'to': 'CALLSIGN', 'type': 'telex'}, {'packet': 'MESSAGE'})], self._server.requests)
+
+    async def test_send_progress(self):
+        self._expect_get({'to': 'OPS', 'type': 'progress', 'packet': 'AAAA/BBBB OUT/1820'})
+        self.assertGreater(await self._UUT.send_progress('OPS', 'AAAA', 'BBBB', time(hour=18, minute=20)), timedelta(0))
+
+    async def test_send_adsc_periodic_request(self):
+        self._expect_get({'to': 'CALLSIGN', 'type': 'ads-c', 'packet': 'REQUEST PERIODIC 120'})
+        self.assertGreater(await self._UUT.send_adsc_periodic_request('CALLSIGN', 120), timedelta(0))
+
+    async def test_send_adsc_periodic_report(self):
+        self._expect_get({'to': 'CALLSIGN', 'type': 'ads-c', 'packet': 'REPORT IDENT 011820 10.00000 20.00000 3000'})
+        data = AdscData(BasicGroup(datetime(year=2000, month=1, day=1, hour=18, minute=20), (10.0, 20.0), 3000.0), FlightIdentGroup('IDENT'))
+        self.assertGreater(await self._UUT.send_adsc_periodic_report('CALLSIGN', data), timedelta(0))
+
+    async def test_send_adsc_cancel(self):
+        self._expect_get({'to': 'CALLSIGN', 'type': 'ads-c', 'packet': 'REQUEST CANCEL'})
+        self.assertGreater(await self._UUT.send_adsc_cancel('CALLSIGN'), timedelta(0))
+
+    async def test_send_adsc_reject(self):
+        self._expect_get({'to': 'ATC', 'type': 'ads-c', 'packet': 'REJECT'})
+        self.assertGreater(await self._UUT.send_adsc_reject('ATC'), timedelta(0))
+
+    async def test_send_cpdlc(self):
+        self._expect_get({'to': 'ATSU', 'type': 'cpdlc', 'packet': '/data2/1//N/TEST'})
+        self.assertGreater(await self._UUT.send_cpdlc('ATSU', 1, CpdlcResponseRequirement.N, 'TEST'), timedelta(0))
+
+    async def test_concurrent_stations(self):
+        self._server.add('ok {CALLSIGN telex {MESSAGE}}', repeat=True)
+        connectors = [AsyncHoppieConnector(f"STN{i}", self._LOGON, self._URL) for i in range(3)]
+        results = await asyncio.gather(*[c.poll() for c in connectors])
+        for c, (msg, _) in zip(connectors, results):
+            self.assertListEqual([TelexMessage('CALLSIGN', c._station, 'MESSAGE')], msg)
+            await c.close()
+
+    async def test_invalid_connect_type(self):
+        self._server.add('ok', repeat=True)
+        with self.assertRaises(TypeError):
+            await self._UUT._connect(TelexMessage('CALLSIGN', self._STATION, 'MESSAGE'), PingSuccessResponse)
+
+class TestAsyncHoppieConnectorErrorHandling(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_error(self):
+        self._server.add('error {illegal logon code}', repeat=True)
+        async with AsyncHoppieConnector('STATION', 'logon', self._URL) as cnx:
+            with self.assertRaises(HoppieError):
+                await cnx.send_telex('CALLSIGN', 'MESSAGE')
+
+    async def test_poll_warning(self):
+        self._server.add('ok {CALLSIGN unknown {OTHER DATA}}', repeat=True)
+        async with AsyncHoppieConnector('STATION', 'logon', self._URL) as cnx:
+            with self.assertWarns(HoppieWarning):
+                await cnx.poll()
+
+class TestAsyncHoppieConnectorTiming(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_poll(self):
+        self._server.add('ok {CALLSIGN telex {MESSAGE}}', repeat=True)
+        events = []
+        async with AsyncHoppieConnector('STATION', 'logon', self._URL, on_timing=events.append) as cnx:
+            await cnx.poll()
+        self.assertEqual(['encode', 'http', 'ttfb', 'decode', 'parse_response', 'parse_message'], [e.get_stage() for e in events])
+
+class TestAsyncHoppieConnectorJournal(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_poll(self):
+        self._server.add('ok {CALLSIGN telex {MESSAGE}}', repeat=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal:
+                async with AsyncHoppieConnector('STATION', 'logon', self._URL, journal=journal) as cnx:
+                    await cnx.poll()
+            self.assertEqual(['ok {CALLSIGN telex {MESSAGE}}'], [r.get_body() for r in JournalReader(tmp)])
+
+class TestAsyncHoppieConnectorCpdlcMin(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+
+    async def test_allocate_min(self):
+        self._server.add('ok', repeat=True)
+        dialogues = DialogueManager()
+        async with AsyncHoppieConnector('STATION', 'logon', self._URL, dialogue_manager=dialogues) as cnx:
+            self.assertIs(dialogues, cnx.get_dialogue_manager())
+            await asyncio.gather(*(cnx.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@') for _ in range(3)))
+            await cnx.send_cpdlc('ATSU', 9, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        self.assertEqual([0, 1, 2, 9], sorted(d.get_min() for d in dialogues.get_awaiting_response()))
+        self.assertEqual(3, cnx.get_min_allocator().allocate('ATSU'))
+
+    async def test_release_on_error(self):
+        self._server.add('error {illegal logon code}', repeat=True)
+        async with AsyncHoppieConnector('STATION', 'logon', self._URL) as cnx:
+            with self.assertRaises(HoppieError):
+                await cnx.send_cpdlc('ATSU', None, CpdlcResponseRequirement.N, 'TEST')
+            self.assertEqual(1, cnx.get_min_allocator().allocate('ATSU'))
+
+class TestAsyncHoppieConnectorDialogues(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+        self._dialogues = DialogueManager()
+        self._UUT = AsyncHoppieConnector('STATION', 'logon', self._URL, dialogue_manager=self._dialogues)
+
+    async def asyncTearDown(self) -> None:
+        await self._UUT.close()
+        await self._server.close()
+
+    async def test_poll_closes_dialogue(self):
+        self._server.add('ok', match={'type': 'cpdlc'})
+        self._server.add('ok {ATSU cpdlc {/data2/3/0/N/WILCO}}', match={'type': 'poll'})
+        await self._UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        self.assertEqual(1, len(self._dialogues.get_awaiting_response()))
+        await self._UUT.poll()
+        self.assertEqual([], self._dialogues.get_awaiting_response())
+
+    async def test_peek_registers_once(self):
+        self._server.add('ok {1 ATSU cpdlc {/data2/5//WU/CLIMB TO @FL350@}}', match={'type': 'peek'}, repeat=True)
+        await self._UUT.peek()
+        dialogue = self._dialogues.get_dialogue('ATSU', 5, outbound=False)
+        await self._UUT.peek()
+        self.assertIs(dialogue, self._dialogues.get_dialogue('ATSU', 5, outbound=False))
+        self.assertTrue(dialogue.is_open())
+
+class TestAsyncHoppieConnectorPresenceCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+        self._cache = PresenceCache()
+        self._UUT = AsyncHoppieConnector('STATION', 'logon', self._URL, presence_cache=self._cache)
+
+    async def asyncTearDown(self) -> None:
+        await self._UUT.close()
+        await self._server.close()
+
+    async def test_ping(self):
+        self._server.add('ok {CALL1}', repeat=True)
+        self.assertEqual(['CALL1'], (await self._UUT.ping(['CALL1', 'CALL2']))[0])
+        self.assertEqual((['CALL1'], timedelta(0)), await self._UUT.ping(['CALL1', 'CALL2']))
+        self.assertEqual(1, len(self._server.requests))
+
+    async def test_connection_check(self):
+        self._server.add('ok {}', match={'type': 'ping'})
+        self.assertEqual([], (await self._UUT.ping([]))[0])
+        self.assertEqual(1, len(self._server.requests))
+
+    async def test_ping_stale(self):
+        self._cache.update(['CALL1'], ['CALL1'])
+        self._server.add('ok {}', match={'packet': 'CALL2'})
+        self.assertEqual(['CALL1'], (await self._UUT.ping(['CALL1', 'CALL2']))[0])
+
+    async def test_ping_all(self):
+        self._server.add('ok {CALL1}', repeat=True)
+        await self._UUT.ping('*')
+        self.assertTrue(self._cache.is_online('CALL1'))
+
+    async def test_poll_marks_online(self):
+        self._server.add('ok {CALL1 telex {MESSAGE}}', repeat=True)
+        await self._UUT.poll()
+        self.assertTrue(self._cache.is_online('CALL1'))
+
+class TestAsyncHoppieConnectorPingFleet(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._server = ApiServer()
+        self._URL = await self._server.start()
+        self._UUT = AsyncHoppieConnector('STATION', 'logon', self._URL)
+
+    async def asyncTearDown(self) -> None:
+        await self._UUT.close()
+        await self._server.close()
+
+    async def test_chunked(self):
+        self._server.add('ok {DLH000 DLH030}', repeat=True)
+        stations = [f"DLH{i:03d}" for i in range(40)]
+        online, delay = await self._UUT.ping_fleet(stations)
+        self.assertEqual(['DLH000', 'DLH030'], online)
+        self.assertEqual(2, len(self._server.requests))
+        self.assertGreater(delay, timedelta(0))
+
+    async def test_switch_to_all(self):
+        self._server.add('ok {DLH000 OTHER}', match={'packet': 'ALL-CALLSIGNS'})
+        self.assertEqual(['DLH000'], (await self._UUT.ping_fleet([f"DLH{i:03d}" for i in range(40)], all_threshold=1))[0])
+
+    async def test_empty(self):
+        self.assertEqual([], (await self._UUT.ping_fleet([]))[0])
+
+    async def test_max_workers(self):
+        active = []
+        peak = []
+        async def _connect(message, type):
+            active.append(message)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(message)
+            return PingSuccessResponse([]), timedelta(seconds=0.01)
+        self._UUT._connect = _connect
+        await self._UUT.ping_fleet([f"DLH{i:03d}" for i in range(96)], max_workers=2)
+        self.assertEqual(4, len(peak))
+        self.assertEqual(2, max(peak))
+
+    async def test_failed_chunk(self):
+        self._server.add('error {illegal logon code}', match={'packet': ' '.join(f"DLH{i:03d}" for i in range(24))})
+        self._server.add('ok {DLH030}')
+        with self.assertRaises(HoppieError):
+            await self._UUT.ping_fleet([f"DLH{i:03d}" for i in range(40)])
+        self.assertEqual(2, len(self._server.requests))
+
+    async def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            await self._UUT.ping_fleet(['DLH000'], max_workers=0)
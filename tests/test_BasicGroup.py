@@ -1,4 +1,5 @@
 from hoppie_connector.ADSC import BasicGroup
+import dataclasses
 from datetime import datetime, UTC
 import unittest
 
@@ -49,4 +50,19 @@ class TestBasicGroupComparison(unittest.TestCase):
             position=(12.0, -12.0),
             altitude=1000
         )
-        self.assertNotEqual(value1, value2)
\ No newline at end of file
+        self.assertNotEqual(value1, value2)
+
+class TestBasicGroupHash(unittest.TestCase):
+    def test_equal_hash(self):
+        value1 = BasicGroup(datetime(1999, 2, 1, 18, 20, 10, tzinfo=UTC), (10.0, -10.0), 3000)
+        value2 = BasicGroup(datetime(2000, 1, 1, 18, 20, 0, tzinfo=UTC), (10.0, -10.0), 3000)
+        self.assertEqual(hash(value1), hash(value2))
+        self.assertEqual(1, len({value1, value2}))
+
+class TestBasicGroupImmutability(unittest.TestCase):
+    def test_frozen(self):
+        value = BasicGroup(datetime(2000, 1, 1, 18, 20, tzinfo=UTC), (10.0, -10.0), 3000)
+        self.assertRaises(dataclasses.FrozenInstanceError, lambda: setattr(value, 'altitude', 1000))
+
+    def test_slots(self):
+        self.assertFalse(hasattr(BasicGroup(datetime(2000, 1, 1, 18, 20, tzinfo=UTC), (10.0, -10.0), 3000), '__dict__'))
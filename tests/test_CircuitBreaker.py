@@ -0,0 +1,98 @@
+from hoppie_connector.Resilience import CircuitBreaker
+from datetime import timedelta
+import datetime
+import unittest
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self) -> float:
+        return self.now
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = _Clock()
+        self._UUT = CircuitBreaker(failure_threshold=3, reset_timeout=timedelta(seconds=30), clock=self._clock)
+
+    def _fail(self, count: int):
+        for _ in range(count):
+            self._UUT.record_failure()
+
+    def test_closed(self):
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._UUT.get_state())
+        self.assertTrue(self._UUT.allow_request())
+
+    def test_opens_after_threshold(self):
+        self._fail(2)
+        self.assertTrue(self._UUT.allow_request())
+        self._fail(1)
+        self.assertEqual(CircuitBreaker.State.OPEN, self._UUT.get_state())
+        self.assertFalse(self._UUT.allow_request())
+
+    def test_success_resets_failures(self):
+        self._fail(2)
+        self._UUT.record_success()
+        self._fail(2)
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._UUT.get_state())
+
+    def test_single_probe(self):
+        self._fail(3)
+        self._clock.now = 30.0
+        self.assertEqual(CircuitBreaker.State.HALF_OPEN, self._UUT.get_state())
+        self.assertTrue(self._UUT.allow_request())
+        self.assertFalse(self._UUT.allow_request())
+        self.assertEqual(CircuitBreaker.State.HALF_OPEN, self._UUT.get_state())
+
+    def test_probe_success(self):
+        self._fail(3)
+        self._clock.now = 30.0
+        self._UUT.allow_request()
+        self._UUT.record_success()
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._UUT.get_state())
+        self.assertTrue(self._UUT.allow_request())
+
+    def test_probe_failure(self):
+        self._fail(3)
+        self._clock.now = 30.0
+        self._UUT.allow_request()
+        self._UUT.record_failure()
+        self.assertFalse(self._UUT.allow_request())
+        self._clock.now = 59.0
+        self.assertFalse(self._UUT.allow_request())
+        self._clock.now = 60.0
+        self.assertTrue(self._UUT.allow_request())
+
+    def test_probe_expires(self):
+        self._fail(3)
+        self._clock.now = 30.0
+        self.assertTrue(self._UUT.allow_request())
+        self._clock.now = 59.0
+        self.assertFalse(self._UUT.allow_request())
+        self._clock.now = 60.0
+        self.assertTrue(self._UUT.allow_request())
+        self.assertFalse(self._UUT.allow_request())
+
+    def test_probe_cancelled(self):
+        self._fail(3)
+        self._clock.now = 30.0
+        self._UUT.allow_request()
+        self._UUT.record_cancelled()
+        self.assertTrue(self._UUT.allow_request())
+        self.assertFalse(self._UUT.allow_request())
+
+    def test_cancelled_when_closed(self):
+        self._UUT.record_cancelled()
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._UUT.get_state())
+
+class TestCircuitBreakerErrorHandling(unittest.TestCase):
+    def test_invalid_threshold(self):
+        self.assertRaises(ValueError, lambda: CircuitBreaker(failure_threshold=0))
+
+class TestCircuitBreakerRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = CircuitBreaker(failure_threshold=2, reset_timeout=timedelta(seconds=10))
+        self.assertEqual(repr(expected), repr(eval(repr(expected))))
+
+    def test_state_repr(self):
+        self.assertEqual(CircuitBreaker.State.OPEN, eval(repr(CircuitBreaker.State.OPEN)))
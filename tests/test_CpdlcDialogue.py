@@ -0,0 +1,64 @@
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import CpdlcDialogue
+from hoppie_connector.Messages import CpdlcMessage
+import unittest
+
+def _request(rr: CpdlcResponseRequirement) -> CpdlcMessage:
+    return CpdlcMessage('EDDF', 'DLH123', 3, rr, 'CLIMB TO @FL350@')
+
+def _response(message: str) -> CpdlcMessage:
+    return CpdlcMessage('DLH123', 'EDDF', 8, CpdlcResponseRequirement.NOT_REQUIRED, message, mrn=3)
+
+class TestCpdlcDialogue(unittest.TestCase):
+    def test_get_values(self):
+        request = _request(CpdlcResponseRequirement.WILCO_UNABLE)
+        UUT = CpdlcDialogue(request, True)
+        self.assertEqual(request, UUT.get_request())
+        self.assertEqual('DLH123', UUT.get_peer())
+        self.assertEqual(3, UUT.get_min())
+        self.assertEqual(CpdlcResponseRequirement.WILCO_UNABLE, UUT.get_rr())
+        self.assertTrue(UUT.is_outbound())
+        self.assertEqual([], UUT.get_responses())
+        self.assertEqual(CpdlcDialogue.State.OPEN, UUT.get_state())
+        self.assertTrue(UUT.is_open())
+
+    def test_inbound_peer(self):
+        self.assertEqual('EDDF', CpdlcDialogue(_request(CpdlcResponseRequirement.ROGER), False).get_peer())
+
+    def test_requires_response(self):
+        self.assertTrue(CpdlcDialogue.requires_response(CpdlcResponseRequirement.WILCO_UNABLE))
+        self.assertTrue(CpdlcDialogue.requires_response(CpdlcResponseRequirement.AFFIRM_NEGATIVE))
+        self.assertTrue(CpdlcDialogue.requires_response(CpdlcResponseRequirement.ROGER))
+        self.assertTrue(CpdlcDialogue.requires_response(CpdlcResponseRequirement.YES))
+        self.assertFalse(CpdlcDialogue.requires_response(CpdlcResponseRequirement.NO))
+        self.assertFalse(CpdlcDialogue.requires_response(CpdlcResponseRequirement.NOT_REQUIRED))
+
+    def test_closing_responses(self):
+        cases = [
+            (CpdlcResponseRequirement.WILCO_UNABLE, 'WILCO', True),
+            (CpdlcResponseRequirement.WILCO_UNABLE, 'UNABLE DUE TO WEATHER', True),
+            (CpdlcResponseRequirement.WILCO_UNABLE, 'ROGER', False),
+            (CpdlcResponseRequirement.AFFIRM_NEGATIVE, 'AFFIRM', True),
+            (CpdlcResponseRequirement.AFFIRM_NEGATIVE, 'NEGATIVE', True),
+            (CpdlcResponseRequirement.AFFIRM_NEGATIVE, 'WILCO', False),
+            (CpdlcResponseRequirement.ROGER, 'ROGER', True),
+            (CpdlcResponseRequirement.ROGER, 'UNABLE', True),
+            (CpdlcResponseRequirement.YES, 'CLIMBING TO @FL350@', True),
+            (CpdlcResponseRequirement.YES, 'STANDBY', False),
+            (CpdlcResponseRequirement.WILCO_UNABLE, 'STANDBY', False),
+        ]
+        for rr, message, closed in cases:
+            with self.subTest(rr=rr, message=message):
+                UUT = CpdlcDialogue(_request(rr), True)
+                UUT._add_response(_response(message))
+                self.assertEqual([_response(message)], UUT.get_responses())
+                self.assertEqual(not closed, UUT.is_open())
+
+    def test_state_repr(self):
+        self.assertEqual(CpdlcDialogue.State.CLOSED, eval(repr(CpdlcDialogue.State.CLOSED)))
+
+    def test_repr(self):
+        UUT = CpdlcDialogue(_request(CpdlcResponseRequirement.ROGER), False)
+        copy = eval(repr(UUT))
+        self.assertEqual(UUT.get_request(), copy.get_request())
+        self.assertFalse(copy.is_outbound())
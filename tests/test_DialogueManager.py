@@ -0,0 +1,128 @@
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import CpdlcDialogue, DialogueManager
+from hoppie_connector.Messages import CpdlcMessage
+from datetime import timedelta
+import datetime
+import unittest
+
+class _FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def _uplink(min: int, rr: CpdlcResponseRequirement, message: str = 'CLIMB TO @FL350@', to_name: str = 'DLH123', mrn: int | None = None) -> CpdlcMessage:
+    return CpdlcMessage('EDDF', to_name, min, rr, message, mrn)
+
+def _downlink(min: int, rr: CpdlcResponseRequirement, message: str, mrn: int | None = None, from_name: str = 'DLH123') -> CpdlcMessage:
+    return CpdlcMessage(from_name, 'EDDF', min, rr, message, mrn)
+
+class TestDialogueManager(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = _FakeClock()
+        self._UUT = DialogueManager(timeout=timedelta(seconds=60), clock=self._clock)
+
+    def test_invalid_timeout(self):
+        with self.assertRaises(ValueError):
+            DialogueManager(timeout=timedelta(0))
+
+    def test_no_response_required(self):
+        self.assertIsNone(self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.NOT_REQUIRED)))
+        self.assertEqual(0, len(self._UUT))
+
+    def test_outbound_request_closed_by_response(self):
+        dialogue = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self.assertIs(dialogue, self._UUT.get_dialogue('DLH123', 1, outbound=True))
+        self.assertEqual([dialogue], self._UUT.get_awaiting_response())
+        self.assertIs(dialogue, self._UUT.add_inbound(_downlink(5, CpdlcResponseRequirement.NOT_REQUIRED, 'WILCO', mrn=1)))
+        self.assertEqual(CpdlcDialogue.State.CLOSED, dialogue.get_state())
+        self.assertIsNone(self._UUT.get_dialogue('DLH123', 1, outbound=True))
+        self.assertEqual(0, len(self._UUT))
+
+    def test_standby_keeps_dialogue_open(self):
+        dialogue = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self._UUT.add_inbound(_downlink(5, CpdlcResponseRequirement.NOT_REQUIRED, 'STANDBY', mrn=1))
+        self.assertTrue(dialogue.is_open())
+        self.assertEqual([dialogue], self._UUT.get_awaiting_response())
+
+    def test_inbound_request_closed_by_reply(self):
+        dialogue = self._UUT.add_inbound(_downlink(4, CpdlcResponseRequirement.YES, 'REQUEST CLIMB TO @FL350@'))
+        self.assertEqual([dialogue], self._UUT.get_awaiting_reply())
+        self.assertEqual([], self._UUT.get_awaiting_response())
+        self.assertIs(dialogue, self._UUT.add_outbound(_uplink(2, CpdlcResponseRequirement.NOT_REQUIRED, 'UNABLE', mrn=4)))
+        self.assertFalse(dialogue.is_open())
+        self.assertEqual([], self._UUT.get_awaiting_reply())
+
+    def test_reply_requiring_response(self):
+        request = self._UUT.add_inbound(_downlink(4, CpdlcResponseRequirement.YES, 'REQUEST CLIMB TO @FL350@'))
+        self.assertIs(request, self._UUT.add_outbound(_uplink(2, CpdlcResponseRequirement.WILCO_UNABLE, mrn=4)))
+        self.assertFalse(request.is_open())
+        clearance = self._UUT.get_dialogue('DLH123', 2, outbound=True)
+        self.assertTrue(clearance.is_open())
+        self.assertEqual([clearance], self._UUT.get_awaiting_response(CpdlcResponseRequirement.WILCO_UNABLE))
+
+    def test_match_by_peer(self):
+        dialogue = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.ROGER))
+        self.assertIsNone(self._UUT.add_inbound(_downlink(5, CpdlcResponseRequirement.NOT_REQUIRED, 'ROGER', mrn=1, from_name='BAW456')))
+        self.assertIsNone(self._UUT.add_inbound(_downlink(5, CpdlcResponseRequirement.NOT_REQUIRED, 'ROGER', mrn=2)))
+        self.assertTrue(dialogue.is_open())
+
+    def test_filter_by_rr(self):
+        wu = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        an = self._UUT.add_outbound(_uplink(2, CpdlcResponseRequirement.AFFIRM_NEGATIVE, 'CONFIRM SQUAWK'))
+        r = self._UUT.add_outbound(_uplink(3, CpdlcResponseRequirement.ROGER, 'MONITOR EDGG_CTR'))
+        self.assertEqual([wu, an, r], self._UUT.get_awaiting_response())
+        self.assertEqual([an], self._UUT.get_awaiting_response(CpdlcResponseRequirement.AFFIRM_NEGATIVE))
+        self.assertEqual([r], self._UUT.get_awaiting_response(CpdlcResponseRequirement.ROGER))
+        request = self._UUT.add_inbound(_downlink(9, CpdlcResponseRequirement.ROGER, 'REQUEST DIRECT TO @DF@'))
+        self.assertEqual([request], self._UUT.get_awaiting_reply(CpdlcResponseRequirement.ROGER))
+        self.assertEqual([], self._UUT.get_awaiting_reply(CpdlcResponseRequirement.YES))
+
+    def test_expire(self):
+        first = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self._clock.now += 10
+        second = self._UUT.add_inbound(_downlink(4, CpdlcResponseRequirement.YES, 'REQUEST CLIMB TO @FL350@'))
+        self.assertEqual(timedelta(seconds=50), self._UUT.get_next_expiry())
+        self._clock.now += 49
+        self.assertEqual([], self._UUT.expire())
+        self._clock.now += 1
+        self.assertEqual([first], self._UUT.expire())
+        self.assertEqual(CpdlcDialogue.State.EXPIRED, first.get_state())
+        self.assertIsNone(self._UUT.get_dialogue('DLH123', 1, outbound=True))
+        self._clock.now += 100
+        self.assertEqual(timedelta(0), self._UUT.get_next_expiry())
+        self.assertEqual([second], self._UUT.expire())
+        self.assertIsNone(self._UUT.get_next_expiry())
+        self.assertEqual(0, len(self._UUT))
+
+    def test_get_dialogue_past_timeout(self):
+        dialogue = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self._clock.now += 59
+        self.assertIs(dialogue, self._UUT.get_dialogue('DLH123', 1, outbound=True))
+        self._clock.now += 1
+        self.assertIsNone(self._UUT.get_dialogue('DLH123', 1, outbound=True))
+
+    def test_expire_skips_closed(self):
+        dialogue = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self._UUT.add_inbound(_downlink(5, CpdlcResponseRequirement.NOT_REQUIRED, 'WILCO', mrn=1))
+        self._clock.now += 60
+        self.assertIsNone(self._UUT.get_next_expiry())
+        self.assertEqual([], self._UUT.expire())
+        self.assertEqual(CpdlcDialogue.State.CLOSED, dialogue.get_state())
+
+    def test_reused_min(self):
+        first = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE))
+        self._clock.now += 30
+        second = self._UUT.add_outbound(_uplink(1, CpdlcResponseRequirement.WILCO_UNABLE, 'DESCEND TO @FL240@'))
+        self.assertEqual(CpdlcDialogue.State.EXPIRED, first.get_state())
+        self.assertIs(second, self._UUT.get_dialogue('DLH123', 1, outbound=True))
+        self._clock.now += 30
+        self.assertEqual([], self._UUT.expire())
+        self.assertTrue(second.is_open())
+        self.assertEqual(1, len(self._UUT))
+
+    def test_repr(self):
+        self.assertEqual(repr(self._UUT), repr(eval(repr(self._UUT))))
+        self.assertEqual('DialogueManager(timeout=datetime.timedelta(seconds=60))', repr(self._UUT))
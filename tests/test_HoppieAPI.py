@@ -1,7 +1,16 @@
-from hoppie_connector.API import HoppieAPI
+from hoppie_connector.API import HoppieAPI, SendResult
+from hoppie_connector.Journal import JournalReader, ResponseJournal
 from hoppie_connector.Messages import HoppieMessage, PeekMessage, PollMessage, TelexMessage
+from hoppie_connector.Responses import ErrorResponse, SuccessResponse
+from hoppie_connector.Resilience import CircuitBreaker, CircuitOpenError, HTTPStatusError, RetryPolicy
+from hoppie_connector.Timing import TimingStage
+from datetime import timedelta
+import requests
 from responses import matchers
+from urllib.parse import parse_qs, urlparse
 import responses
+import tempfile
+import threading
 import unittest
 
 class TestHoppieApiURL(unittest.TestCase):
@@ -67,6 +76,15 @@ class TestHoppieApiConnectMethodParams(unittest.TestCase):
         ])
         self._trigger_connect(self._telex)
 
+class TestHoppieApiFetch(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    @responses.activate
+    def test_fetch_unparsed(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {MESSAGE}}')
+        content, _ = HoppieAPI('', self._URL).fetch(PeekMessage('CALLSIGN'))
+        self.assertEqual('ok {1 CALLSIGN telex {MESSAGE}}', content)
+
 class TestHoppieApiConnectErrorHandling(unittest.TestCase):
     _URL: str = 'http://example.com/1'
 
@@ -103,6 +121,287 @@ class TestHoppieApiConnectErrorHandling(unittest.TestCase):
     def test_invalid_connect_msg(self):
         self.assertRaises(ValueError, lambda: self._UUT.connect(None))
 
+class TestHoppieApiConnectionPool(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    def test_invalid_pool_size(self):
+        self.assertRaises(ValueError, lambda: HoppieAPI('', self._URL, pool_maxsize=0))
+
+    def test_get_pool_maxsize(self):
+        self.assertEqual(4, HoppieAPI('', self._URL, pool_maxsize=4).get_pool_maxsize())
+
+    def test_shared_session(self):
+        api = HoppieAPI('', self._URL)
+        session = api._get_session()
+        self.assertIs(session.get_adapter('http://example.com'), session.get_adapter('https://example.com'))
+        self.assertIs(session, api._get_session())
+
+    @responses.activate
+    def test_close_reopens_pool(self):
+        responses.get(self._URL, body='ok')
+        api = HoppieAPI('', self._URL)
+        session = api._get_session()
+        api.close()
+        self.assertIsNone(api._session)
+        api.connect(PeekMessage('CALLSIGN'))
+        self.assertIsNot(session, api._session)
+
+    def test_close_without_session(self):
+        api = HoppieAPI('', self._URL)
+        api.close()
+        self.assertIsNone(api._session)
+
+    @responses.activate
+    def test_context_manager(self):
+        responses.get(self._URL, body='ok')
+        with HoppieAPI('', self._URL) as api:
+            api.connect(PeekMessage('CALLSIGN'))
+            self.assertIsNotNone(api._session)
+        self.assertIsNone(api._session)
+
+class TestHoppieApiSendMany(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._lock = threading.Lock()
+        self._received = []
+
+    def _record(self, request):
+        to = parse_qs(urlparse(request.url).query)['to'][0]
+        packet = parse_qs(request.body)['packet'][0]
+        with self._lock:
+            self._received.append((to, packet))
+        return (200, {}, 'error {fail}' if packet == 'FAIL' else 'ok')
+
+    @responses.activate
+    def test_results_in_input_order(self):
+        responses.add_callback(responses.POST, self._URL, callback=self._record)
+        messages = [TelexMessage('OPS', f"CALL{i % 3}", f"MSG{i}") for i in range(9)]
+        results = HoppieAPI('', self._URL).send_many(messages, max_workers=3)
+        self.assertEqual(messages, [r.get_message() for r in results])
+        self.assertTrue(all(r.is_ok() for r in results))
+        self.assertTrue(all(r.get_response() == SuccessResponse() for r in results))
+
+    @responses.activate
+    def test_per_station_order(self):
+        responses.add_callback(responses.POST, self._URL, callback=self._record)
+        messages = [TelexMessage('OPS', f"CALL{i % 4}", f"MSG{i}") for i in range(40)]
+        HoppieAPI('', self._URL, pool_maxsize=4).send_many(messages)
+        for station in ['CALL0', 'CALL1', 'CALL2', 'CALL3']:
+            expected = [m.get_message() for m in messages if m.get_to_name() == station]
+            actual = [p for t, p in self._received if t == station]
+            self.assertEqual(expected, actual)
+
+    @responses.activate
+    def test_single_station(self):
+        responses.add_callback(responses.POST, self._URL, callback=self._record)
+        messages = [TelexMessage('OPS', 'CALLSIGN', f"MSG{i}") for i in range(3)]
+        HoppieAPI('', self._URL).send_many(messages)
+        self.assertEqual([('CALLSIGN', 'MSG0'), ('CALLSIGN', 'MSG1'), ('CALLSIGN', 'MSG2')], self._received)
+
+    @responses.activate
+    def test_failure_does_not_abort(self):
+        responses.add_callback(responses.POST, self._URL, callback=self._record)
+        responses.get(self._URL, status=404)
+        messages = [TelexMessage('OPS', 'CALL1', 'FAIL'), PeekMessage('OPS'), TelexMessage('OPS', 'CALL1', 'MSG')]
+        results = HoppieAPI('', self._URL).send_many(messages)
+        self.assertEqual(ErrorResponse('fail'), results[0].get_response())
+        self.assertFalse(results[0].is_ok())
+        self.assertIsInstance(results[1].get_error(), ConnectionError)
+        self.assertIsNone(results[1].get_response())
+        self.assertIsNone(results[1].get_delay())
+        self.assertTrue(results[2].is_ok())
+
+    @responses.activate
+    def test_invalid_response(self):
+        responses.get(self._URL, body='garbage')
+        results = HoppieAPI('', self._URL).send_many([PeekMessage('OPS')])
+        self.assertIsInstance(results[0].get_error(), ValueError)
+        self.assertFalse(results[0].is_ok())
+
+    @responses.activate
+    def test_unordered(self):
+        responses.add_callback(responses.POST, self._URL, callback=self._record)
+        messages = [TelexMessage('OPS', 'CALLSIGN', f"MSG{i}") for i in range(6)]
+        results = HoppieAPI('', self._URL, pool_maxsize=3).send_many(messages, ordered=False)
+        self.assertEqual(messages, [r.get_message() for r in results])
+        self.assertEqual(sorted(m.get_message() for m in messages), sorted(p for _, p in self._received))
+
+    def test_empty(self):
+        self.assertEqual([], HoppieAPI('').send_many([]))
+
+    def test_invalid_message(self):
+        self.assertRaises(ValueError, lambda: HoppieAPI('').send_many([None]))
+
+    def test_invalid_max_workers(self):
+        self.assertRaises(ValueError, lambda: HoppieAPI('').send_many([PeekMessage('OPS')], max_workers=0))
+
+class TestHoppieApiTiming(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._events = []
+        self._UUT = HoppieAPI('', self._URL, on_timing=self._events.append)
+
+    @responses.activate
+    def test_connect_stages(self):
+        responses.get(self._URL, body='ok')
+        msg = PollMessage('CALLSIGN')
+        self._UUT.connect(msg)
+        self.assertEqual([TimingStage.ENCODE, TimingStage.HTTP, TimingStage.TTFB, TimingStage.DECODE, TimingStage.PARSE_RESPONSE], [e.get_stage() for e in self._events])
+        self.assertTrue(all(e.get_message() is msg for e in self._events))
+
+    @responses.activate
+    def test_post_stages(self):
+        responses.post(self._URL, body='ok')
+        self._UUT.fetch(TelexMessage('CALLSIGN', 'OPS', 'MESSAGE'))
+        self.assertEqual([TimingStage.ENCODE, TimingStage.HTTP, TimingStage.TTFB, TimingStage.DECODE], [e.get_stage() for e in self._events])
+
+    @responses.activate
+    def test_http_error_stages(self):
+        responses.get(self._URL, status=500)
+        self.assertRaises(ConnectionError, lambda: self._UUT.connect(PollMessage('CALLSIGN')))
+        self.assertEqual([TimingStage.ENCODE, TimingStage.HTTP, TimingStage.TTFB], [e.get_stage() for e in self._events])
+
+class TestHoppieApiRetry(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._sleeps = []
+        self._policy = RetryPolicy(max_attempts=3, jitter=False, sleep=self._sleeps.append)
+
+    @responses.activate
+    def test_status_error(self):
+        responses.get(self._URL, status=404)
+        with self.assertRaises(HTTPStatusError) as cm:
+            HoppieAPI('', self._URL).connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(404, cm.exception.get_status_code())
+
+    @responses.activate
+    def test_retry_idempotent(self):
+        responses.get(self._URL, status=503)
+        responses.get(self._URL, body=requests.ReadTimeout())
+        responses.get(self._URL, body='ok')
+        HoppieAPI('', self._URL, retry_policy=self._policy).connect(PeekMessage('CALLSIGN'))
+        self.assertEqual([1.0, 2.0], self._sleeps)
+
+    @responses.activate
+    def test_retry_exhausted(self):
+        responses.get(self._URL, status=503)
+        self.assertRaises(HTTPStatusError, lambda: HoppieAPI('', self._URL, retry_policy=self._policy).connect(PeekMessage('CALLSIGN')))
+        self.assertEqual(3, len(responses.calls))
+
+    @responses.activate
+    def test_no_retry_poll_after_delivery(self):
+        responses.get(self._URL, body=requests.ReadTimeout())
+        self.assertRaises(requests.ReadTimeout, lambda: HoppieAPI('', self._URL, retry_policy=self._policy).connect(PollMessage('CALLSIGN')))
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_retry_poll_unsent(self):
+        responses.get(self._URL, body=requests.ConnectTimeout())
+        responses.get(self._URL, body='ok')
+        HoppieAPI('', self._URL, retry_policy=self._policy).connect(PollMessage('CALLSIGN'))
+        self.assertEqual(2, len(responses.calls))
+
+class TestHoppieApiCircuitBreaker(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._breaker = CircuitBreaker(failure_threshold=2, reset_timeout=timedelta(seconds=3600))
+
+    @responses.activate
+    def test_open_after_failures(self):
+        responses.get(self._URL, status=503)
+        api = HoppieAPI('', self._URL, circuit_breaker=self._breaker)
+        for _ in range(2):
+            self.assertRaises(HTTPStatusError, lambda: api.connect(PeekMessage('CALLSIGN')))
+        self.assertRaises(CircuitOpenError, lambda: api.connect(PeekMessage('CALLSIGN')))
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_shared_between_apis(self):
+        responses.get(self._URL, body=requests.ConnectionError())
+        for logon in ['a', 'b']:
+            self.assertRaises(requests.ConnectionError, lambda: HoppieAPI(logon, self._URL, circuit_breaker=self._breaker).connect(PeekMessage('CALLSIGN')))
+        self.assertRaises(CircuitOpenError, lambda: HoppieAPI('c', self._URL, circuit_breaker=self._breaker).connect(PeekMessage('CALLSIGN')))
+
+    @responses.activate
+    def test_non_transient_failure(self):
+        responses.get(self._URL, status=404)
+        api = HoppieAPI('', self._URL, circuit_breaker=self._breaker)
+        for _ in range(3):
+            self.assertRaises(HTTPStatusError, lambda: api.connect(PeekMessage('CALLSIGN')))
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._breaker.get_state())
+
+    @responses.activate
+    def test_success(self):
+        responses.get(self._URL, body='ok')
+        self._breaker.record_failure()
+        HoppieAPI('', self._URL, circuit_breaker=self._breaker).connect(PeekMessage('CALLSIGN'))
+        self._breaker.record_failure()
+        self.assertEqual(CircuitBreaker.State.CLOSED, self._breaker.get_state())
+
+    @responses.activate
+    def test_probe_released_on_error(self):
+        responses.get(self._URL, body='ok')
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=timedelta(seconds=30), clock=lambda: now[0])
+        breaker.record_failure()
+        now[0] = 30.0
+        def _on_timing(event):
+            if event.get_stage() == TimingStage.HTTP:
+                raise RuntimeError('hook failed')
+        self.assertRaises(RuntimeError, lambda: HoppieAPI('', self._URL, on_timing=_on_timing).connect(PeekMessage('CALLSIGN')))
+        self.assertRaises(RuntimeError, lambda: HoppieAPI('', self._URL, on_timing=_on_timing, circuit_breaker=breaker).connect(PeekMessage('CALLSIGN')))
+        HoppieAPI('', self._URL, circuit_breaker=breaker).connect(PeekMessage('CALLSIGN'))
+        self.assertEqual(CircuitBreaker.State.CLOSED, breaker.get_state())
+
+    @responses.activate
+    def test_retry_stops_at_open_circuit(self):
+        responses.get(self._URL, status=503)
+        policy = RetryPolicy(max_attempts=5, sleep=lambda _: None)
+        self.assertRaises(CircuitOpenError, lambda: HoppieAPI('', self._URL, retry_policy=policy, circuit_breaker=self._breaker).connect(PeekMessage('CALLSIGN')))
+        self.assertEqual(2, len(responses.calls))
+
+class TestHoppieApiJournal(unittest.TestCase):
+    _URL: str = 'http://example.com/1'
+
+    @responses.activate
+    def test_append_before_parse(self):
+        responses.get(self._URL, body='ok {1 OPS telex {HELLO}}')
+        responses.get(self._URL, body='error {illegal logon code}')
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal:
+                UUT = HoppieAPI('', self._URL, journal=journal)
+                UUT.connect(PeekMessage('CALLSIGN'))
+                UUT.connect(PollMessage('CALLSIGN'))
+            actual = [(r.get_station(), r.get_request_type(), r.get_body()) for r in JournalReader(tmp)]
+        self.assertEqual([
+            ('CALLSIGN', HoppieMessage.MessageType.PEEK, 'ok {1 OPS telex {HELLO}}'),
+            ('CALLSIGN', HoppieMessage.MessageType.POLL, 'error {illegal logon code}'),
+        ], actual)
+
+    @responses.activate
+    def test_append_nonascii(self):
+        responses.get(self._URL, body=b'ok \xf9')
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal:
+                self.assertRaises(UnicodeDecodeError, lambda: HoppieAPI('', self._URL, journal=journal).fetch(PollMessage('CALLSIGN')))
+            self.assertEqual(['ok \\xf9'], [r.get_body() for r in JournalReader(tmp)])
+
+    @responses.activate
+    def test_no_append_on_http_error(self):
+        responses.get(self._URL, status=500)
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal:
+                self.assertRaises(ConnectionError, lambda: HoppieAPI('', self._URL, journal=journal).fetch(PollMessage('CALLSIGN')))
+            self.assertEqual([], list(JournalReader(tmp)))
+
 class TestHoppieApiComparison(unittest.TestCase):
     def test_same(self):
         value1 = HoppieAPI('logon')
@@ -126,6 +425,8 @@ class TestHoppieApiComparison(unittest.TestCase):
 
 class TestHoppieApiRepresentation(unittest.TestCase):
     def test_repr(self):
-        expected = HoppieAPI('logon', 'url')
+        expected = HoppieAPI('logon', 'url', pool_maxsize=2, timeout=5.0, on_timing=print)
         actual = eval(repr(expected))
-        self.assertEqual(expected, actual)
\ No newline at end of file
+        self.assertEqual(expected, actual)
+        self.assertEqual(expected.get_pool_maxsize(), actual.get_pool_maxsize())
+        self.assertNotIn('on_timing', repr(expected))
\ No newline at end of file
@@ -1,18 +1,31 @@
 from hoppie_connector import HoppieConnector, HoppieError, HoppieWarning
-from hoppie_connector.Messages import TelexMessage
-from hoppie_connector.Responses import PingSuccessResponse
+from hoppie_connector.Journal import JournalReader, ResponseJournal
+from hoppie_connector.Messages import PeekMessage, TelexMessage
+from hoppie_connector.Responses import ErrorResponse, PingSuccessResponse, SuccessResponse
 from hoppie_connector.ADSC import AdscData, BasicGroup, FlightIdentGroup
 from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Cursor import PeekCursor
+from hoppie_connector.Dialogue import DialogueManager, MinAllocator
+from hoppie_connector.Presence import PresenceCache
+from hoppie_connector.Resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from hoppie_connector.Timing import TimingRecorder, TimingStage
 from responses import matchers
 from datetime import timedelta, time, datetime
+from urllib.parse import parse_qs, urlparse
+import os
 import responses
+import tempfile
 import unittest
+import warnings
 
 class TestHoppieConnectorSuccess(unittest.TestCase):
     _URL = 'http://example.com/api'
     _LOGON = 'logon'
     _STATION = 'STATION'
 
+    def test_get_station_name(self):
+        self.assertEqual(self._STATION, HoppieConnector(self._STATION, self._LOGON, self._URL).get_station_name())
+
     @responses.activate
     def test_peek(self):
         responses.get(self._URL, body='ok {1 CALLSIGN telex {MESSAGE}}', match=[
@@ -126,6 +139,364 @@ class TestHoppieConnectorSuccess(unittest.TestCase):
         cnx = HoppieConnector(self._STATION, self._LOGON, self._URL)
         self.assertRaises(TypeError, lambda: cnx._connect(m, PingSuccessResponse))
 
+class TestHoppieConnectorConnectionPool(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    @responses.activate
+    def test_shared_api_session(self):
+        responses.get(self._URL, body='ok')
+        cnx = HoppieConnector(self._STATION, self._LOGON, self._URL, pool_maxsize=2)
+        cnx.poll()
+        session = cnx._api._session
+        cnx.peek()
+        self.assertIs(session, cnx._api._session)
+
+    def test_context_manager(self):
+        with HoppieConnector(self._STATION, self._LOGON, self._URL) as cnx:
+            cnx._api._get_session()
+        self.assertIsNone(cnx._api._session)
+
+class TestHoppieConnectorSendMany(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    @responses.activate
+    def test_send_many(self):
+        responses.post(self._URL, body='ok')
+        messages = [TelexMessage(self._STATION, f"CALL{i}", 'MESSAGE') for i in range(5)]
+        results = HoppieConnector(self._STATION, self._LOGON, self._URL).send_many(messages, max_workers=2)
+        self.assertEqual(messages, [r.get_message() for r in results])
+        self.assertTrue(all(r.is_ok() and (r.get_response() == SuccessResponse()) for r in results))
+
+    @responses.activate
+    def test_error_response(self):
+        responses.post(self._URL, body='error {unknown station}', match=[matchers.query_param_matcher({'to': 'CALL1'}, strict_match=False)])
+        responses.post(self._URL, body='ok')
+        messages = [TelexMessage(self._STATION, 'CALL1', 'MESSAGE'), TelexMessage(self._STATION, 'CALL2', 'MESSAGE')]
+        results = HoppieConnector(self._STATION, self._LOGON, self._URL).send_many(messages)
+        self.assertFalse(results[0].is_ok())
+        self.assertIsInstance(results[0].get_error(), HoppieError)
+        self.assertEqual('unknown station', str(results[0].get_error()))
+        self.assertEqual(ErrorResponse('unknown station'), results[0].get_response())
+        self.assertTrue(results[1].is_ok())
+
+    @responses.activate
+    def test_connection_error(self):
+        responses.get(self._URL, status=500)
+        results = HoppieConnector(self._STATION, self._LOGON, self._URL).send_many([PeekMessage(self._STATION)])
+        self.assertIsInstance(results[0].get_error(), ConnectionError)
+
+class TestHoppieConnectorTiming(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._recorder = TimingRecorder()
+        self._UUT = HoppieConnector(self._STATION, self._LOGON, self._URL, on_timing=self._recorder)
+
+    @responses.activate
+    def test_poll(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE 1}} {CALLSIGN telex {MESSAGE 2}}')
+        self._UUT.poll()
+        counts = self._recorder.get_counts()
+        self.assertEqual(1, counts[TimingStage.HTTP])
+        self.assertEqual(1, counts[TimingStage.PARSE_RESPONSE])
+        self.assertEqual(2, counts[TimingStage.PARSE_MESSAGE])
+
+    @responses.activate
+    def test_iter_poll(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE 1}} {CALLSIGN telex {MESSAGE 2}}')
+        messages, _ = self._UUT.iter_poll()
+        self.assertEqual(1, self._recorder.get_counts()[TimingStage.PARSE_RESPONSE])
+        self.assertNotIn(TimingStage.PARSE_MESSAGE, self._recorder.get_counts())
+        list(messages)
+        self.assertEqual(2, self._recorder.get_counts()[TimingStage.PARSE_MESSAGE])
+
+class TestHoppieConnectorJournal(unittest.TestCase):
+    _URL = 'http://example.com/api'
+
+    @responses.activate
+    def test_iter_poll(self):
+        body = 'ok {CALLSIGN telex {MESSAGE 1}} {CALLSIGN telex {MESSAGE 2}}'
+        responses.get(self._URL, body=body)
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal, HoppieConnector('STATION', 'logon', self._URL, journal=journal) as cnx:
+                messages, _ = cnx.iter_poll()
+            # Journaled before the messages are consumed
+            self.assertEqual([('STATION', 'poll', body)], [(r.get_station(), r.get_request_type(), r.get_body()) for r in JournalReader(tmp)])
+        self.assertEqual(2, len(list(messages)))
+
+class TestHoppieConnectorCpdlcMin(unittest.TestCase):
+    _URL = 'http://example.com/api'
+
+    def _expect_packets(self, *packets: str):
+        for packet in packets:
+            responses.get(self._URL, body='ok', match=[matchers.query_param_matcher({'logon': 'logon', 'from': 'STATION', 'to': 'ATSU', 'type': 'cpdlc', 'packet': packet})])
+
+    def test_default_allocator(self):
+        UUT = HoppieConnector('STATION', 'logon', self._URL)
+        self.assertIsInstance(UUT.get_min_allocator(), MinAllocator)
+        self.assertIs(UUT.get_min_allocator().get_dialogues(), UUT.get_dialogue_manager())
+
+    @responses.activate
+    def test_default_allocator_skips_open_dialogues(self):
+        self._expect_packets('/data2/0//WU/CLIMB TO @FL350@', '/data2/1//WU/CLIMB TO @FL350@')
+        UUT = HoppieConnector('STATION', 'logon', self._URL, min_allocator=MinAllocator(limit=2))
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        with self.assertRaises(RuntimeError):
+            UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+
+    @responses.activate
+    def test_allocate_min(self):
+        self._expect_packets('/data2/0//N/TEST', '/data2/1//N/TEST')
+        UUT = HoppieConnector('STATION', 'logon', self._URL)
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.N, 'TEST')
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.N, 'TEST')
+
+    @responses.activate
+    def test_release_on_error(self):
+        responses.get(self._URL, body='error {illegal logon code}')
+        allocator = MinAllocator(limit=1)
+        UUT = HoppieConnector('STATION', 'logon', self._URL, min_allocator=allocator)
+        with self.assertRaises(HoppieError):
+            UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.N, 'TEST')
+        self.assertIs(allocator, UUT.get_min_allocator())
+        self.assertEqual(0, allocator.allocate('ATSU'))
+
+    @responses.activate
+    def test_dialogue_manager(self):
+        self._expect_packets('/data2/0//WU/CLIMB TO @FL350@', '/data2/1//WU/CLIMB TO @FL350@', '/data2/7//N/TEST')
+        dialogues = DialogueManager()
+        UUT = HoppieConnector('STATION', 'logon', self._URL, dialogue_manager=dialogues)
+        self.assertIs(dialogues, UUT.get_dialogue_manager())
+        self.assertIs(dialogues, UUT.get_min_allocator().get_dialogues())
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        UUT.send_cpdlc('ATSU', 7, CpdlcResponseRequirement.N, 'TEST')
+        self.assertEqual([0, 1], [d.get_min() for d in dialogues.get_awaiting_response()])
+
+class TestHoppieConnectorDialogues(unittest.TestCase):
+    _URL = 'http://example.com/api'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._dialogues = DialogueManager()
+        self._UUT = HoppieConnector('STATION', 'logon', self._URL, dialogue_manager=self._dialogues)
+
+    def _expect_receive(self, type: str, body: str):
+        responses.get(self._URL, body=body, match=[matchers.query_param_matcher({'type': type}, strict_match=False)])
+
+    def _send_request(self):
+        responses.get(self._URL, body='ok', match=[matchers.query_param_matcher({'type': 'cpdlc'}, strict_match=False)])
+        self._UUT.send_cpdlc('ATSU', None, CpdlcResponseRequirement.W_U, 'CLIMB TO @FL350@')
+        self.assertEqual(1, len(self._dialogues.get_awaiting_response()))
+
+    @responses.activate
+    def test_poll_closes_dialogue(self):
+        self._send_request()
+        self._expect_receive('poll', 'ok {ATSU cpdlc {/data2/3/0/N/WILCO}}')
+        self._UUT.poll()
+        self.assertEqual([], self._dialogues.get_awaiting_response())
+        self.assertEqual(1, self._UUT.get_min_allocator().allocate('ATSU'))
+
+    @responses.activate
+    def test_iter_poll_closes_dialogue(self):
+        self._send_request()
+        self._expect_receive('poll', 'ok {ATSU telex {HELLO}} {ATSU cpdlc {/data2/3/0/N/WILCO}}')
+        messages, _ = self._UUT.iter_poll()
+        self.assertEqual(1, len(self._dialogues.get_awaiting_response()))
+        self.assertEqual(2, len(list(messages)))
+        self.assertEqual([], self._dialogues.get_awaiting_response())
+
+    @responses.activate
+    def test_peek_registers_once(self):
+        self._expect_receive('peek', 'ok {1 ATSU telex {HELLO}} {2 ATSU cpdlc {/data2/5//WU/CLIMB TO @FL350@}}')
+        self._UUT.peek()
+        dialogue = self._dialogues.get_dialogue('ATSU', 5, outbound=False)
+        self._UUT.peek()
+        self.assertIs(dialogue, self._dialogues.get_dialogue('ATSU', 5, outbound=False))
+        self.assertTrue(dialogue.is_open())
+
+    @responses.activate
+    def test_iter_peek_closes_dialogue(self):
+        self._send_request()
+        self._expect_receive('peek', 'ok {1 ATSU cpdlc {/data2/3/0/N/WILCO}}')
+        self.assertEqual(1, len(list(self._UUT.iter_peek()[0])))
+        self.assertEqual([], self._dialogues.get_awaiting_response())
+
+    @responses.activate
+    def test_peek_since_closes_dialogue(self):
+        self._send_request()
+        self._expect_receive('peek', 'ok {1 ATSU cpdlc {/data2/3/0/N/WILCO}}')
+        self.assertEqual(1, len(list(self._UUT.peek_since()[0])))
+        self.assertEqual([], self._dialogues.get_awaiting_response())
+
+class TestHoppieConnectorPingFleet(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    def _ping_callback(self, request):
+        packet = parse_qs(urlparse(request.url).query).get('packet', [''])[0]
+        if packet == 'ALL-CALLSIGNS':
+            return (200, {}, 'ok {' + ' '.join(f"DLH{i:03d}" for i in range(0, 300, 2)) + '}')
+        return (200, {}, 'ok {' + ' '.join(s for s in packet.split() if int(s[3:]) % 2 == 0) + '}')
+
+    @responses.activate
+    def test_chunked(self):
+        responses.add_callback(responses.GET, self._URL, callback=self._ping_callback)
+        stations = [f"DLH{i:03d}" for i in range(60)]
+        online, delay = HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(stations)
+        self.assertEqual(stations[::2], online)
+        self.assertGreater(delay, timedelta(0))
+        packets = [parse_qs(urlparse(c.request.url).query)['packet'][0].split() for c in responses.calls]
+        self.assertEqual([24, 24, 12], sorted((len(p) for p in packets), reverse=True))
+
+    @responses.activate
+    def test_switch_to_all(self):
+        responses.add_callback(responses.GET, self._URL, callback=self._ping_callback)
+        stations = [f"DLH{i:03d}" for i in range(300)]
+        online, _ = HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(stations)
+        self.assertEqual(stations[::2], online)
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_switch_disabled(self):
+        responses.add_callback(responses.GET, self._URL, callback=self._ping_callback)
+        stations = [f"DLH{i:03d}" for i in range(300)]
+        online, _ = HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(stations, max_workers=4, all_threshold=None)
+        self.assertEqual(stations[::2], online)
+        self.assertEqual(13, len(responses.calls))
+
+    @responses.activate
+    def test_duplicates(self):
+        responses.add_callback(responses.GET, self._URL, callback=self._ping_callback)
+        self.assertEqual(['DLH000'], HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(['DLH000', 'DLH001', 'DLH000'])[0])
+        self.assertEqual('DLH000 DLH001', parse_qs(urlparse(responses.calls[0].request.url).query)['packet'][0])
+
+    def test_empty(self):
+        self.assertEqual([], HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet([])[0])
+
+    @responses.activate
+    def test_presence_cache(self):
+        responses.add_callback(responses.GET, self._URL, callback=self._ping_callback)
+        cache = PresenceCache()
+        cache.update(['DLH001'], ['DLH001'])
+        cnx = HoppieConnector(self._STATION, self._LOGON, self._URL, presence_cache=cache)
+        self.assertEqual(['DLH000', 'DLH001', 'DLH002'], cnx.ping_fleet(['DLH000', 'DLH001', 'DLH002'])[0])
+        self.assertEqual('DLH000 DLH002', parse_qs(urlparse(responses.calls[0].request.url).query)['packet'][0])
+        self.assertFalse(cache.is_online('DLH002') is None)
+        cnx.ping_fleet(['DLH000', 'DLH002'])
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_error_response(self):
+        responses.get(self._URL, body='error {illegal logon code}')
+        self.assertRaises(HoppieError, lambda: HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(['DLH000']))
+
+    @responses.activate
+    def test_connection_error(self):
+        responses.get(self._URL, status=500)
+        self.assertRaises(ConnectionError, lambda: HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(['DLH000']))
+
+    def test_invalid_station(self):
+        self.assertRaises(ValueError, lambda: HoppieConnector(self._STATION, self._LOGON, self._URL).ping_fleet(['invalid']))
+
+class TestHoppieConnectorPresenceCache(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._cache = PresenceCache(timedelta(seconds=60))
+        self._UUT = HoppieConnector(self._STATION, self._LOGON, self._URL, presence_cache=self._cache)
+
+    def _expect_ping(self, packet: str, body: str):
+        responses.get(self._URL, body=body, match=[
+            matchers.query_param_matcher({'logon': self._LOGON, 'from': self._STATION, 'to': 'SERVER', 'type': 'ping', 'packet': packet})
+        ])
+
+    @responses.activate
+    def test_cached(self):
+        self._expect_ping('CALL1 CALL2', 'ok {CALL1}')
+        self.assertEqual(['CALL1'], self._UUT.ping(['CALL1', 'CALL2'])[0])
+        online, delay = self._UUT.ping(['CALL2', 'CALL1'])
+        self.assertEqual(['CALL1'], online)
+        self.assertEqual(timedelta(0), delay)
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_connection_check(self):
+        responses.get(self._URL, body='ok {}', match=[
+            matchers.query_param_matcher({'logon': self._LOGON, 'from': self._STATION, 'to': 'SERVER', 'type': 'ping'})
+        ])
+        online, delay = self._UUT.ping([])
+        self.assertEqual([], online)
+        self.assertGreater(delay, timedelta(0))
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_query_stale_only(self):
+        self._cache.update(['CALL1', 'CALL2'], ['CALL2'])
+        self._expect_ping('CALL3', 'ok {CALL3}')
+        online, delay = self._UUT.ping(['CALL1', 'CALL2', 'CALL3'])
+        self.assertEqual(['CALL2', 'CALL3'], online)
+        self.assertGreater(delay, timedelta(0))
+
+    @responses.activate
+    def test_single_station(self):
+        self._expect_ping('CALL1', 'ok {}')
+        self.assertEqual([], self._UUT.ping('CALL1')[0])
+        self.assertEqual([], self._UUT.ping('CALL1')[0])
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_all_stations_bypass(self):
+        self._expect_ping('ALL-CALLSIGNS', 'ok {CALL1 CALL2}')
+        self.assertEqual(['CALL1', 'CALL2'], self._UUT.ping('*')[0])
+        self.assertEqual(['CALL1', 'CALL2'], self._UUT.ping('*')[0])
+        self.assertEqual(2, len(responses.calls))
+        self.assertTrue(self._cache.is_online('CALL2'))
+
+    @responses.activate
+    def test_connection_check_bypass(self):
+        responses.get(self._URL, body='ok {}')
+        self._UUT.ping()
+        self._UUT.ping()
+        self.assertEqual(2, len(responses.calls))
+
+    @responses.activate
+    def test_poll_marks_online(self):
+        responses.get(self._URL, body='ok {CALL1 telex {MESSAGE}}')
+        self._UUT.poll()
+        self.assertTrue(self._cache.is_online('CALL1'))
+
+    @responses.activate
+    def test_iter_poll_marks_online(self):
+        responses.get(self._URL, body='ok {CALL1 telex {MESSAGE}}')
+        messages, _ = self._UUT.iter_poll()
+        self.assertIsNone(self._cache.is_online('CALL1'))
+        list(messages)
+        self.assertTrue(self._cache.is_online('CALL1'))
+
+class TestHoppieConnectorResilience(unittest.TestCase):
+    _URL = 'http://example.com/api'
+
+    @responses.activate
+    def test_retry_and_circuit_breaker(self):
+        responses.get(self._URL, status=503)
+        breaker = CircuitBreaker(failure_threshold=2)
+        cnx = HoppieConnector('STATION', 'logon', self._URL, retry_policy=RetryPolicy(sleep=lambda _: None), circuit_breaker=breaker)
+        self.assertRaises(CircuitOpenError, cnx.peek)
+        self.assertEqual(2, len(responses.calls))
+
 class TestHoppieConnectorErrorHandling(unittest.TestCase):
     _URL = 'http://example.com/api'
     _LOGON = 'logon'
@@ -144,4 +515,145 @@ class TestHoppieConnectorErrorHandling(unittest.TestCase):
     @responses.activate
     def test_poll_warning(self):
         responses.get(self._URL, body='ok {CALLSIGN unknown {OTHER DATA}}')
-        self.assertWarns(HoppieWarning, lambda: HoppieConnector(self._STATION, self._LOGON, self._URL).poll())
\ No newline at end of file
+        self.assertWarns(HoppieWarning, lambda: HoppieConnector(self._STATION, self._LOGON, self._URL).poll())
+
+    @responses.activate
+    def test_peek_malformed_warning(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {MESSAGE}} {malformed}')
+        with self.assertWarns(HoppieWarning):
+            actual, _ = HoppieConnector(self._STATION, self._LOGON, self._URL).peek()
+        self.assertEqual(1, len(actual))
+
+    @responses.activate
+    def test_poll_malformed_warning(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE}} {malformed}')
+        with self.assertWarns(HoppieWarning):
+            actual, _ = HoppieConnector(self._STATION, self._LOGON, self._URL).poll()
+        self.assertEqual(1, len(actual))
+
+class TestHoppieConnectorIterators(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _LOGON = 'logon'
+    _STATION = 'STATION'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = HoppieConnector(self._STATION, self._LOGON, self._URL)
+
+    @responses.activate
+    def test_iter_peek(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {MESSAGE}} {2 CALLSIGN telex {OTHER}}', match=[
+            matchers.query_param_matcher({'logon': self._LOGON, 'from': self._STATION, 'to': 'SERVER', 'type': 'peek'})
+        ])
+        it, delay = self._UUT.iter_peek()
+        self.assertEqual((1, TelexMessage('CALLSIGN', self._STATION, 'MESSAGE')), next(it))
+        self.assertEqual((2, TelexMessage('CALLSIGN', self._STATION, 'OTHER')), next(it))
+        self.assertRaises(StopIteration, lambda: next(it))
+        self.assertGreater(delay, timedelta(0))
+
+    @responses.activate
+    def test_iter_poll(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE}}', match=[
+            matchers.query_param_matcher({'logon': self._LOGON, 'from': self._STATION, 'to': 'SERVER', 'type': 'poll'})
+        ])
+        it, _ = self._UUT.iter_poll()
+        self.assertListEqual([TelexMessage('CALLSIGN', self._STATION, 'MESSAGE')], list(it))
+
+    @responses.activate
+    def test_request_issued_before_iteration(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE}}')
+        self._UUT.iter_poll()
+        self.assertEqual(1, len(responses.calls))
+
+    @responses.activate
+    def test_lazy_parsing(self):
+        responses.get(self._URL, body='ok {CALLSIGN telex {MESSAGE}} {CALLSIGN unknown {DATA}}')
+        it, _ = self._UUT.iter_poll()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            next(it)
+        self.assertWarns(HoppieWarning, lambda: next(it, None))
+
+    @responses.activate
+    def test_malformed_warning(self):
+        responses.get(self._URL, body='ok {malformed} {1 CALLSIGN telex {MESSAGE}}')
+        it, _ = self._UUT.iter_peek()
+        with self.assertWarns(HoppieWarning):
+            actual = list(it)
+        self.assertEqual(1, len(actual))
+
+    @responses.activate
+    def test_error(self):
+        responses.get(self._URL, body='error {illegal logon code}')
+        self.assertRaises(HoppieError, self._UUT.iter_poll)
+
+class TestHoppieConnectorPeekSince(unittest.TestCase):
+    _URL = 'http://example.com/api'
+    _STATION = 'STATION'
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = HoppieConnector(self._STATION, 'logon', self._URL)
+
+    def _msg(self, text: str):
+        return TelexMessage('CALLSIGN', self._STATION, text)
+
+    @responses.activate
+    def test_initial_returns_all(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}}')
+        it, _ = self._UUT.peek_since()
+        self.assertListEqual([(1, self._msg('A')), (2, self._msg('B'))], list(it))
+        self.assertEqual(2, self._UUT.get_peek_cursor().get_last_id())
+
+    @responses.activate
+    def test_only_newer(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}}')
+        list(self._UUT.peek_since()[0])
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}} {3 CALLSIGN telex {C}}')
+        it, _ = self._UUT.peek_since()
+        self.assertListEqual([(3, self._msg('C'))], list(it))
+
+    @responses.activate
+    def test_explicit_last_id(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}}')
+        it, _ = self._UUT.peek_since(1)
+        self.assertListEqual([(2, self._msg('B'))], list(it))
+
+    @responses.activate
+    def test_skip_old_unparseable(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN unknown {A}} {2 CALLSIGN telex {B}}')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            it, _ = self._UUT.peek_since(1)
+            self.assertListEqual([(2, self._msg('B'))], list(it))
+
+    @responses.activate
+    def test_at_least_once(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}}')
+        it, _ = self._UUT.peek_since()
+        next(it)
+        self.assertIsNone(self._UUT.get_peek_cursor().get_last_id())
+        next(it)
+        self.assertEqual(1, self._UUT.get_peek_cursor().get_last_id())
+
+    @responses.activate
+    def test_advance_past_unparseable(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {malformed} {2 CALLSIGN unknown {B}}')
+        with self.assertWarns(HoppieWarning):
+            list(self._UUT.peek_since()[0])
+        self.assertEqual(2, self._UUT.get_peek_cursor().get_last_id())
+
+    @responses.activate
+    def test_empty(self):
+        responses.get(self._URL, body='ok')
+        self.assertListEqual([], list(self._UUT.peek_since()[0]))
+        self.assertIsNone(self._UUT.get_peek_cursor().get_last_id())
+
+    @responses.activate
+    def test_persisted_cursor(self):
+        responses.get(self._URL, body='ok {1 CALLSIGN telex {A}} {2 CALLSIGN telex {B}}')
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'cursor')
+            list(HoppieConnector(self._STATION, 'logon', self._URL, peek_cursor=PeekCursor(path)).peek_since()[0])
+            it, _ = HoppieConnector(self._STATION, 'logon', self._URL, peek_cursor=PeekCursor(path)).peek_since()
+            self.assertListEqual([], list(it))
@@ -1,5 +1,6 @@
 from hoppie_connector.Messages import HoppieMessage
 import copy
+import pickle
 import unittest
 
 class TestValidHoppieMessage(unittest.TestCase):
@@ -86,4 +87,48 @@ class TestHoppieMessageType(unittest.TestCase):
     def test_repr(self):
         expected = HoppieMessage.MessageType.ADS_C
         actual = eval(repr(expected))
-        self.assertEqual(expected, actual)
\ No newline at end of file
+        self.assertEqual(expected, actual)
+
+class TestHoppieMessageSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX), '__dict__'))
+
+    def test_subclasses_slotted(self):
+        pending = [HoppieMessage]
+        while pending:
+            cls = pending.pop()
+            self.assertIn('__slots__', vars(cls), cls.__name__)
+            pending.extend(cls.__subclasses__())
+
+class TestHoppieMessageImmutability(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX)
+
+    def test_set_attribute(self):
+        self.assertRaises(AttributeError, lambda: setattr(self._UUT, '_from', 'OTHER'))
+        self.assertEqual('CALLSIGN', self._UUT.get_from_name())
+
+    def test_set_unknown_attribute(self):
+        self.assertRaises(AttributeError, lambda: setattr(self._UUT, 'extra', 1))
+
+    def test_delete_attribute(self):
+        self.assertRaises(AttributeError, lambda: delattr(self._UUT, '_from'))
+
+    def test_copy(self):
+        self.assertEqual(self._UUT, copy.copy(self._UUT))
+        self.assertEqual(self._UUT, copy.deepcopy(self._UUT))
+
+    def test_pickle(self):
+        self._UUT.get_packet_content()
+        self.assertEqual(self._UUT, pickle.loads(pickle.dumps(self._UUT)))
+
+class TestHoppieMessageHash(unittest.TestCase):
+    def test_equal_hash(self):
+        value1 = HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX)
+        value2 = HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX)
+        self.assertEqual(hash(value1), hash(value2))
+
+    def test_deduplication(self):
+        values = [HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX), HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.TELEX), HoppieMessage('CALLSIGN', 'OPS', HoppieMessage.MessageType.CPDLC)]
+        self.assertEqual(2, len(set(values)))
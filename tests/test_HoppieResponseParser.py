@@ -10,6 +10,7 @@ class TestHoppieResponseParser(unittest.TestCase):
     def test_success_response(self): self.assertIsInstance(self._UUT.parse('ok'), SuccessResponse)
     def test_invalid_response(self): self.assertRaises(ValueError, lambda: self._UUT.parse('invalid'))
     def test_empty_response(self):   self.assertRaises(ValueError, lambda: self._UUT.parse(''))
+    def test_split(self):            self.assertEqual((HoppieResponse.ResponseCode.OK, '{A b {c}}'), self._UUT.split('ok {A b {c}} '))
 
 class TestHoppieResponseParserError(unittest.TestCase):
     def setUp(self) -> None:
@@ -6,4 +6,10 @@ class TestHoppieResponseParserFactory(unittest.TestCase):
     def test_create_poll(self):  self.assertIsInstance(HoppieResponseParserFactory().create_parser(HoppieMessage.MessageType.POLL), PollResponseParser)
     def test_create_peek(self):  self.assertIsInstance(HoppieResponseParserFactory().create_parser(HoppieMessage.MessageType.PEEK), PeekResponseParser)
     def test_create_ping(self):  self.assertIsInstance(HoppieResponseParserFactory().create_parser(HoppieMessage.MessageType.PING), PingResponseParser)
-    def test_create_telex(self): self.assertIsInstance(HoppieResponseParserFactory().create_parser(HoppieMessage.MessageType.TELEX), HoppieResponseParser)
\ No newline at end of file
+    def test_create_telex(self): self.assertIsInstance(HoppieResponseParserFactory().create_parser(HoppieMessage.MessageType.TELEX), HoppieResponseParser)
+    def test_create_invalid(self): self.assertRaises(ValueError, lambda: HoppieResponseParserFactory().create_parser('invalid'))
+
+    def test_reuse_instance(self):
+        factory = HoppieResponseParserFactory()
+        self.assertIs(factory.create_parser(HoppieMessage.MessageType.POLL), factory.create_parser(HoppieMessage.MessageType.POLL))
+        self.assertIs(factory.create_parser(HoppieMessage.MessageType.TELEX), factory.create_parser(HoppieMessage.MessageType.TELEX))
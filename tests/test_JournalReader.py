@@ -0,0 +1,71 @@
+from hoppie_connector.Journal import JournalReader, ResponseJournal
+from hoppie_connector.Messages import HoppieMessage
+import os
+import tempfile
+import unittest
+
+class TestJournalReader(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self._dir = self._tmp.name
+        with ResponseJournal(self._dir) as journal:
+            for i in range(3):
+                journal.append('CALLSIGN', HoppieMessage.MessageType.POLL, f"ok {i}")
+        self._segment = JournalReader(self._dir).get_segments()[0]
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+        super().tearDown()
+
+    def _bodies(self) -> list[str]:
+        return [r.get_body() for r in JournalReader(self._dir)]
+
+    def test_missing_directory(self):
+        self.assertEqual([], list(JournalReader(os.path.join(self._dir, 'missing'))))
+
+    def test_ignore_other_files(self):
+        with open(os.path.join(self._dir, 'notes.txt'), 'w') as f:
+            f.write('x')
+        self.assertEqual(['ok 0', 'ok 1', 'ok 2'], self._bodies())
+
+    def test_truncated_record(self):
+        with open(self._segment, 'r+b') as f:
+            f.truncate(os.path.getsize(self._segment) - 1)
+        self.assertEqual(['ok 0', 'ok 1'], self._bodies())
+
+    def test_truncated_prefix(self):
+        with open(self._segment, 'ab') as f:
+            f.write(b'\x10\x00')
+        self.assertEqual(['ok 0', 'ok 1', 'ok 2'], self._bodies())
+
+    def test_corrupt_record(self):
+        with open(self._segment, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            f.write(b'X')
+        self.assertEqual(['ok 0', 'ok 1'], self._bodies())
+
+    def test_invalid_length(self):
+        with open(self._segment, 'ab') as f:
+            f.write(b'\x01\x00\x00\x00\x00\x00\x00\x00X')
+        self.assertEqual(['ok 0', 'ok 1', 'ok 2'], self._bodies())
+
+    def test_continue_after_torn_segment(self):
+        with open(self._segment, 'r+b') as f:
+            f.truncate(os.path.getsize(self._segment) - 1)
+        with ResponseJournal(self._dir) as journal:
+            journal.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok 3')
+        self.assertEqual(['ok 0', 'ok 1', 'ok 3'], self._bodies())
+
+    def test_empty_segment(self):
+        open(os.path.join(self._dir, 'journal-00000001.seg'), 'wb').close()
+        self.assertEqual(['ok 0', 'ok 1', 'ok 2'], self._bodies())
+
+    def test_invalid_segment(self):
+        with open(os.path.join(self._dir, 'journal-00000001.seg'), 'wb') as f:
+            f.write(b'NOTAJOURNAL')
+        self.assertRaises(ValueError, lambda: self._bodies())
+
+class TestJournalReaderRepresentation(unittest.TestCase):
+    def test_repr(self):
+        self.assertEqual("JournalReader(directory='journal')", repr(eval(repr(JournalReader('journal')))))
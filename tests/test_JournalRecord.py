@@ -0,0 +1,33 @@
+from hoppie_connector.Journal import JournalRecord
+from hoppie_connector.Messages import HoppieMessage
+import datetime
+import unittest
+
+_TIMESTAMP = datetime.datetime(2024, 4, 3, 12, 0, tzinfo=datetime.UTC)
+
+class TestJournalRecord(unittest.TestCase):
+    def test_get_values(self):
+        UUT = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok')
+        self.assertEqual(_TIMESTAMP, UUT.get_timestamp())
+        self.assertEqual('CALLSIGN', UUT.get_station())
+        self.assertEqual(HoppieMessage.MessageType.POLL, UUT.get_request_type())
+        self.assertEqual('ok', UUT.get_body())
+
+class TestJournalRecordComparison(unittest.TestCase):
+    def test_equal_content(self):
+        value1 = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok')
+        value2 = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok')
+        self.assertEqual(value1, value2)
+
+    def test_differing_body(self):
+        value1 = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok')
+        value2 = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok {1 OPS telex {HELLO}}')
+        self.assertNotEqual(value1, value2)
+
+    def test_differing_type(self):
+        self.assertNotEqual(JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok'), None)
+
+class TestJournalRecordRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = JournalRecord(_TIMESTAMP, 'CALLSIGN', HoppieMessage.MessageType.PEEK, 'ok {1 OPS telex {HELLO}}')
+        self.assertEqual(expected, eval(repr(expected)))
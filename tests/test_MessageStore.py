@@ -0,0 +1,100 @@
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Messages import CpdlcMessage, HoppieMessage, PollMessage, TelexMessage
+from hoppie_connector.Store import MessageStore
+from datetime import datetime, timedelta, UTC
+import os
+import tempfile
+import threading
+import unittest
+
+_TIMESTAMP = datetime(2024, 4, 3, 12, 0, tzinfo=UTC)
+
+class TestMessageStore(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = MessageStore(clock=lambda: _TIMESTAMP.timestamp())
+        self._telex = TelexMessage('DLH123', 'OPS', 'HELLO')
+        self._request = CpdlcMessage('DLH123', 'EDDF', 1, CpdlcResponseRequirement.YES, 'REQUEST CLIMB TO @FL350@')
+        self._response = CpdlcMessage('EDDF', 'DLH123', 7, CpdlcResponseRequirement.NOT_REQUIRED, 'UNABLE', mrn=1)
+
+    def tearDown(self) -> None:
+        self._UUT.close()
+        super().tearDown()
+
+    def test_empty(self):
+        self.assertEqual(0, len(self._UUT))
+        self.assertEqual([], self._UUT.query())
+
+    def test_add_messages(self):
+        self.assertEqual(3, self._UUT.add_messages([self._telex, self._request, self._response]))
+        self.assertEqual([self._telex, self._request, self._response], self._UUT.query())
+        self.assertEqual(3, len(self._UUT))
+
+    def test_add_messages_single_transaction(self):
+        with self.assertRaises(ValueError):
+            self._UUT.add_messages([self._telex, PollMessage('OPS')])
+        self.assertEqual(0, len(self._UUT))
+
+    def test_add_peek_messages(self):
+        self.assertEqual(2, self._UUT.add_peek_messages([(10, self._telex), (11, self._request)]))
+        self.assertEqual(1, self._UUT.add_peek_messages([(11, self._request), (12, self._response)]))
+        self.assertEqual([self._request], self._UUT.query(peek_id=11))
+        self.assertEqual(3, len(self._UUT))
+
+    def test_query_by_station_and_type(self):
+        self._UUT.add_messages([self._telex, self._request, self._response])
+        self.assertEqual([self._telex, self._request], self._UUT.query(from_name='DLH123'))
+        self.assertEqual([self._request], self._UUT.query(from_name='DLH123', msg_type=HoppieMessage.MessageType.CPDLC))
+        self.assertEqual([self._response], self._UUT.query(to_name='DLH123'))
+        self.assertEqual(2, self._UUT.count(msg_type=HoppieMessage.MessageType.CPDLC))
+
+    def test_query_by_cpdlc_numbers(self):
+        self._UUT.add_messages([self._telex, self._request, self._response])
+        self.assertEqual([self._request], self._UUT.query(min=1))
+        self.assertEqual([self._response], self._UUT.query(mrn=1))
+
+    def test_cpdlc_numbers_indexed(self):
+        for where, index in (('min = 1', 'messages_min'), ("from_name = 'DLH123' AND min = 1", 'messages_min'), ('mrn = 1', 'messages_mrn'), ("to_name = 'DLH123' AND mrn = 1", 'messages_mrn')):
+            with self.subTest(where=where):
+                plan = self._UUT._db.execute(f"EXPLAIN QUERY PLAN SELECT * FROM messages WHERE {where}").fetchall()
+                self.assertIn(f"USING INDEX {index}", plan[0][3])
+
+    def test_query_by_time(self):
+        self._UUT.add_messages([self._telex], received=_TIMESTAMP - timedelta(hours=2))
+        self._UUT.add_messages([self._request], received=_TIMESTAMP - timedelta(minutes=30))
+        self._UUT.add_messages([self._response])
+        self.assertEqual([self._request, self._response], self._UUT.query(since=_TIMESTAMP - timedelta(hours=1)))
+        self.assertEqual([self._telex, self._request], self._UUT.query(until=_TIMESTAMP))
+
+    def test_query_order(self):
+        self._UUT.add_messages([self._response], received=_TIMESTAMP)
+        self._UUT.add_messages([self._telex, self._request], received=_TIMESTAMP - timedelta(minutes=1))
+        self.assertEqual([self._telex, self._request, self._response], self._UUT.query())
+
+    def test_query_limit(self):
+        self._UUT.add_messages([self._telex, self._request, self._response])
+        self.assertEqual([self._telex, self._request], self._UUT.query(limit=2))
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'messages.db')
+            with MessageStore(path) as store:
+                store.add_messages([self._telex])
+            with MessageStore(path) as store:
+                self.assertEqual([self._telex], store.query())
+
+    def test_shared_between_threads(self):
+        def _add(n: int) -> None:
+            for i in range(20):
+                self._UUT.add_messages([TelexMessage(f"DLH{n}", 'OPS', f"HELLO {i}")])
+                self._UUT.query(from_name=f"DLH{n}")
+        threads = [threading.Thread(target=_add, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(80, len(self._UUT))
+        self.assertEqual(20, self._UUT.count(from_name='DLH0'))
+
+    def test_repr(self):
+        self.assertEqual("MessageStore(path=':memory:')", repr(self._UUT))
@@ -0,0 +1,104 @@
+from hoppie_connector.CPDLC import CpdlcResponseRequirement
+from hoppie_connector.Dialogue import DialogueManager, MinAllocator
+from hoppie_connector.Messages import CpdlcMessage
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import unittest
+
+class _FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def _uplink(min: int) -> CpdlcMessage:
+    return CpdlcMessage('EDDF', 'DLH123', min, CpdlcResponseRequirement.WILCO_UNABLE, 'CLIMB TO @FL350@')
+
+class TestMinAllocator(unittest.TestCase):
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            MinAllocator(limit=0)
+
+    def test_sequence_per_peer(self):
+        UUT = MinAllocator()
+        self.assertEqual([0, 1, 2], [UUT.allocate('DLH123') for _ in range(3)])
+        self.assertEqual([0, 1], [UUT.allocate('BAW456') for _ in range(2)])
+
+    def test_wraparound(self):
+        UUT = MinAllocator(limit=3)
+        for min in range(3):
+            UUT.release('DLH123', UUT.allocate('DLH123'))
+        self.assertEqual(0, UUT.allocate('DLH123'))
+
+    def test_skip_reserved(self):
+        UUT = MinAllocator(limit=3)
+        self.assertEqual(0, UUT.allocate('DLH123'))
+        UUT.release('DLH123', UUT.allocate('DLH123'))
+        UUT.release('DLH123', UUT.allocate('DLH123'))
+        self.assertEqual(1, UUT.allocate('DLH123'))
+
+    def test_exhausted(self):
+        UUT = MinAllocator(limit=2)
+        UUT.allocate('DLH123')
+        UUT.allocate('DLH123')
+        with self.assertRaises(RuntimeError):
+            UUT.allocate('DLH123')
+        UUT.release('DLH123', 1)
+        self.assertEqual(1, UUT.allocate('DLH123'))
+
+    def test_skip_open_dialogues(self):
+        dialogues = DialogueManager()
+        UUT = MinAllocator(limit=2, dialogues=dialogues)
+        self.assertIs(dialogues, UUT.get_dialogues())
+        min = UUT.allocate('DLH123')
+        dialogues.add_outbound(CpdlcMessage('EDDF', 'DLH123', min, CpdlcResponseRequirement.WILCO_UNABLE, 'CLIMB TO @FL350@'))
+        UUT.release('DLH123', min)
+        UUT.release('DLH123', UUT.allocate('DLH123'))
+        self.assertEqual(1, UUT.allocate('DLH123'))
+
+        # Reused once the dialogue is closed
+        UUT.release('DLH123', 1)
+        dialogues.add_inbound(CpdlcMessage('DLH123', 'EDDF', 5, CpdlcResponseRequirement.NOT_REQUIRED, 'WILCO', mrn=min))
+        self.assertEqual(0, UUT.allocate('DLH123'))
+
+    def test_reuse_after_timeout(self):
+        clock = _FakeClock()
+        dialogues = DialogueManager(timeout=timedelta(seconds=60), clock=clock)
+        UUT = MinAllocator(limit=2, dialogues=dialogues)
+        for _ in range(2):
+            min = UUT.allocate('DLH123')
+            dialogues.add_outbound(_uplink(min))
+            UUT.release('DLH123', min)
+        with self.assertRaises(RuntimeError):
+            UUT.allocate('DLH123')
+        clock.now += 60
+        self.assertEqual(0, UUT.allocate('DLH123'))
+
+    def test_private_dialogues(self):
+        UUT = MinAllocator(limit=2)
+        dialogues = UUT.get_dialogues()
+        self.assertIsInstance(dialogues, DialogueManager)
+        dialogues.add_outbound(_uplink(UUT.allocate('DLH123')))
+        UUT.release('DLH123', 0)
+        UUT.release('DLH123', UUT.allocate('DLH123'))
+        # Not reused while unanswered, instead of wrapping around
+        self.assertEqual(1, UUT.allocate('DLH123'))
+
+    def test_private_dialogues_expire(self):
+        clock = _FakeClock()
+        UUT = MinAllocator(limit=1)
+        UUT.get_dialogues()._clock = clock
+        UUT.get_dialogues().add_outbound(_uplink(0))
+        clock.now += DialogueManager.TIMEOUT.total_seconds()
+        self.assertEqual(0, UUT.allocate('DLH123'))
+        self.assertEqual(0, len(UUT.get_dialogues()))
+
+    def test_concurrent(self):
+        UUT = MinAllocator()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            mins = list(executor.map(lambda _: UUT.allocate('DLH123'), range(64)))
+        self.assertEqual(list(range(64)), sorted(mins))
+
+    def test_repr(self):
+        self.assertEqual('MinAllocator(limit=64)', repr(MinAllocator()))
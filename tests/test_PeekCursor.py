@@ -0,0 +1,69 @@
+from hoppie_connector.Cursor import PeekCursor
+import os
+import tempfile
+import unittest
+
+class TestPeekCursorInMemory(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = PeekCursor()
+
+    def test_initial(self):
+        self.assertIsNone(self._UUT.get_last_id())
+
+    def test_advance(self):
+        self._UUT.advance(5)
+        self._UUT.advance(3)
+        self.assertEqual(5, self._UUT.get_last_id())
+
+    def test_reset(self):
+        self._UUT.advance(5)
+        self._UUT.reset(2)
+        self.assertEqual(2, self._UUT.get_last_id())
+
+    def test_save_without_path(self):
+        self._UUT.advance(5)
+        self._UUT.save()
+        self.assertEqual(5, self._UUT.get_last_id())
+
+class TestPeekCursorPersisted(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, 'cursor')
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+        super().tearDown()
+
+    def test_missing_file(self):
+        self.assertIsNone(PeekCursor(self._path).get_last_id())
+
+    def test_save_and_load(self):
+        cursor = PeekCursor(self._path)
+        cursor.advance(42)
+        cursor.save()
+        self.assertEqual(42, PeekCursor(self._path).get_last_id())
+        self.assertFalse(os.path.exists(self._path + '.tmp'))
+
+    def test_save_reset(self):
+        cursor = PeekCursor(self._path)
+        cursor.advance(42)
+        cursor.save()
+        cursor.reset()
+        cursor.save()
+        self.assertIsNone(PeekCursor(self._path).get_last_id())
+
+    def test_save_unchanged(self):
+        cursor = PeekCursor(self._path)
+        cursor.save()
+        self.assertFalse(os.path.exists(self._path))
+
+    def test_invalid_file(self):
+        with open(self._path, 'w') as f:
+            f.write('invalid')
+        self.assertRaises(ValueError, lambda: PeekCursor(self._path))
+
+class TestPeekCursorRepresentation(unittest.TestCase):
+    def test_repr(self):
+        self.assertEqual("PeekCursor(path='state')", repr(PeekCursor('state')))
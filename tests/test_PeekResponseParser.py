@@ -50,6 +50,22 @@ class TestPeekResponseParser(unittest.TestCase):
         actual: PeekSuccessResponse = self._UUT.parse('ok {1 FROM type {packet}} {invalid} {3 FROM type {packet}}')
         self.assertListEqual(expected, actual.get_data())
 
+    def test_report_malformed_items(self):
+        actual: PeekSuccessResponse = self._UUT.parse('ok {1 FROM type {packet}} {invalid} {FROM type {packet}}')
+        self.assertListEqual(['{invalid}', '{FROM type {packet}}'], actual.get_malformed_items())
+
+    def test_iter_data_items(self):
+        expected = [
+            ({'id': 1, 'from': 'FROM', 'type': 'type', 'packet': 'packet'}, '{1 FROM type {packet}}'),
+            (None, '{invalid}')
+        ]
+        self.assertListEqual(expected, list(self._UUT.iter_data_items('{1 FROM type {packet}} {invalid}')))
+
+    def test_malformed_item_variants(self):
+        actual: PeekSuccessResponse = self._UUT.parse('ok {1 A b {c} {2 D e {f}} {unterminated')
+        self.assertListEqual([{'id': 2, 'from': 'D', 'type': 'e', 'packet': 'f'}], actual.get_data())
+        self.assertListEqual(['{1 A b {c}', '{unterminated'], actual.get_malformed_items())
+
     def test_space_in_type_name(self):
         expected = [{'id': 1, 'from': 'FROM', 'type': 'type name', 'packet': ''}]
         actual: PeekSuccessResponse = self._UUT.parse('ok {1 FROM type name {}}')
@@ -7,6 +7,12 @@ class TestPeekSuccessResponse(unittest.TestCase):
         actual = PeekSuccessResponse([]).get_code()
         self.assertEqual(expected, actual)
 
+    def test_get_malformed_items(self):
+        self.assertListEqual(['{x}'], PeekSuccessResponse([], ['{x}']).get_malformed_items())
+
+    def test_compare_differing_malformed(self):
+        self.assertNotEqual(PeekSuccessResponse([]), PeekSuccessResponse([], ['{x}']))
+
     def test_compare_same(self):
         value1 = PeekSuccessResponse([])
         value2 = value1
@@ -18,7 +24,7 @@ class TestPeekSuccessResponse(unittest.TestCase):
         self.assertEqual(expected, actual)
 
     def test_repr(self):
-        expected = PeekSuccessResponse([])
+        expected = PeekSuccessResponse([], ['{x}'])
         actual = eval(repr(expected))
         self.assertEqual(expected, actual)
 
@@ -30,4 +30,17 @@ class TestPingMessageRepresentation(unittest.TestCase):
     def test_repr(self):
         expected = PingMessage('STATION')
         actual = eval(repr(expected))
-        self.assertEqual(expected, actual)
\ No newline at end of file
+        self.assertEqual(expected, actual)
+
+class TestPingMessageImmutability(unittest.TestCase):
+    def test_input_list_copied(self):
+        stations = ['OPS']
+        msg = PingMessage('CALLSIGN', stations)
+        stations.append('CALLSIGN')
+        self.assertEqual(['OPS'], msg.get_stations())
+
+    def test_returned_list_copied(self):
+        msg = PingMessage('CALLSIGN', ['OPS'])
+        msg.get_stations().append('CALLSIGN')
+        self.assertEqual(['OPS'], msg.get_stations())
+        self.assertEqual('OPS', msg.get_packet_content())
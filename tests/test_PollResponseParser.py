@@ -42,6 +42,36 @@ class TestPollResponseParser(unittest.TestCase):
         actual: PollSuccessResponse = self._UUT.parse('ok {FROM type {packet}} {invalid} {FROM type {packet}}')
         self.assertListEqual(expected, actual.get_data())
 
+    def test_report_malformed_items(self):
+        actual: PollSuccessResponse = self._UUT.parse('ok {FROM type {packet}} {invalid} {1 FROM type {packet}}')
+        self.assertListEqual(['{invalid}', '{1 FROM type {packet}}'], actual.get_malformed_items())
+
+    def test_iter_data_items(self):
+        expected = [
+            ({'from': 'FROM', 'type': 'type', 'packet': 'packet'}, '{FROM type {packet}}'),
+            (None, '{invalid}')
+        ]
+        self.assertListEqual(expected, list(self._UUT.iter_data_items('{FROM type {packet}} {invalid}')))
+
+    def test_malformed_item_variants(self):
+        actual: PollSuccessResponse = self._UUT.parse('ok {A b {c} {D e {f}} {G h {i}} {unterminated')
+        self.assertListEqual([{'from': 'D', 'type': 'e', 'packet': 'f'}, {'from': 'G', 'type': 'h', 'packet': 'i'}], actual.get_data())
+        self.assertListEqual(['{A b {c}', '{unterminated'], actual.get_malformed_items())
+
+    def test_unterminated_packet(self):
+        actual: PollSuccessResponse = self._UUT.parse('ok {FROM type {packet')
+        self.assertListEqual(['{FROM type {packet'], actual.get_malformed_items())
+
+    def test_multiline_packet(self):
+        expected = [{'from': 'FROM', 'type': 'type', 'packet': 'line1\nline2'}]
+        actual: PollSuccessResponse = self._UUT.parse('ok {FROM type {line1\nline2}}')
+        self.assertListEqual(expected, actual.get_data())
+
+    def test_large_backlog(self):
+        actual: PollSuccessResponse = self._UUT.parse('ok ' + ' '.join(f"{{FROM telex {{MESSAGE {i}}}}}" for i in range(10000)))
+        self.assertEqual(10000, len(actual.get_data()))
+        self.assertEqual('MESSAGE 9999', actual.get_data()[-1]['packet'])
+
     def test_space_in_type_name(self):
         expected = [{'from': 'FROM', 'type': 'type name', 'packet': ''}]
         actual: PollSuccessResponse = self._UUT.parse('ok {FROM type name {}}')
@@ -0,0 +1,327 @@
+from hoppie_connector import AsyncHoppieConnector, HoppieConnector
+from hoppie_connector.Messages import TelexMessage
+from hoppie_connector.Scheduler import AsyncPollScheduler, PollScheduler
+from apiserver import ApiServer
+from datetime import timedelta
+import asyncio
+import responses
+import threading
+import time
+import unittest
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+    def __call__(self) -> float:
+        return self.now
+
+class FakeConnector(object):
+    def __init__(self, station: str, results: list | None = None):
+        self._station = station
+        self._results = results if results is not None else []
+        self.polls = 0
+    def get_station_name(self) -> str:
+        return self._station
+    def poll(self):
+        self.polls += 1
+        result = self._results.pop(0) if self._results else []
+        if isinstance(result, Exception):
+            raise result
+        return result, timedelta(seconds=0.1)
+
+class FakeAsyncConnector(FakeConnector):
+    async def poll(self):
+        await asyncio.sleep(0)
+        return super().poll()
+
+class BarrierConnector(FakeConnector):
+    def __init__(self, station: str, barrier: threading.Barrier):
+        super().__init__(station)
+        self._barrier = barrier
+    def poll(self):
+        self._barrier.wait()
+        return super().poll()
+
+def _msg(station: str):
+    return TelexMessage('OPS', station, 'MESSAGE')
+
+class TestPollSchedulerSpreading(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = FakeClock()
+        self._UUT = PollScheduler(clock=self._clock)
+
+    def test_first_station_due_immediately(self):
+        self._UUT.add(FakeConnector('STN0'))
+        self.assertEqual(self._clock.now, self._UUT.get_next_due('STN0'))
+
+    def test_spread_over_idle_interval(self):
+        for i in range(10):
+            self._UUT.add(FakeConnector(f"STN{i}"))
+        offsets = sorted(self._UUT.get_next_due(s) - self._clock.now for s in self._UUT.get_stations())
+        gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+        self.assertLess(offsets[-1], 60.0)
+        self.assertGreater(min(gaps), 60.0 / 10 / 3)
+
+    def test_duplicate_station(self):
+        self._UUT.add(FakeConnector('STN0'))
+        self.assertRaises(ValueError, lambda: self._UUT.add(FakeConnector('STN0')))
+
+    def test_invalid_intervals(self):
+        self.assertRaises(ValueError, lambda: PollScheduler(idle_interval=timedelta(seconds=10), active_interval=timedelta(seconds=20)))
+        self.assertRaises(ValueError, lambda: PollScheduler(active_interval=timedelta(0)))
+
+    def test_invalid_max_workers(self):
+        self.assertRaises(ValueError, lambda: PollScheduler(max_workers=0))
+
+class TestPollSchedulerCadence(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = FakeClock()
+        self._UUT = PollScheduler(clock=self._clock)
+
+    def test_idle_cadence(self):
+        cnx = FakeConnector('STN0')
+        self._UUT.add(cnx)
+        self.assertDictEqual({'STN0': []}, self._UUT.poll_due())
+        self.assertEqual(self._clock.now + 60.0, self._UUT.get_next_due('STN0'))
+        self.assertDictEqual({}, self._UUT.poll_due())
+        self.assertEqual(1, cnx.polls)
+
+    def test_active_after_messages(self):
+        self._UUT.add(FakeConnector('STN0', [[_msg('STN0')]]))
+        self.assertDictEqual({'STN0': [_msg('STN0')]}, self._UUT.poll_due())
+        self.assertTrue(self._UUT.is_active('STN0'))
+        self.assertEqual(self._clock.now + 20.0, self._UUT.get_next_due('STN0'))
+
+    def test_return_to_idle(self):
+        self._UUT.add(FakeConnector('STN0', [[_msg('STN0')]]))
+        self._UUT.poll_due()
+        for _ in range(6):
+            self._clock.now += 20.0
+            self._UUT.poll_due()
+        self.assertFalse(self._UUT.is_active('STN0'))
+        self.assertEqual(self._clock.now + 60.0, self._UUT.get_next_due('STN0'))
+
+    def test_notify_activity_reschedules(self):
+        self._UUT.add(FakeConnector('STN0'))
+        self._UUT.poll_due()
+        self._clock.now += 5.0
+        self._UUT.notify_activity('STN0')
+        self.assertEqual(self._clock.now + 15.0, self._UUT.get_next_due('STN0'))
+        self.assertEqual(timedelta(seconds=15.0), self._UUT.get_sleep_time())
+        self._clock.now += 15.0
+        self.assertIn('STN0', self._UUT.poll_due())
+
+    def test_notify_activity_before_first_poll(self):
+        self._UUT.add(FakeConnector('STN0'))
+        self._UUT.notify_activity('STN0')
+        self.assertEqual(self._clock.now, self._UUT.get_next_due('STN0'))
+        self.assertTrue(self._UUT.is_active('STN0'))
+
+    def test_notify_activity_keeps_earlier_due(self):
+        self._UUT.add(FakeConnector('STN0', [[_msg('STN0')]]))
+        self._UUT.poll_due()
+        self._UUT.notify_activity('STN0')
+        self.assertEqual(self._clock.now + 20.0, self._UUT.get_next_due('STN0'))
+
+    def test_remove(self):
+        cnx = FakeConnector('STN0')
+        self._UUT.add(cnx)
+        self._UUT.remove('STN0')
+        self.assertListEqual([], self._UUT.get_stations())
+        self.assertIsNone(self._UUT.get_sleep_time())
+        self.assertDictEqual({}, self._UUT.poll_due())
+        self.assertEqual(0, cnx.polls)
+
+class TestPollSchedulerErrorHandling(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = FakeClock()
+        self._UUT = PollScheduler(clock=self._clock)
+
+    def test_raise_without_handler(self):
+        self._UUT.add(FakeConnector('STN0', [ConnectionError('down')]))
+        self.assertRaises(ConnectionError, self._UUT.poll_due)
+        self.assertEqual(self._clock.now + 60.0, self._UUT.get_next_due('STN0'))
+
+    def test_error_handler(self):
+        errors = []
+        self._UUT.add(FakeConnector('STN0', [ConnectionError('down')]))
+        self._UUT.add(FakeConnector('STN1'))
+        self._clock.now += 60.0
+        self.assertDictEqual({'STN1': []}, self._UUT.poll_due(lambda s, e: errors.append(s)))
+        self.assertListEqual(['STN0'], errors)
+
+    def test_raise_keeps_messages(self):
+        self._UUT.add(FakeConnector('STN0', [ConnectionError('down')]))
+        self._UUT.add(FakeConnector('STN1', [[_msg('STN1')]]))
+        self._UUT.add(FakeConnector('STN2', [TimeoutError('slow')]))
+        self._clock.now += 60.0
+        self.assertRaises(ConnectionError, self._UUT.poll_due)
+        self.assertDictEqual({'STN1': [_msg('STN1')]}, self._UUT.poll_due())
+
+class TestPollSchedulerConcurrency(unittest.TestCase):
+    def test_concurrent_polls(self):
+        barrier = threading.Barrier(3, timeout=5.0)
+        clock = FakeClock()
+        uut = PollScheduler(max_workers=3, clock=clock)
+        for i in range(3):
+            uut.add(BarrierConnector(f"STN{i}", barrier))
+        clock.now += 60.0
+        self.assertDictEqual({'STN0': [], 'STN1': [], 'STN2': []}, uut.poll_due())
+
+    def test_remove_while_due(self):
+        clock = FakeClock()
+        uut = PollScheduler(clock=clock)
+        uut.add(FakeConnector('STN0'))
+        now, due = uut._take_due()
+        uut.remove('STN0')
+        self.assertDictEqual({'STN0': []}, uut._complete(now, due, [[]], None))
+        self.assertIsNone(uut.get_sleep_time())
+
+class TimedConnector(FakeConnector):
+    def __init__(self, station: str):
+        super().__init__(station)
+        self.times = []
+    def poll(self):
+        self.times.append(time.monotonic())
+        return super().poll()
+
+class TimedAsyncConnector(TimedConnector):
+    async def poll(self):
+        return TimedConnector.poll(self)
+
+class TestPollSchedulerRun(unittest.TestCase):
+    def test_run_until_stopped(self):
+        uut = PollScheduler(idle_interval=timedelta(seconds=0.02), active_interval=timedelta(seconds=0.01))
+        uut.add(FakeConnector('STN0', [[_msg('STN0')], [], [_msg('STN0')]]))
+        stop = threading.Event()
+        received = []
+        def _on_messages(station, messages):
+            received.append(station)
+            if len(received) == 2:
+                stop.set()
+        uut.run(_on_messages, stop)
+        self.assertListEqual(['STN0', 'STN0'], received)
+
+    def test_run_without_stations(self):
+        stop = threading.Event()
+        threading.Timer(0.05, stop.set).start()
+        PollScheduler().run(lambda s, m: None, stop)
+        self.assertTrue(stop.is_set())
+
+    def test_notify_wakes_run(self):
+        uut = PollScheduler(idle_interval=timedelta(seconds=1.0), active_interval=timedelta(seconds=0.2))
+        # Only the wake-up ends the sleep early
+        uut._STOP_CHECK_INTERVAL = 10.0
+        connector = TimedConnector('STN0')
+        uut.add(connector)
+        stop = threading.Event()
+        thread = threading.Thread(target=uut.run, args=(lambda s, m: None, stop))
+        thread.start()
+        while not connector.times:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        uut.notify_activity('STN0')
+        while len(connector.times) < 2:
+            time.sleep(0.01)
+        stop.set()
+        thread.join()
+        self.assertLess(connector.times[1] - connector.times[0], 0.5)
+
+    def test_add_from_other_thread(self):
+        uut = PollScheduler(idle_interval=timedelta(seconds=0.05), active_interval=timedelta(seconds=0.05))
+        connectors = [TimedConnector(f"STN{i}") for i in range(20)]
+        stop = threading.Event()
+        thread = threading.Thread(target=uut.run, args=(lambda s, m: None, stop))
+        thread.start()
+        for c in connectors:
+            uut.add(c)
+            uut.notify_activity(c.get_station_name())
+        while not all(len(c.times) >= 2 for c in connectors):
+            time.sleep(0.01)
+        stop.set()
+        thread.join()
+        self.assertEqual(20, len(uut.get_stations()))
+
+    @responses.activate
+    def test_with_connector(self):
+        responses.get('http://example.com/api', body='ok {OPS telex {MESSAGE}}')
+        uut = PollScheduler()
+        uut.add(HoppieConnector('STN0', 'logon', 'http://example.com/api'))
+        self.assertDictEqual({'STN0': [_msg('STN0')]}, uut.poll_due())
+
+class TestAsyncPollScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_poll_due(self):
+        clock = FakeClock()
+        uut = AsyncPollScheduler(max_workers=2, clock=clock)
+        uut.add(FakeAsyncConnector('STN0', [[_msg('STN0')]]))
+        uut.add(FakeAsyncConnector('STN1', [ConnectionError('down')]))
+        uut.add(FakeAsyncConnector('STN2'))
+        clock.now += 60.0
+        errors = []
+        self.assertDictEqual({'STN0': [_msg('STN0')], 'STN2': []}, await uut.poll_due(lambda s, e: errors.append(s)))
+        self.assertListEqual(['STN1'], errors)
+        self.assertTrue(uut.is_active('STN0'))
+        self.assertEqual(clock.now + 60.0, uut.get_next_due('STN1'))
+
+    async def test_with_connector(self):
+        server = ApiServer()
+        url = await server.start()
+        server.add('ok {OPS telex {MESSAGE}}', repeat=True)
+        clock = FakeClock()
+        uut = AsyncPollScheduler(clock=clock)
+        connectors = [AsyncHoppieConnector(f"STN{i}", 'logon', url) for i in range(3)]
+        for c in connectors:
+            uut.add(c)
+        clock.now += 60.0
+        self.assertDictEqual({f"STN{i}": [_msg(f"STN{i}")] for i in range(3)}, await uut.poll_due())
+        for c in connectors:
+            await c.close()
+        await server.close()
+
+    async def test_run_until_stopped(self):
+        uut = AsyncPollScheduler(idle_interval=timedelta(seconds=0.02), active_interval=timedelta(seconds=0.01))
+        uut.add(FakeAsyncConnector('STN0', [[_msg('STN0')], [], [_msg('STN0')]]))
+        stop = asyncio.Event()
+        received = []
+        def _on_messages(station, messages):
+            received.append(station)
+            if len(received) == 2:
+                stop.set()
+        await asyncio.wait_for(uut.run(_on_messages, stop), 5.0)
+        self.assertListEqual(['STN0', 'STN0'], received)
+
+    async def test_notify_wakes_run(self):
+        uut = AsyncPollScheduler(idle_interval=timedelta(seconds=1.0), active_interval=timedelta(seconds=0.2))
+        connector = TimedAsyncConnector('STN0')
+        uut.add(connector)
+        stop = asyncio.Event()
+        task = asyncio.ensure_future(uut.run(lambda s, m: None, stop))
+        while not connector.times:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        uut.notify_activity('STN0')
+        while len(connector.times) < 2:
+            await asyncio.sleep(0.01)
+        stop.set()
+        await asyncio.wait_for(task, 5.0)
+        self.assertLess(connector.times[1] - connector.times[0], 0.5)
+
+    async def test_run_without_stations(self):
+        stop = asyncio.Event()
+        uut = AsyncPollScheduler(idle_interval=timedelta(seconds=0.01), active_interval=timedelta(seconds=0.01))
+        task = asyncio.ensure_future(uut.run(lambda s, m: None, stop))
+        await asyncio.sleep(0.03)
+        stop.set()
+        await asyncio.wait_for(task, 5.0)
+
+class TestPollSchedulerRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = 'PollScheduler(idle_interval=datetime.timedelta(seconds=60), active_interval=datetime.timedelta(seconds=20), active_timeout=datetime.timedelta(seconds=120), max_workers=10)'
+        self.assertEqual(expected, repr(PollScheduler()))
+
+    def test_repr_async(self):
+        expected = 'AsyncPollScheduler(idle_interval=datetime.timedelta(seconds=60), active_interval=datetime.timedelta(seconds=20), active_timeout=datetime.timedelta(seconds=120), max_workers=10)'
+        self.assertEqual(expected, repr(AsyncPollScheduler()))
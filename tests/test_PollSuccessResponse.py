@@ -7,6 +7,12 @@ class TestPollSuccessResponse(unittest.TestCase):
         actual = PollSuccessResponse([]).get_code()
         self.assertEqual(expected, actual)
 
+    def test_get_malformed_items(self):
+        self.assertListEqual(['{x}'], PollSuccessResponse([], ['{x}']).get_malformed_items())
+
+    def test_compare_differing_malformed(self):
+        self.assertNotEqual(PollSuccessResponse([]), PollSuccessResponse([], ['{x}']))
+
     def test_compare_same(self):
         value1 = PollSuccessResponse([])
         value2 = value1
@@ -18,7 +24,7 @@ class TestPollSuccessResponse(unittest.TestCase):
         self.assertEqual(expected, actual)
 
     def test_repr(self):
-        expected = PollSuccessResponse([])
+        expected = PollSuccessResponse([], ['{x}'])
         actual = eval(repr(expected))
         self.assertEqual(expected, actual)
 
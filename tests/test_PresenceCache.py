@@ -0,0 +1,56 @@
+from hoppie_connector.Presence import PresenceCache
+from datetime import timedelta
+import datetime
+import unittest
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self) -> float:
+        return self.now
+
+class TestPresenceCache(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._clock = _Clock()
+        self._UUT = PresenceCache(timedelta(seconds=60), self._clock)
+
+    def test_unknown(self):
+        self.assertIsNone(self._UUT.is_online('CALLSIGN'))
+        self.assertEqual(['CALLSIGN'], self._UUT.get_stale(['CALLSIGN']))
+
+    def test_update(self):
+        self._UUT.update(['CALL1', 'CALL2'], ['CALL1'])
+        self.assertTrue(self._UUT.is_online('CALL1'))
+        self.assertFalse(self._UUT.is_online('CALL2'))
+        self.assertEqual(['CALL3'], self._UUT.get_stale(['CALL1', 'CALL3', 'CALL2']))
+
+    def test_update_unrequested_online(self):
+        self._UUT.update([], ['CALL1'])
+        self.assertTrue(self._UUT.is_online('CALL1'))
+
+    def test_mark_online(self):
+        self._UUT.update(['CALL1'], [])
+        self._UUT.mark_online('CALL1')
+        self.assertTrue(self._UUT.is_online('CALL1'))
+
+    def test_expiry(self):
+        self._UUT.update(['CALL1'], ['CALL1'])
+        self._clock.now = 59.9
+        self.assertTrue(self._UUT.is_online('CALL1'))
+        self._clock.now = 60.0
+        self.assertIsNone(self._UUT.is_online('CALL1'))
+
+    def test_clear(self):
+        self._UUT.mark_online('CALL1')
+        self._UUT.clear()
+        self.assertIsNone(self._UUT.is_online('CALL1'))
+
+class TestPresenceCacheErrorHandling(unittest.TestCase):
+    def test_invalid_ttl(self):
+        self.assertRaises(ValueError, lambda: PresenceCache(timedelta(seconds=-1)))
+
+class TestPresenceCacheRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = PresenceCache(timedelta(seconds=30))
+        self.assertEqual(repr(expected), repr(eval(repr(expected))))
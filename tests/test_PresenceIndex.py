@@ -0,0 +1,53 @@
+from hoppie_connector.Presence import PresenceIndex
+import unittest
+
+class TestPresenceIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = PresenceIndex()
+
+    def test_empty(self):
+        self.assertEqual(0, len(self._UUT))
+        self.assertEqual([], self._UUT.get_stations())
+        self.assertEqual([], self._UUT.get_stations_by_prefix('DLH'))
+
+    def test_initial_snapshot(self):
+        joined, left = self._UUT.update(['DLH2', 'BAW1', 'DLH1'])
+        self.assertEqual(['BAW1', 'DLH1', 'DLH2'], joined)
+        self.assertEqual([], left)
+        self.assertEqual(['BAW1', 'DLH1', 'DLH2'], self._UUT.get_stations())
+
+    def test_diff(self):
+        self._UUT.update(['DLH1', 'DLH2', 'BAW1'])
+        joined, left = self._UUT.update(['DLH2', 'BAW1', 'AFR7', 'DLH3'])
+        self.assertEqual(['AFR7', 'DLH3'], joined)
+        self.assertEqual(['DLH1'], left)
+        self.assertEqual(['AFR7', 'BAW1', 'DLH2', 'DLH3'], self._UUT.get_stations())
+
+    def test_unchanged(self):
+        self._UUT.update(['DLH1'])
+        self.assertEqual(([], []), self._UUT.update(['DLH1']))
+
+    def test_all_left(self):
+        self._UUT.update(['DLH1', 'DLH2'])
+        self.assertEqual(([], ['DLH1', 'DLH2']), self._UUT.update([]))
+        self.assertEqual(0, len(self._UUT))
+
+    def test_membership(self):
+        self._UUT.update(['DLH1', 'BAW1'])
+        self.assertTrue(self._UUT.is_online('DLH1'))
+        self.assertFalse(self._UUT.is_online('DLH2'))
+        self.assertIn('BAW1', self._UUT)
+        self.assertNotIn('AFR1', self._UUT)
+        self.assertEqual(2, len(self._UUT))
+
+    def test_prefix(self):
+        self._UUT.update(['DLH1', 'DLH22', 'DL1', 'BAW1', 'DLHA', 'EDDF_TWR'])
+        self.assertEqual(['DLH1', 'DLH22', 'DLHA'], self._UUT.get_stations_by_prefix('DLH'))
+        self.assertEqual(['DL1', 'DLH1', 'DLH22', 'DLHA'], self._UUT.get_stations_by_prefix('DL'))
+        self.assertEqual(['DLH22'], self._UUT.get_stations_by_prefix('DLH22'))
+        self.assertEqual([], self._UUT.get_stations_by_prefix('AFR'))
+        self.assertEqual(6, len(self._UUT.get_stations_by_prefix('')))
+
+    def test_repr(self):
+        self.assertIsInstance(eval(repr(self._UUT)), PresenceIndex)
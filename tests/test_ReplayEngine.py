@@ -0,0 +1,94 @@
+from hoppie_connector.Journal import JournalReader, JournalRecord, ResponseJournal
+from hoppie_connector.Messages import HoppieMessage, TelexMessage
+from hoppie_connector.Replay import ReplayEngine, ReplayStats
+from datetime import datetime, timedelta, UTC
+import tempfile
+import unittest
+
+_TIMESTAMP = datetime(2024, 4, 3, 12, 0, tzinfo=UTC)
+
+class _FakeClock(object):
+    def __init__(self, step: float = 0.0):
+        self.now = 100.0
+        self.step = step
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def _record(body: str, offset: float = 0.0, request_type: HoppieMessage.MessageType = HoppieMessage.MessageType.POLL) -> JournalRecord:
+    return JournalRecord(_TIMESTAMP + timedelta(seconds=offset), 'CALLSIGN', request_type, body)
+
+class TestReplayEngine(unittest.TestCase):
+    def test_counts(self):
+        records = [
+            _record('ok {OPS telex {HELLO}} {OPS foo {BAR}}'),
+            _record('ok {12 OPS telex {HELLO}} {OPS}', request_type=HoppieMessage.MessageType.PEEK),
+            _record('invalid'),
+            _record('error {illegal logon code}'),
+            _record('ok {OPS ATC}', request_type=HoppieMessage.MessageType.PING),
+        ]
+        stats = ReplayEngine(clock=_FakeClock()).run(records)
+        self.assertEqual(5, stats.get_responses())
+        self.assertEqual(2, stats.get_messages())
+        self.assertEqual(1, stats.get_response_failures())
+        self.assertEqual(1, stats.get_malformed_items())
+        self.assertEqual(1, stats.get_message_failures())
+        self.assertEqual({'telex': 2}, stats.get_type_counts())
+        self.assertEqual({'foo': 1}, stats.get_type_failures())
+
+    def test_timings(self):
+        clock = _FakeClock(step=1.0)
+        stats = ReplayEngine(clock=clock).run([_record('ok {OPS telex {HELLO}} {OPS foo {BAR}}')])
+        self.assertEqual(timedelta(seconds=1), stats.get_response_time())
+        self.assertEqual({'telex': timedelta(seconds=1), 'foo': timedelta(seconds=1)}, stats.get_type_timings())
+        self.assertEqual(timedelta(seconds=7), stats.get_elapsed())
+        self.assertEqual([], clock.sleeps)
+
+    def test_on_message(self):
+        received = []
+        ReplayEngine(clock=_FakeClock()).run([_record('ok {OPS telex {HELLO}}')], on_message=received.append)
+        self.assertEqual([TelexMessage('OPS', 'CALLSIGN', 'HELLO')], received)
+
+    def test_full_speed(self):
+        clock = _FakeClock()
+        ReplayEngine(clock=clock, sleep=clock.sleep).run([_record('ok', 0), _record('ok', 30)])
+        self.assertEqual([], clock.sleeps)
+
+    def test_scaled_speed(self):
+        clock = _FakeClock()
+        stats = ReplayEngine(speed=10.0, clock=clock, sleep=clock.sleep).run([_record('ok', 0), _record('ok', 30), _record('ok', 20), _record('ok', 50)])
+        self.assertEqual([3.0, 2.0], clock.sleeps)
+        self.assertEqual(timedelta(seconds=5), stats.get_elapsed())
+        self.assertEqual(timedelta(0), stats.get_parse_time())
+
+    def test_scaled_speed_behind_schedule(self):
+        clock = _FakeClock(step=1.0)
+        ReplayEngine(speed=1.0, clock=clock, sleep=clock.sleep).run([_record('ok', 0), _record('ok', 0.5)])
+        self.assertEqual([], clock.sleeps)
+
+    def test_invalid_speed(self):
+        with self.assertRaises(ValueError):
+            ReplayEngine(speed=0.0)
+
+    def test_empty(self):
+        self.assertEqual(ReplayStats(0, 0, 0, 0, 0, timedelta(0), {}, {}, {}, timedelta(0)), ReplayEngine(clock=_FakeClock()).run([]))
+
+    def test_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with ResponseJournal(tmp) as journal:
+                journal.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok {OPS telex {HELLO}}')
+                journal.append('OTHER', HoppieMessage.MessageType.POLL, 'ok {OPS telex {HELLO}}')
+            received = []
+            stats = ReplayEngine().run(JournalReader(tmp), on_message=received.append)
+        self.assertEqual(2, stats.get_messages())
+        self.assertEqual(['CALLSIGN', 'OTHER'], [m.get_to_name() for m in received])
+        self.assertGreater(stats.get_messages_per_second(), 0)
+
+    def test_repr(self):
+        self.assertEqual('ReplayEngine(speed=2.0)', repr(ReplayEngine(speed=2.0)))
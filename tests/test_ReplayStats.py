@@ -0,0 +1,54 @@
+from hoppie_connector.Replay import ReplayStats
+from datetime import timedelta
+import datetime
+import unittest
+
+def _stats(messages: int = 3, response_time: timedelta = timedelta(seconds=1)) -> ReplayStats:
+    return ReplayStats(2, messages, 1, 1, 1, response_time, {'telex': 2, 'cpdlc': 1}, {'foo': 1},
+                       {'telex': timedelta(seconds=1), 'cpdlc': timedelta(seconds=0.5), 'foo': timedelta(seconds=0.5)}, timedelta(seconds=10))
+
+class TestReplayStats(unittest.TestCase):
+    def test_get_values(self):
+        UUT = _stats()
+        self.assertEqual(2, UUT.get_responses())
+        self.assertEqual(3, UUT.get_messages())
+        self.assertEqual(1, UUT.get_response_failures())
+        self.assertEqual(1, UUT.get_malformed_items())
+        self.assertEqual(1, UUT.get_message_failures())
+        self.assertEqual(timedelta(seconds=1), UUT.get_response_time())
+        self.assertEqual({'telex': 2, 'cpdlc': 1}, UUT.get_type_counts())
+        self.assertEqual({'foo': 1}, UUT.get_type_failures())
+        self.assertEqual({'telex': timedelta(seconds=1), 'cpdlc': timedelta(seconds=0.5), 'foo': timedelta(seconds=0.5)}, UUT.get_type_timings())
+        self.assertEqual(timedelta(seconds=10), UUT.get_elapsed())
+
+    def test_parse_time(self):
+        self.assertEqual(timedelta(seconds=3), _stats().get_parse_time())
+
+    def test_messages_per_second(self):
+        self.assertAlmostEqual(1.0, _stats().get_messages_per_second())
+
+    def test_messages_per_second_without_parse_time(self):
+        UUT = ReplayStats(0, 0, 0, 0, 0, timedelta(0), {}, {}, {}, timedelta(0))
+        self.assertEqual(0.0, UUT.get_messages_per_second())
+
+    def test_returned_dicts_are_copies(self):
+        UUT = _stats()
+        UUT.get_type_counts().clear()
+        UUT.get_type_failures().clear()
+        UUT.get_type_timings().clear()
+        self.assertEqual(_stats(), UUT)
+
+class TestReplayStatsComparison(unittest.TestCase):
+    def test_equal_content(self):
+        self.assertEqual(_stats(), _stats())
+
+    def test_differing_content(self):
+        self.assertNotEqual(_stats(), _stats(messages=4))
+
+    def test_differing_type(self):
+        self.assertNotEqual(_stats(), None)
+
+class TestReplayStatsRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = _stats()
+        self.assertEqual(expected, eval(repr(expected)))
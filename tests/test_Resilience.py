@@ -0,0 +1,54 @@
+from hoppie_connector.Resilience import CircuitOpenError, HTTPStatusError, get_circuit_breaker, is_transient_error, is_unsent_error
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError
+import requests
+import unittest
+
+def _refused() -> requests.ConnectionError:
+    return requests.ConnectionError(MaxRetryError(None, '/', reason=NewConnectionError(None, 'Connection refused')))
+
+class TestHTTPStatusError(unittest.TestCase):
+    def test_status_code(self):
+        UUT = HTTPStatusError(503, 'Service Unavailable')
+        self.assertIsInstance(UUT, ConnectionError)
+        self.assertEqual(503, UUT.get_status_code())
+        self.assertEqual('Error 503: Service Unavailable', str(UUT))
+
+class TestIsUnsentError(unittest.TestCase):
+    def test_connect_timeout(self):
+        self.assertTrue(is_unsent_error(requests.ConnectTimeout()))
+
+    def test_connection_refused(self):
+        self.assertTrue(is_unsent_error(_refused()))
+
+    def test_circuit_open(self):
+        self.assertTrue(is_unsent_error(CircuitOpenError()))
+
+    def test_connection_reset(self):
+        self.assertFalse(is_unsent_error(requests.ConnectionError(MaxRetryError(None, '/', reason=ConnectionResetError()))))
+        self.assertFalse(is_unsent_error(requests.ConnectionError()))
+
+    def test_read_timeout(self):
+        self.assertFalse(is_unsent_error(requests.ReadTimeout(ReadTimeoutError(None, '/', 'timeout'))))
+
+    def test_status_error(self):
+        self.assertFalse(is_unsent_error(HTTPStatusError(503, 'Service Unavailable')))
+
+class TestIsTransientError(unittest.TestCase):
+    def test_network_errors(self):
+        self.assertTrue(is_transient_error(requests.ConnectTimeout()))
+        self.assertTrue(is_transient_error(requests.ReadTimeout()))
+        self.assertTrue(is_transient_error(_refused()))
+
+    def test_status_errors(self):
+        self.assertTrue(is_transient_error(HTTPStatusError(500, 'Internal Server Error')))
+        self.assertTrue(is_transient_error(HTTPStatusError(429, 'Too Many Requests')))
+        self.assertFalse(is_transient_error(HTTPStatusError(404, 'Not Found')))
+
+    def test_other_errors(self):
+        self.assertFalse(is_transient_error(requests.exceptions.InvalidURL()))
+        self.assertFalse(is_transient_error(ValueError()))
+
+class TestGetCircuitBreaker(unittest.TestCase):
+    def test_shared_per_url(self):
+        self.assertIs(get_circuit_breaker('http://example.com/a'), get_circuit_breaker('http://example.com/a'))
+        self.assertIsNot(get_circuit_breaker('http://example.com/a'), get_circuit_breaker('http://example.com/b'))
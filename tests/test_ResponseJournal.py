@@ -0,0 +1,94 @@
+from hoppie_connector.Journal import JournalReader, JournalRecord, ResponseJournal
+from hoppie_connector.Messages import HoppieMessage
+from datetime import datetime, UTC
+from unittest import mock
+import os
+import tempfile
+import threading
+import unittest
+
+class TestResponseJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self._dir = os.path.join(self._tmp.name, 'journal')
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+        super().tearDown()
+
+    def test_round_trip(self):
+        with ResponseJournal(self._dir, clock=lambda: 1712145600.5) as UUT:
+            UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok {1 OPS telex {HELLO}}')
+            UUT.append('CALLSIGN', HoppieMessage.MessageType.PING, 'ok', datetime(2024, 4, 3, 13, 0, tzinfo=UTC))
+        expected = [
+            JournalRecord(datetime(2024, 4, 3, 12, 0, 0, 500000, tzinfo=UTC), 'CALLSIGN', HoppieMessage.MessageType.POLL, 'ok {1 OPS telex {HELLO}}'),
+            JournalRecord(datetime(2024, 4, 3, 13, 0, tzinfo=UTC), 'CALLSIGN', HoppieMessage.MessageType.PING, 'ok'),
+        ]
+        self.assertEqual(expected, list(JournalReader(self._dir)))
+
+    def test_lazy_segment(self):
+        ResponseJournal(self._dir).close()
+        self.assertEqual([], JournalReader(self._dir).get_segments())
+
+    def test_segment_rollover(self):
+        with ResponseJournal(self._dir, segment_size=100) as UUT:
+            for i in range(5):
+                UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok ' + 'X' * 60 + str(i))
+        self.assertEqual(5, len(JournalReader(self._dir).get_segments()))
+        self.assertEqual([str(i) for i in range(5)], [r.get_body()[-1] for r in JournalReader(self._dir)])
+
+    def test_reopen_starts_new_segment(self):
+        for body in ['ok 1', 'ok 2']:
+            with ResponseJournal(self._dir) as UUT:
+                UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, body)
+        self.assertEqual(['journal-00000000.seg', 'journal-00000001.seg'], [os.path.basename(p) for p in JournalReader(self._dir).get_segments()])
+        self.assertEqual(['ok 1', 'ok 2'], [r.get_body() for r in JournalReader(self._dir)])
+
+    def test_shared_directory(self):
+        UUT1 = ResponseJournal(self._dir)
+        UUT2 = ResponseJournal(self._dir)
+        UUT1.append('CALLSIGN1', HoppieMessage.MessageType.POLL, 'ok 1')
+        UUT2.append('CALLSIGN2', HoppieMessage.MessageType.POLL, 'ok 2')
+        UUT1.close()
+        UUT1.append('CALLSIGN1', HoppieMessage.MessageType.POLL, 'ok 3')
+        UUT1.close()
+        UUT2.close()
+        self.assertEqual(['journal-00000000.seg', 'journal-00000001.seg', 'journal-00000002.seg'], [os.path.basename(p) for p in JournalReader(self._dir).get_segments()])
+        self.assertEqual(['ok 1', 'ok 2', 'ok 3'], [r.get_body() for r in JournalReader(self._dir)])
+
+    def test_close_and_reuse(self):
+        UUT = ResponseJournal(self._dir)
+        UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok 1')
+        UUT.close()
+        UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok 2')
+        UUT.close()
+        self.assertEqual(2, len(JournalReader(self._dir).get_segments()))
+
+    def test_fsync(self):
+        with mock.patch('os.fsync') as fsync:
+            with ResponseJournal(self._dir, fsync=True) as UUT:
+                UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, 'ok')
+        fsync.assert_called_once()
+
+    def test_concurrent_appends(self):
+        with ResponseJournal(self._dir, segment_size=1000) as UUT:
+            def _append(n: int) -> None:
+                for i in range(50):
+                    UUT.append('CALLSIGN', HoppieMessage.MessageType.POLL, f"ok {n} {i}")
+            threads = [threading.Thread(target=_append, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(200, len(list(JournalReader(self._dir))))
+
+class TestResponseJournalErrorHandling(unittest.TestCase):
+    def test_invalid_segment_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertRaises(ValueError, lambda: ResponseJournal(tmp, segment_size=0))
+
+class TestResponseJournalRepresentation(unittest.TestCase):
+    def test_repr(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(f"ResponseJournal(directory={tmp!r}, segment_size=1024, fsync=True)", repr(ResponseJournal(tmp, 1024, True)))
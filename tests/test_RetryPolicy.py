@@ -0,0 +1,60 @@
+from hoppie_connector.Resilience import CircuitOpenError, HTTPStatusError, RetryPolicy
+from hoppie_connector.Messages import HoppieMessage
+from datetime import timedelta
+import datetime
+import requests
+import unittest
+
+class TestRetryPolicyDelay(unittest.TestCase):
+    def test_exponential(self):
+        UUT = RetryPolicy(backoff=timedelta(seconds=1), max_backoff=timedelta(seconds=5), jitter=False)
+        self.assertEqual([1, 2, 4, 5, 5], [UUT.get_delay(a).total_seconds() for a in range(1, 6)])
+
+    def test_jitter(self):
+        UUT = RetryPolicy(backoff=timedelta(seconds=2), rng=lambda: 0.25)
+        self.assertEqual(timedelta(seconds=0.5), UUT.get_delay(1))
+        self.assertEqual(timedelta(seconds=1), UUT.get_delay(2))
+
+    def test_wait(self):
+        sleeps = []
+        RetryPolicy(backoff=timedelta(seconds=2), jitter=False, sleep=sleeps.append).wait(2)
+        self.assertEqual([4.0], sleeps)
+
+class TestRetryPolicyDecision(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = RetryPolicy(max_attempts=3)
+
+    def test_max_attempts(self):
+        self.assertEqual(3, self._UUT.get_max_attempts())
+        self.assertTrue(self._UUT.should_retry(HoppieMessage.MessageType.PEEK, 2, requests.ReadTimeout()))
+        self.assertFalse(self._UUT.should_retry(HoppieMessage.MessageType.PEEK, 3, requests.ReadTimeout()))
+
+    def test_idempotent(self):
+        for t in [HoppieMessage.MessageType.PEEK, HoppieMessage.MessageType.PING]:
+            self.assertTrue(self._UUT.should_retry(t, 1, requests.ReadTimeout()))
+            self.assertTrue(self._UUT.should_retry(t, 1, HTTPStatusError(503, 'Service Unavailable')))
+            self.assertFalse(self._UUT.should_retry(t, 1, HTTPStatusError(404, 'Not Found')))
+
+    def test_non_idempotent(self):
+        for t in [HoppieMessage.MessageType.POLL, HoppieMessage.MessageType.TELEX, HoppieMessage.MessageType.CPDLC]:
+            self.assertTrue(self._UUT.should_retry(t, 1, requests.ConnectTimeout()))
+            self.assertFalse(self._UUT.should_retry(t, 1, requests.ReadTimeout()))
+            self.assertFalse(self._UUT.should_retry(t, 1, HTTPStatusError(503, 'Service Unavailable')))
+
+    def test_circuit_open(self):
+        self.assertFalse(self._UUT.should_retry(HoppieMessage.MessageType.PEEK, 1, CircuitOpenError()))
+
+class TestRetryPolicyErrorHandling(unittest.TestCase):
+    def test_invalid_attempts(self):
+        self.assertRaises(ValueError, lambda: RetryPolicy(max_attempts=0))
+
+    def test_invalid_backoff(self):
+        self.assertRaises(ValueError, lambda: RetryPolicy(backoff=timedelta(seconds=-1)))
+        self.assertRaises(ValueError, lambda: RetryPolicy(backoff=timedelta(seconds=10), max_backoff=timedelta(seconds=5)))
+
+class TestRetryPolicyRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = RetryPolicy(max_attempts=5, backoff=timedelta(seconds=2), max_backoff=timedelta(seconds=8), jitter=False)
+        actual = eval(repr(expected))
+        self.assertEqual(repr(expected), repr(actual))
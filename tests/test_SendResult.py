@@ -0,0 +1,48 @@
+from hoppie_connector.API import SendResult
+from hoppie_connector.Messages import TelexMessage
+from hoppie_connector.Responses import ErrorResponse, SuccessResponse
+from datetime import timedelta
+import datetime
+import unittest
+
+class TestSendResult(unittest.TestCase):
+    def test_success(self):
+        msg = TelexMessage('OPS', 'CALLSIGN', 'MESSAGE')
+        UUT = SendResult(msg, SuccessResponse(), timedelta(seconds=1))
+        self.assertEqual(msg, UUT.get_message())
+        self.assertEqual(SuccessResponse(), UUT.get_response())
+        self.assertEqual(timedelta(seconds=1), UUT.get_delay())
+        self.assertIsNone(UUT.get_error())
+        self.assertTrue(UUT.is_ok())
+
+    def test_failure(self):
+        error = ConnectionError('Error 404: Not Found')
+        UUT = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), None, None, error)
+        self.assertIsNone(UUT.get_response())
+        self.assertIsNone(UUT.get_delay())
+        self.assertIs(error, UUT.get_error())
+        self.assertFalse(UUT.is_ok())
+
+    def test_error_response(self):
+        UUT = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), ErrorResponse('illegal logon code'), timedelta(seconds=1))
+        self.assertIsNone(UUT.get_error())
+        self.assertFalse(UUT.is_ok())
+
+class TestSendResultComparison(unittest.TestCase):
+    def test_equal_content(self):
+        value1 = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), SuccessResponse(), timedelta(seconds=1))
+        value2 = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), SuccessResponse(), timedelta(seconds=1))
+        self.assertEqual(value1, value2)
+
+    def test_differing_delay(self):
+        value1 = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), SuccessResponse(), timedelta(seconds=1))
+        value2 = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), SuccessResponse(), timedelta(seconds=2))
+        self.assertNotEqual(value1, value2)
+
+    def test_differing_type(self):
+        self.assertNotEqual(SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), None, None), None)
+
+class TestSendResultRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = SendResult(TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'), SuccessResponse(), timedelta(seconds=1))
+        self.assertEqual(expected, eval(repr(expected)))
@@ -38,3 +38,12 @@ class TestTelexMessageFromPacket(unittest.TestCase):
 
     def test_oversize_content(self):
         self.assertRaises(ValueError, lambda: TelexMessage.from_packet('CALLSIGN', 'OPS', 221*'a'))
+
+class TestTelexMessagePacketCache(unittest.TestCase):
+    def test_encoded_once(self):
+        msg = TelexMessage('CALLSIGN', 'OPS', 'hello')
+        self.assertIs(msg.get_packet_content(), msg.get_packet_content())
+
+    def test_hash_uses_packet(self):
+        self.assertEqual(hash(TelexMessage('CALLSIGN', 'OPS', 'hello')), hash(TelexMessage('CALLSIGN', 'OPS', 'HELLO')))
+        self.assertEqual(1, len({TelexMessage('CALLSIGN', 'OPS', 'hello'), TelexMessage('CALLSIGN', 'OPS', 'HELLO')}))
@@ -0,0 +1,26 @@
+from hoppie_connector.Timing import TimedMessageParser, TimingStage
+from hoppie_connector.Messages import HoppieMessageParser, TelexMessage
+import unittest
+
+class TestTimedMessageParser(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._events = []
+        self._UUT = TimedMessageParser('OPS', self._events.append)
+
+    def test_parse(self):
+        actual = self._UUT.parse({'from': 'CALLSIGN', 'type': 'telex', 'packet': 'MESSAGE'})
+        self.assertEqual(TelexMessage('CALLSIGN', 'OPS', 'MESSAGE'), actual)
+        self.assertEqual(1, len(self._events))
+        self.assertEqual(TimingStage.PARSE_MESSAGE, self._events[0].get_stage())
+        self.assertIs(actual, self._events[0].get_message())
+
+    def test_parse_error(self):
+        self.assertRaises(ValueError, lambda: self._UUT.parse({'from': 'CALLSIGN', 'type': 'invalid', 'packet': ''}))
+        self.assertEqual([], self._events)
+
+    def test_equal_to_plain_parser(self):
+        self.assertEqual(HoppieMessageParser('OPS'), self._UUT)
+
+    def test_repr(self):
+        self.assertEqual("TimedMessageParser(station='OPS')", repr(self._UUT))
@@ -0,0 +1,35 @@
+from hoppie_connector.Timing import TimingEvent, TimingStage
+from hoppie_connector.Messages import TelexMessage
+from datetime import timedelta
+import datetime
+import unittest
+
+class TestTimingEvent(unittest.TestCase):
+    def test_get_values(self):
+        msg = TelexMessage('OPS', 'CALLSIGN', 'MESSAGE')
+        UUT = TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5), msg)
+        self.assertEqual(TimingStage.HTTP, UUT.get_stage())
+        self.assertEqual(timedelta(milliseconds=5), UUT.get_duration())
+        self.assertEqual(msg, UUT.get_message())
+
+    def test_no_message(self):
+        self.assertIsNone(TimingEvent(TimingStage.DECODE, timedelta(0)).get_message())
+
+class TestTimingEventComparison(unittest.TestCase):
+    def test_equal_content(self):
+        value1 = TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5))
+        value2 = TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5))
+        self.assertEqual(value1, value2)
+
+    def test_differing_stage(self):
+        value1 = TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5))
+        value2 = TimingEvent(TimingStage.TTFB, timedelta(milliseconds=5))
+        self.assertNotEqual(value1, value2)
+
+    def test_differing_type(self):
+        self.assertNotEqual(TimingEvent(TimingStage.HTTP, timedelta(0)), None)
+
+class TestTimingEventRepresentation(unittest.TestCase):
+    def test_repr(self):
+        expected = TimingEvent(TimingStage.PARSE_MESSAGE, timedelta(microseconds=20), TelexMessage('OPS', 'CALLSIGN', 'MESSAGE'))
+        self.assertEqual(expected, eval(repr(expected)))
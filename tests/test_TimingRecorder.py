@@ -0,0 +1,40 @@
+from hoppie_connector.Timing import TimingEvent, TimingRecorder, TimingStage, timed
+from datetime import timedelta
+import unittest
+
+class TestTimingRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._UUT = TimingRecorder()
+
+    def test_accumulate(self):
+        self._UUT(TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5)))
+        self._UUT(TimingEvent(TimingStage.HTTP, timedelta(milliseconds=7)))
+        self._UUT(TimingEvent(TimingStage.DECODE, timedelta(microseconds=3)))
+        self.assertEqual({TimingStage.HTTP: timedelta(milliseconds=12), TimingStage.DECODE: timedelta(microseconds=3)}, self._UUT.get_totals())
+        self.assertEqual({TimingStage.HTTP: 2, TimingStage.DECODE: 1}, self._UUT.get_counts())
+
+    def test_reset(self):
+        self._UUT(TimingEvent(TimingStage.HTTP, timedelta(milliseconds=5)))
+        self._UUT.reset()
+        self.assertEqual({}, self._UUT.get_totals())
+        self.assertEqual({}, self._UUT.get_counts())
+
+    def test_timed(self):
+        with timed(self._UUT, TimingStage.ENCODE):
+            pass
+        self.assertEqual({TimingStage.ENCODE: 1}, self._UUT.get_counts())
+        self.assertGreaterEqual(self._UUT.get_totals()[TimingStage.ENCODE], timedelta(0))
+
+    def test_timed_exception(self):
+        with self.assertRaises(ValueError):
+            with timed(self._UUT, TimingStage.ENCODE):
+                raise ValueError()
+        self.assertEqual({TimingStage.ENCODE: 1}, self._UUT.get_counts())
+
+    def test_timed_without_hook(self):
+        with timed(None, TimingStage.ENCODE):
+            pass
+
+    def test_repr(self):
+        self.assertIsInstance(eval(repr(self._UUT)), TimingRecorder)